@@ -0,0 +1,51 @@
+"""
+Compare per-search sessions against one shared session over N sequential searches.
+
+Run from the repository root:
+    python -m benchmarks.connection_reuse --searches 100
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from src.gitcrawler.crawler import GitHubCrawler
+
+from benchmarks.mock_github import MockGitHub
+
+
+async def run_searches(crawler: GitHubCrawler, searches: int) -> float:
+    started = time.perf_counter()
+    for i in range(searches):
+        await crawler.search([f"keyword{i}"], "issues")
+    return time.perf_counter() - started
+
+
+async def main(searches: int, output_dir: str):
+    async with MockGitHub() as github:
+        base_url = github.url
+        crawler = GitHubCrawler(output_dir=output_dir, base_url=base_url)
+        per_search = await run_searches(crawler, searches)
+        per_search_connections = len(github.connections)
+
+        github.reset()
+        async with GitHubCrawler(output_dir=output_dir, base_url=base_url) as crawler:
+            shared = await run_searches(crawler, searches)
+        shared_connections = len(github.connections)
+
+    print(f"{searches} sequential searches against {base_url}")
+    print(f"  session per search: {per_search:.3f}s, {per_search_connections} connections")
+    print(f"  shared session:     {shared:.3f}s, {shared_connections} connections")
+    print(f"  saved:              {per_search - shared:.3f}s ({(1 - shared / per_search) * 100:.1f}%)")
+    print("Local plain HTTP only measures TCP and session setup, TLS handshakes to github.com add more per connection")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--searches", type=int, default=100)
+    parser.add_argument("--output-dir", default="results")
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    asyncio.run(main(args.searches, args.output_dir))
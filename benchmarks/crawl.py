@@ -0,0 +1,139 @@
+"""
+End-to-end GitHubCrawler.crawl benchmark against a local mock GitHub and mock proxies.
+Reports throughput, p50/p95/p99 fetch latency, bytes transferred and request amplification.
+
+Run from the repository root:
+    python -m benchmarks.crawl --pages 5 --results 20 --proxies 4 --proxy-latency 0.05 --proxy-failure-rate 0.1
+"""
+
+import argparse
+import asyncio
+import logging
+import tempfile
+import time
+
+from src.gitcrawler.crawler import GitHubCrawler
+
+from benchmarks.mock_github import MockGitHub, MockProxy
+
+
+class MeasuredCrawler(GitHubCrawler):
+    """Crawler recording how long every page fetch takes, retries and hedging included"""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.latencies = {"search": [], "repository": []}
+
+    async def _fetch_page(self, url, reader=None):
+        started = time.perf_counter()
+        try:
+            return await super()._fetch_page(url, reader)
+        finally:
+            kind = "search" if url.startswith(f"{self.base_url}search?") else "repository"
+            self.latencies[kind].append(time.perf_counter() - started)
+
+
+def percentiles(samples: list[float], quantiles=(0.5, 0.95, 0.99)) -> list[float]:
+    """Nearest-rank percentiles of samples"""
+    if not samples:
+        return [0.0 for _ in quantiles]
+    ordered = sorted(samples)
+    return [ordered[min(len(ordered) - 1, max(0, round(q * len(ordered)) - 1))] for q in quantiles]
+
+
+def format_latency(name: str, samples: list[float]) -> str:
+    p50, p95, p99 = (value * 1000 for value in percentiles(samples))
+    return f"  {name:<11} {len(samples):6d} fetches, p50 {p50:8.1f} ms, p95 {p95:8.1f} ms, p99 {p99:8.1f} ms"
+
+
+def format_server(name: str, server) -> str:
+    statuses = ", ".join(f"{status}: {count}" for status, count in sorted(server.statuses.items()))
+    return (
+        f"  {name:<11} {server.requests:6d} requests, {server.bytes_sent / 1024 / 1024:8.2f} MB, "
+        f"{len(server.connections)} connections, statuses {{{statuses}}}"
+    )
+
+
+async def run(args: argparse.Namespace, github: MockGitHub, proxies: list[MockProxy], output_dir: str):
+    github.reset()
+    for proxy in proxies:
+        proxy.reset()
+
+    crawler = MeasuredCrawler(output_dir=output_dir, base_url=github.url, hedge_requests=not args.no_hedge)
+    config = {
+        "keywords": ["python"],
+        "type": "repositories",
+        "max_pages": args.pages,
+        "proxies": [proxy.address for proxy in proxies],
+        "format": args.format,
+    }
+
+    started = time.perf_counter()
+    results = await crawler.crawl(config)
+    elapsed = time.perf_counter() - started
+
+    enriched = sum(1 for result in results if result.extra)
+    requests = github.requests + sum(proxy.requests for proxy in proxies)
+    print(
+        f"{len(results)} results ({enriched} enriched) in {elapsed:.2f}s: "
+        f"{len(results) / elapsed:.1f} results/s, {requests / elapsed:.1f} requests/s, "
+        f"{crawler.fetch_stats.amplification:.2f} attempts per URL"
+    )
+    print(format_latency("search", crawler.latencies["search"]))
+    print(format_latency("repository", crawler.latencies["repository"]))
+    print(format_latency("all", crawler.latencies["search"] + crawler.latencies["repository"]))
+    print(format_server("origin", github))
+    for number, proxy in enumerate(proxies):
+        print(format_server(f"proxy {number}", proxy))
+
+
+async def main(args: argparse.Namespace):
+    github = MockGitHub(
+        results_per_page=args.results,
+        pages=args.pages,
+        repository_kb=args.repository_kb,
+        latency=args.latency,
+        rate_limit_rate=args.rate_limit_rate,
+    )
+    proxies = [
+        MockProxy(
+            latency=args.proxy_latency,
+            failure_rate=args.proxy_failure_rate,
+            rate_limit_rate=args.proxy_rate_limit_rate,
+            seed=number,
+        )
+        for number in range(args.proxies)
+    ]
+
+    await github.start()
+    for proxy in proxies:
+        await proxy.start()
+    try:
+        with tempfile.TemporaryDirectory() as output_dir:
+            for number in range(args.runs):
+                print(f"Run {number + 1}/{args.runs}: ", end="")
+                await run(args, github, proxies, output_dir)
+    finally:
+        for proxy in proxies:
+            await proxy.stop()
+        await github.stop()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=3, help="search pages with results")
+    parser.add_argument("--results", type=int, default=10, help="results per search page")
+    parser.add_argument("--repository-kb", type=int, default=300, help="repository page padding")
+    parser.add_argument("--latency", type=float, default=0.0, help="origin latency, seconds")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="share of origin 429 responses")
+    parser.add_argument("--proxies", type=int, default=0)
+    parser.add_argument("--proxy-latency", type=float, default=0.0, help="seconds")
+    parser.add_argument("--proxy-failure-rate", type=float, default=0.0, help="share of proxy 502 responses")
+    parser.add_argument("--proxy-rate-limit-rate", type=float, default=0.0, help="share of proxy 429 responses")
+    parser.add_argument("--no-hedge", action="store_true", help="race all proxies instead of hedging")
+    parser.add_argument("--format", default="csv")
+    parser.add_argument("--runs", type=int, default=1)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    asyncio.run(main(args))
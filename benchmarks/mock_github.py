@@ -0,0 +1,176 @@
+"""
+Local mock GitHub and mock forward proxies for offline benchmarks and end-to-end tests
+"""
+
+import asyncio
+import random
+from abc import ABC, abstractmethod
+from collections import Counter
+
+import aiohttp
+from aiohttp import web
+
+from benchmarks.pages import build_repository_page, build_search_page
+
+
+class MockServer(ABC):
+    """Local aiohttp server counting requests, status codes, bytes and client connections"""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.bytes_sent = 0
+        self.statuses = Counter()
+        self.connections = set()
+        self.url = None
+        self._runner = None
+
+    @abstractmethod
+    def _app(self) -> web.Application: ...
+
+    async def start(self) -> str:
+        """Start server on a free local port, returns its base URL"""
+        self._runner = web.AppRunner(self._app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/"
+        return self.url
+
+    async def stop(self):
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def reset(self):
+        self.requests = 0
+        self.bytes_sent = 0
+        self.statuses.clear()
+        self.connections.clear()
+
+    def _respond(self, request: web.Request, status: int = 200, body: bytes = b"", headers=None) -> web.Response:
+        self.requests += 1
+        self.bytes_sent += len(body)
+        self.statuses[status] += 1
+        # transport is gone when the client disconnected, e.g. a cancelled hedge loser
+        if request.transport is not None:
+            self.connections.add(request.transport.get_extra_info("peername"))
+        return web.Response(status=status, body=body, headers=headers, content_type="text/html")
+
+    async def __aenter__(self) -> "MockServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.stop()
+
+
+class MockGitHub(MockServer):
+    """
+    Serves search pages with embedded react-app.embeddedData JSON and repository pages with language spans.
+    Pages past `pages` are empty, `rate_limit_rate` of requests get 429 with Retry-After
+    """
+
+    def __init__(
+        self,
+        results_per_page: int = 10,
+        pages: int = 1,
+        languages: int = 5,
+        repository_kb: int = 300,
+        latency: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: int = 1,
+        seed: int = 0,
+    ) -> None:
+        super().__init__()
+        self.pages = pages
+        self.latency = latency
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self._random = random.Random(seed)
+        self._search_pages = {
+            page: build_search_page(results=results_per_page, page=page).encode() for page in range(1, pages + 1)
+        }
+        self._empty_search_page = build_search_page(results=0).encode()
+        self._repository_page = build_repository_page(languages=languages, padding_kb=repository_kb).encode()
+
+    def _app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/search", self.search)
+        app.router.add_get("/{owner}/{repo}", self.repository)
+        return app
+
+    async def _delay(self, request: web.Request) -> web.Response | None:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if self.rate_limit_rate and self._random.random() < self.rate_limit_rate:
+            return self._respond(request, 429, headers={"Retry-After": str(self.retry_after)})
+        return None
+
+    async def search(self, request: web.Request) -> web.Response:
+        if response := await self._delay(request):
+            return response
+        page = int(request.query.get("p", 1))
+        return self._respond(request, body=self._search_pages.get(page, self._empty_search_page))
+
+    async def repository(self, request: web.Request) -> web.Response:
+        if response := await self._delay(request):
+            return response
+        return self._respond(request, body=self._repository_page)
+
+
+class MockProxy(MockServer):
+    """
+    Forward HTTP proxy with added latency, `failure_rate` of requests answered with 502
+    and `rate_limit_rate` with 429, the rest is forwarded to the requested URL
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        failure_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: int = 1,
+        seed: int = 0,
+    ) -> None:
+        super().__init__()
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self._random = random.Random(seed)
+        self._session = None
+
+    @property
+    def address(self) -> str:
+        """Proxy address in the form accepted by ProxyConfig.from_string"""
+        return self.url.removeprefix("http://").rstrip("/")
+
+    def _app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_route("GET", "/{tail:.*}", self.forward)
+        return app
+
+    async def start(self) -> str:
+        self._session = aiohttp.ClientSession(auto_decompress=False)
+        return await super().start()
+
+    async def stop(self):
+        await super().stop()
+        if self._session:
+            await self._session.close()
+            self._session = None
+
+    async def forward(self, request: web.Request) -> web.Response:
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        roll = self._random.random()
+        if roll < self.failure_rate:
+            return self._respond(request, 502)
+        if roll < self.failure_rate + self.rate_limit_rate:
+            return self._respond(request, 429, headers={"Retry-After": str(self.retry_after)})
+
+        async with self._session.get(str(request.url), headers={"Accept-Encoding": "identity"}) as response:
+            body = await response.read()
+            headers = {name: value for name, value in response.headers.items() if name.lower() == "retry-after"}
+            return self._respond(request, response.status, body, headers)
@@ -0,0 +1,60 @@
+"""
+Synthetic GitHub pages shaped like the real ones the crawler parses
+"""
+
+import json
+
+LANGUAGES = ("Python", "JavaScript", "TypeScript", "Go", "Rust", "Shell", "HTML", "Dockerfile")
+
+
+def build_search_payload(results: int = 10, page: int = 1) -> dict:
+    """Embedded search JSON with repository results"""
+    offset = (page - 1) * results
+    return {
+        "payload": {
+            "results": [
+                {
+                    "repo": {
+                        "repository": {"owner_login": f"owner{i}", "name": f"repo{i}", "updated_at": "2024-01-01"}
+                    },
+                    "number": i,
+                    "path": f"page{i}",
+                    "language": LANGUAGES[i % len(LANGUAGES)],
+                    "followers": i * 10,
+                }
+                for i in range(offset, offset + results)
+            ]
+        }
+    }
+
+
+def build_search_page(results: int = 10, page: int = 1, padding_kb: int = 0) -> str:
+    """Search page with embedded JSON the crawler can parse"""
+    padding = "<div class='Box-row'>" + "x" * 1000 + "</div>"
+    return (
+        "<html><head><title>Search</title></head><body>"
+        + padding * padding_kb
+        + '<script type="application/json" data-target="react-app.embeddedData">'
+        + json.dumps(build_search_payload(results, page))
+        + "</script></body></html>"
+    )
+
+
+def build_repository_page(languages: int = 5, padding_kb: int = 300) -> str:
+    """Repository page with language stats near the end, like on GitHub"""
+    padding = "<div class='Box-row'><span>file.py</span><span>commit message</span>" + "x" * 930 + "</div>"
+    share = round(100 / max(languages, 1), 1)
+    language_items = "".join(
+        f'<li><a><span class="color-fg-default text-bold mr-1">{LANGUAGES[i % len(LANGUAGES)]}</span>'
+        f"<span>{share}%</span></a></li>"
+        for i in range(languages)
+    )
+    return (
+        "<html><head><title>Repository</title></head><body><main>"
+        + padding * padding_kb
+        + '<div class="BorderGrid-cell"><h2>Languages</h2><ul class="list-style-none">'
+        + language_items
+        + "</ul></div>"
+        + padding * (padding_kb // 10)
+        + "</main></body></html>"
+    )
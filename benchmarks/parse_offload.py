@@ -0,0 +1,85 @@
+"""
+Measure event-loop lag and throughput while parsing repository pages
+inline, in a thread pool and in a process pool.
+
+Run from the repository root:
+    python -m benchmarks.parse_offload --pages 200 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import time
+
+from src.gitcrawler.crawler import GitHubCrawler
+from src.gitcrawler.parsers import parse_language_stats
+
+from benchmarks.pages import build_repository_page
+
+TICK = 0.005
+
+
+async def measure_lag(stop: asyncio.Event, lags: list[float]):
+    """Record how late the loop wakes up a sleeping task"""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        started = loop.time()
+        await asyncio.sleep(TICK)
+        lags.append(loop.time() - started - TICK)
+
+
+async def run(executor: str | None, page: str, pages: int, concurrency: int, workers: int | None) -> dict:
+    crawler = GitHubCrawler(parse_executor=executor, parse_workers=workers)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def parse_one():
+        async with semaphore:
+            return await crawler._run_parser(parse_language_stats, page)
+
+    # warm up pool workers outside of measurement
+    await parse_one()
+
+    stop = asyncio.Event()
+    lags = []
+    ticker = asyncio.create_task(measure_lag(stop, lags))
+    started = time.perf_counter()
+    await asyncio.gather(*(parse_one() for _ in range(pages)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await ticker
+    crawler.shutdown_parse_executor()
+
+    lags.sort()
+    return {
+        "executor": executor or "inline",
+        "pages/s": pages / elapsed,
+        "lag p50 ms": statistics.median(lags) * 1000 if lags else 0.0,
+        "lag p99 ms": lags[int(len(lags) * 0.99) - 1] * 1000 if lags else 0.0,
+        "lag max ms": lags[-1] * 1000 if lags else 0.0,
+    }
+
+
+async def main(pages: int, concurrency: int, page_kb: int, workers: int | None):
+    page = build_repository_page(padding_kb=page_kb)
+    print(f"Parsing {pages} repository pages of {len(page) // 1024} KB, concurrency {concurrency}")
+    for executor in (None, "thread", "process"):
+        stats = await run(executor, page, pages, concurrency, workers)
+        print(
+            "  "
+            + ", ".join(
+                f"{key}: {value:.1f}" if isinstance(value, float) else str(value) for key, value in stats.items()
+            )
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--page-kb", type=int, default=300)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    asyncio.run(main(args.pages, args.concurrency, args.page_kb, args.workers))
@@ -0,0 +1,92 @@
+"""
+Memory and throughput of result representations: pydantic SearchResult with RepositoryInfo dumped into `extra`
+vs slotted ResultRecord with language stats as parallel arrays. Language stats are rebuilt for every result,
+like the parser does, so both paths pay for fresh strings and dicts.
+
+Run from the repository root:
+    python -m benchmarks.records --results 1000000
+"""
+
+import argparse
+import gc
+import logging
+import random
+import time
+import tracemalloc
+
+from src.gitcrawler.models import RepositoryInfo, SearchResult
+from src.gitcrawler.records import RepositoryRecord, ResultRecord
+
+LANGUAGES = ["Python", "JavaScript", "TypeScript", "Go", "Rust", "Shell", "C++", "HTML", "CSS", "Dockerfile"]
+
+
+def parsed_results(count: int, seed: int = 0):
+    """Yield (url, owner, language_stats) as the repository parser would produce them"""
+    rng = random.Random(seed)
+    for number in range(count):
+        languages = rng.sample(LANGUAGES, rng.randint(1, 5))
+        share = round(100 / len(languages), 1)
+        # encode/decode gives every result its own string objects, as lxml does
+        yield (
+            f"https://github.com/owner{number}/repo{number}",
+            f"owner{number}",
+            {language.encode().decode(): share for language in languages},
+        )
+
+
+def build_models(count: int) -> list[SearchResult]:
+    return [
+        SearchResult(url=url, extra=RepositoryInfo(owner=owner, language_stats=stats).model_dump())
+        for url, owner, stats in parsed_results(count)
+    ]
+
+
+def build_records(count: int) -> list[ResultRecord]:
+    return [ResultRecord(url, RepositoryRecord.from_stats(owner, stats)) for url, owner, stats in parsed_results(count)]
+
+
+def measure(name: str, build, count: int):
+    gc.collect()
+    started = time.perf_counter()
+    results = build(count)
+    elapsed = time.perf_counter() - started
+    del results
+
+    gc.collect()
+    tracemalloc.start()
+    results = build(count)
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(
+        f"  {name:<8} {count / elapsed:12,.0f} results/s, retained {retained / 1024 / 1024:8.1f} MB "
+        f"({retained / count:6.0f} B/result), peak {peak / 1024 / 1024:8.1f} MB"
+    )
+    return results
+
+
+def main(count: int):
+    print(f"{count:,} repository results")
+    baseline = parsed_results(count)
+    started = time.perf_counter()
+    for _ in baseline:
+        pass
+    print(f"  {'input':<8} {count / (time.perf_counter() - started):12,.0f} results/s (generating parser output only)")
+
+    measure("pydantic", build_models, count)
+    records = measure("records", build_records, count)
+
+    started = time.perf_counter()
+    for record in records:
+        record.to_model()
+    elapsed = time.perf_counter() - started
+    print(f"  {'to_model':<8} {count / elapsed:12,.0f} results/s (building models from records at the API boundary)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--results", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    main(args.results)
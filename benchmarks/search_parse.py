@@ -0,0 +1,54 @@
+"""
+Micro-benchmark of embedded search JSON extraction: DOM-free slicing vs lxml + XPath.
+Peak allocation counts Python allocations only, the lxml tree is allocated in C and not included.
+
+Run from the repository root:
+    python -m benchmarks.search_parse --iterations 200
+"""
+
+import argparse
+import logging
+import time
+import tracemalloc
+
+from src.gitcrawler.parsers import extract_embedded_json, extract_embedded_json_xpath
+
+from benchmarks.pages import build_search_page
+
+
+def measure(name: str, extractor, page, iterations: int):
+    assert extractor(page) is not None, f"{name} found no JSON"
+
+    started = time.perf_counter()
+    for _ in range(iterations):
+        extractor(page)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    extractor(page)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"  {name:<14} {elapsed / iterations * 1e6:10.1f} us/page, peak alloc {peak / 1024:8.1f} KB")
+
+
+def main(iterations: int, padding_kb: int, results: int):
+    page = build_search_page(results=results, padding_kb=padding_kb)
+    page_bytes = page.encode()
+    print(f"Search page of {len(page_bytes) // 1024} KB with {results} results, {iterations} iterations")
+
+    measure("xpath (str)", extract_embedded_json_xpath, page, iterations)
+    measure("xpath (bytes)", extract_embedded_json_xpath, page_bytes, iterations)
+    measure("slice (str)", extract_embedded_json, page, iterations)
+    measure("slice (bytes)", extract_embedded_json, page_bytes, iterations)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--padding-kb", type=int, default=200, help="markup before the embedded JSON")
+    parser.add_argument("--results", type=int, default=10)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    main(args.iterations, args.padding_kb, args.results)
@@ -0,0 +1,51 @@
+"""
+Aggregate request traces written with TRACE_PATH: phase percentiles per page type and proxy.
+
+Run from the repository root:
+    python -m benchmarks.traces .cache/traces.jsonl
+"""
+
+import argparse
+import json
+from collections import defaultdict
+
+from benchmarks.crawl import percentiles
+
+PHASES = ("queued", "dns", "connect", "ttfb", "body", "total")
+
+
+def load_traces(path: str) -> list[dict]:
+    with open(path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def summarize(traces: list[dict]) -> dict[tuple[str, str], dict[str, list[float]]]:
+    """Phase durations grouped by (page type, proxy)"""
+    groups = defaultdict(lambda: defaultdict(list))
+    for trace in traces:
+        group = groups[(trace["kind"], trace["proxy"] or "direct")]
+        group["requests"].append(1)
+        if trace["error"] or trace["status"] != 200:
+            group["failed"].append(1)
+        for phase in PHASES:
+            if trace[phase] is not None:
+                group[phase].append(trace[phase])
+    return groups
+
+
+def main(path: str):
+    traces = load_traces(path)
+    print(f"{len(traces)} requests in {path}")
+    for (kind, proxy), group in sorted(summarize(traces).items()):
+        print(f"{kind} via {proxy}: {len(group['requests'])} requests, {len(group['failed'])} failed")
+        for phase in PHASES:
+            if samples := group.get(phase):
+                p50, p95, p99 = (value * 1000 for value in percentiles(samples))
+                print(f"  {phase:<8} p50 {p50:8.1f} ms, p95 {p95:8.1f} ms, p99 {p99:8.1f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path")
+    args = parser.parse_args()
+    main(args.path)
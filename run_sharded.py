@@ -0,0 +1,33 @@
+import argparse
+import asyncio
+import logging
+
+from src.gitcrawler.sharding import crawl_sharded
+from src.settings import (
+    OUTPUT_FORMAT,
+    PROXY_LIST,
+    SEARCH_MAX_PAGES,
+    SEARCHING_KEYWORDS,
+    SEARCHING_TYPE,
+    SHARD_PROCESSES,
+)
+
+logging.basicConfig(
+    format="%(asctime)s [%(levelname)s] %(processName)s %(name)s ::: %(message)s",
+    datefmt="%H:%M:%S",
+    level=logging.INFO,
+)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Crawl with repository enrichment split across processes")
+    parser.add_argument("--shards", type=int, default=SHARD_PROCESSES)
+    args = parser.parse_args()
+
+    config = {
+        "keywords": SEARCHING_KEYWORDS,
+        "proxies": PROXY_LIST,
+        "type": SEARCHING_TYPE,
+        "max_pages": SEARCH_MAX_PAGES,
+        "format": OUTPUT_FORMAT,
+    }
+    asyncio.run(crawl_sharded(config, shards=args.shards))
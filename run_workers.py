@@ -0,0 +1,38 @@
+import argparse
+import logging
+
+from src.gitcrawler.worker import run_worker, run_workers
+from src.settings import (
+    FRONTIER_PATH,
+    OUTPUT_FORMAT,
+    PROXY_LIST,
+    SEARCH_MAX_PAGES,
+    SEARCHING_KEYWORDS,
+    SEARCHING_TYPE,
+    WORKER_PROCESSES,
+)
+
+logging.basicConfig(
+    format="%(asctime)s [%(levelname)s] %(processName)s %(name)s ::: %(message)s",
+    datefmt="%H:%M:%S",
+    level=logging.INFO,
+)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Crawl with worker processes sharing a durable frontier")
+    parser.add_argument("--workers", type=int, default=WORKER_PROCESSES)
+    parser.add_argument("--frontier", default=FRONTIER_PATH)
+    parser.add_argument("--join", metavar="WORKER_ID", help="only work on an existing frontier, e.g. on another host")
+    args = parser.parse_args()
+
+    if args.join:
+        run_worker(args.frontier, args.join, PROXY_LIST, "results")
+    else:
+        config = {
+            "keywords": SEARCHING_KEYWORDS,
+            "proxies": PROXY_LIST,
+            "type": SEARCHING_TYPE,
+            "max_pages": SEARCH_MAX_PAGES,
+            "format": OUTPUT_FORMAT,
+        }
+        run_workers([config], workers=args.workers, frontier_path=args.frontier)
@@ -0,0 +1,211 @@
+import hashlib
+import logging
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from src.gitcrawler.models import CacheEntry
+from src.settings import CACHE_DIR, CACHE_MAX_BYTES, CACHE_TTL
+
+logger = logging.getLogger(__name__)
+
+
+class ResponseCache:
+    """
+    On-disk HTTP response cache keyed by URL.
+    Entries are fresh for `ttl` seconds, stale ones are revalidated with ETag / Last-Modified.
+    Total body size is bounded by `max_bytes` with LRU eviction
+    """
+
+    def __init__(
+        self,
+        cache_dir: str | Path = CACHE_DIR,
+        ttl: float = CACHE_TTL,
+        max_bytes: int = CACHE_MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.clock = clock
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.bytes_saved = 0
+
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._size = 0
+        self._load_index()
+
+    @staticmethod
+    def _key(url: str) -> str:
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def _body_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.body"
+
+    def _meta_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def _load_index(self):
+        """Load entries metadata from disk, least recently used first"""
+        entries = []
+        for meta_path in self.cache_dir.glob("*.json"):
+            try:
+                entry = CacheEntry.model_validate_json(meta_path.read_text(encoding="utf-8"))
+            except (OSError, ValidationError) as exc:
+                logger.debug(f"Dropping broken cache entry {meta_path.name}: {exc!r}")
+                meta_path.unlink(missing_ok=True)
+                continue
+            if not self._body_path(meta_path.stem).exists():
+                meta_path.unlink(missing_ok=True)
+                continue
+            entries.append((meta_path.stem, entry))
+
+        for key, entry in sorted(entries, key=lambda item: item[1].last_access):
+            self._entries[key] = entry
+            self._size += entry.size
+
+        self._evict()
+
+    def _write_meta(self, key: str, entry: CacheEntry):
+        tmp_path = self._meta_path(key).with_suffix(".json.tmp")
+        tmp_path.write_text(entry.model_dump_json(), encoding="utf-8")
+        os.replace(tmp_path, self._meta_path(key))
+
+    def _read_body(self, key: str) -> str | None:
+        try:
+            return self._body_path(key).read_text(encoding="utf-8")
+        except OSError:
+            self._remove(key)
+            return None
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry:
+            self._size -= entry.size
+        self._body_path(key).unlink(missing_ok=True)
+        self._meta_path(key).unlink(missing_ok=True)
+
+    def _evict(self):
+        """Drop least recently used entries until cache fits into max_bytes"""
+        while self._size > self.max_bytes and self._entries:
+            key = next(iter(self._entries))
+            logger.debug(f"Evicting cached response: {self._entries[key].url}")
+            self._remove(key)
+
+    def _touch(self, key: str, entry: CacheEntry):
+        entry.last_access = self.clock()
+        self._entries.move_to_end(key)
+        self._write_meta(key, entry)
+
+    def get(self, url: str) -> str | None:
+        """Return cached body if it is still fresh"""
+        key = self._key(url)
+        entry = self._entries.get(key)
+        if entry is None or self.clock() - entry.stored_at >= self.ttl:
+            self.misses += 1
+            return None
+
+        content = self._read_body(key)
+        if content is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.bytes_saved += entry.size
+        self._touch(key, entry)
+        return content
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """Build revalidation headers for stale entry"""
+        entry = self._entries.get(self._key(url))
+        headers = {}
+        if entry:
+            if entry.etag:
+                headers["If-None-Match"] = entry.etag
+            if entry.last_modified:
+                headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def store(self, url: str, content: str, headers: Mapping[str, str] | None = None):
+        """Store response body with its validators"""
+        key = self._key(url)
+        headers = headers or {}
+        body = content.encode("utf-8")
+        now = self.clock()
+
+        if key in self._entries:
+            self._size -= self._entries.pop(key).size
+
+        entry = CacheEntry(
+            url=url,
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+            stored_at=now,
+            last_access=now,
+            size=len(body),
+        )
+        if entry.size > self.max_bytes:
+            self._remove(key)
+            return
+
+        try:
+            tmp_path = self._body_path(key).with_suffix(".body.tmp")
+            tmp_path.write_bytes(body)
+            os.replace(tmp_path, self._body_path(key))
+            self._write_meta(key, entry)
+        except OSError as exc:
+            logger.warning(f"Failed to cache response for {url}: {exc!r}")
+            self._remove(key)
+            return
+
+        self._entries[key] = entry
+        self._size += entry.size
+        self._evict()
+
+    def revalidate(self, url: str, headers: Mapping[str, str] | None = None) -> str | None:
+        """Serve body from disk after 304 Not Modified response"""
+        key = self._key(url)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        content = self._read_body(key)
+        if content is None:
+            return None
+
+        headers = headers or {}
+        entry.etag = headers.get("ETag") or entry.etag
+        entry.last_modified = headers.get("Last-Modified") or entry.last_modified
+        entry.stored_at = self.clock()
+        self.revalidations += 1
+        self.bytes_saved += entry.size
+        self._touch(key, entry)
+        return content
+
+    def clear(self):
+        """Remove every cached response"""
+        for key in list(self._entries):
+            self._remove(key)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "bytes_saved": self.bytes_saved,
+            "entries": len(self._entries),
+            "size": self._size,
+        }
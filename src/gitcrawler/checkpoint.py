@@ -0,0 +1,83 @@
+import json
+import logging
+from pathlib import Path
+
+from src.gitcrawler.records import RepositoryRecord
+
+logger = logging.getLogger(__name__)
+
+
+class CheckpointJournal:
+    """
+    Append-only JSON Lines journal of finished crawl work: fetched search pages with their search metadata
+    and enriched repositories. Every record is flushed as soon as it is written,
+    a torn last line after a crash is cut off on load
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.pages: dict[int, list[str]] = {}
+        self.metadata: dict[int, dict[str, dict]] = {}
+        self.repositories: dict[str, RepositoryRecord] = {}
+        self._file = None
+
+    def load(self) -> "CheckpointJournal":
+        """Read finished work from existing journal"""
+        if not self.path.exists():
+            return self
+
+        with open(self.path, "rb+") as f:
+            content = f.read()
+            end = content.rfind(b"\n") + 1
+            if end < len(content):
+                logger.warning(f"Cutting off torn last checkpoint record {self.path}")
+                f.truncate(end)
+
+        for line_number, line in enumerate(content[:end].decode("utf-8").splitlines(), 1):
+            try:
+                record = json.loads(line)
+                match record["kind"]:
+                    case "page":
+                        self.pages[record["page"]] = record["urls"]
+                        if "metadata" in record:
+                            self.metadata[record["page"]] = record["metadata"]
+                    case "repository":
+                        info = record["info"]
+                        self.repositories[record["url"]] = RepositoryRecord.from_stats(
+                            info["owner"], info["language_stats"]
+                        )
+            except (ValueError, KeyError, TypeError) as exc:
+                logger.warning(f"Skipping broken checkpoint record {self.path}:{line_number}: {exc!r}")
+
+        logger.info(f"Loaded checkpoint {self.path}: {len(self.pages)} pages, {len(self.repositories)} repositories")
+        return self
+
+    def _append(self, record: dict):
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def record_page(self, page: int, urls: list[str], metadata: dict[str, dict] | None = None):
+        """Record fetched search page, with search results of its repositories by URL when given"""
+        self.pages[page] = urls
+        record = {"kind": "page", "page": page, "urls": urls}
+        if metadata is not None:
+            self.metadata[page] = record["metadata"] = metadata
+        self._append(record)
+
+    def record_repository(self, url: str, info: RepositoryRecord):
+        """Record enriched repository"""
+        self.repositories[url] = info
+        self._append({"kind": "repository", "url": url, "info": info.to_dict()})
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def remove(self):
+        """Delete journal once its crawl is saved"""
+        self.close()
+        self.path.unlink(missing_ok=True)
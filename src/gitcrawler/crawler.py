@@ -1,35 +1,85 @@
 import asyncio
-import csv
-import json
+import itertools
 import logging
+import math
+import tempfile
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime
 from http import HTTPStatus
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
 from urllib.parse import quote
 
 import aiohttp
-from lxml import html
 
-from src.gitcrawler.models import ProxyConfig, RepositoryInfo, SearchResult
+from src.gitcrawler.cache import ResponseCache
+from src.gitcrawler.checkpoint import CheckpointJournal
+from src.gitcrawler.metrics import CrawlMetrics
+from src.gitcrawler.models import CrawlQuery, FetchStats, ProxyConfig, RepositoryInfo, SearchResult
+from src.gitcrawler.parsers import (
+    LanguageStatsParser,
+    extract_urls_from_json,
+    parse_language_stats,
+    parse_search_page,
+    parse_search_results,
+    repository_fingerprint,
+    repository_summary,
+)
+from src.gitcrawler.priority_frontier import PriorityFrontier
 from src.gitcrawler.proxy_manager import ProxyManager
+from src.gitcrawler.proxy_validator import ProxyValidator
+from src.gitcrawler.records import RepositoryRecord, RepositorySummary, ResultRecord
+from src.gitcrawler.seen import ExactSeenSet, SeenSet
+from src.gitcrawler.store import RepositoryStore
+from src.gitcrawler.throttle import ConcurrencyController, RequestFeedback
+from src.gitcrawler.tracing import RequestTrace, RequestTracer
+from src.gitcrawler.writers import get_result_writer
 from src.settings import (
+    CHECKPOINT_DIR,
+    CONCURRENCY_MAX_IN_FLIGHT,
+    CONNECTION_LIMIT,
+    CONNECTION_LIMIT_PER_HOST,
     DIRECT_TIMEOUT,
+    DNS_CACHE_TTL,
+    ENRICHMENT,
+    ENRICHMENT_PRIORITY,
     GITHUB_BASE_URL,
-    GITHUB_BASE_URL_SEARCH,
     GITHUB_HEADERS,
-    JSON_SELECTORS,
+    GITHUB_SEARCH_PAGE_LIMIT,
+    HEDGE_DEFAULT_DELAY,
+    HEDGE_MIN_DELAY,
+    HEDGE_PERCENTILE,
+    HEDGE_REQUESTS,
+    INCREMENTAL_RECRAWL,
+    KEEPALIVE_TIMEOUT,
     MAX_CONCURRENT,
+    OUTPUT_FORMAT,
+    PARSE_EXECUTOR,
+    PARSE_WORKERS,
+    PROXY_REPROBE_INTERVAL,
     PROXY_TIMEOUT,
+    PROXY_VALIDATE,
+    REPOSITORY_STORE_BATCH_SIZE,
+    SEARCH_MAX_PAGES,
+    STREAM_CHUNK_SIZE,
+    STREAM_REPOSITORY_PAGES,
+    TRACE_PATH,
 )
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+ResponseReader = Callable[[aiohttp.ClientResponse], Awaitable[Any]]
+
 
 class GitHubCrawler:
     """
     GitHub crawler implementation.
-    Supports "repositories", "issues", and "wikis" search with proxy rotation
+    Supports "repositories", "issues", and "wikis" search with proxy rotation.
+    Use as async context manager to share one session between searches
     """
 
     SUPPORTED_TYPES = (
@@ -37,11 +87,72 @@ class GitHubCrawler:
         "issues",
         "wikis",
     )
+    ENRICHMENT_LEVELS = (
+        "none",
+        "payload",
+        "full",
+    )
+    ENRICHMENT_PRIORITIES = (
+        "order",
+        "stars",
+    )
 
-    def __init__(self, proxies: list[str] | None = None, output_dir: str = "results") -> None:
+    def __init__(
+        self,
+        proxies: list[str] | None = None,
+        output_dir: str = "results",
+        base_url: str = GITHUB_BASE_URL,
+        cache: ResponseCache | None = None,
+        repository_store: RepositoryStore | None = None,
+        hedge_requests: bool = HEDGE_REQUESTS,
+        parse_executor: str | Executor | None = PARSE_EXECUTOR,
+        parse_workers: int | None = PARSE_WORKERS,
+        stream_repository_pages: bool = STREAM_REPOSITORY_PAGES,
+        checkpoint_dir: str | None = CHECKPOINT_DIR,
+        metrics: CrawlMetrics | None = None,
+        trace_path: str | None = TRACE_PATH,
+        validate_proxies: bool = PROXY_VALIDATE,
+        reprobe_interval: float | None = PROXY_REPROBE_INTERVAL,
+        seen_urls: SeenSet | None = None,
+        incremental: bool = INCREMENTAL_RECRAWL,
+        enrichment_priority: str = ENRICHMENT_PRIORITY,
+    ) -> None:
         self.session = None
+        self._session_users = 0
+        self.base_url = base_url
+        self.cache = cache
+        self.repository_store = repository_store
+        self.seen_urls = seen_urls
+        if incremental and repository_store is None:
+            raise ValueError("Incremental recrawl requires a repository store")
+        self.incremental = incremental
+        if enrichment_priority not in self.ENRICHMENT_PRIORITIES:
+            raise ValueError(f"Unsupported enrichment priority: {enrichment_priority}")
+        self.enrichment_priority = enrichment_priority
+        self.hedge_requests = hedge_requests
+        self.stream_repository_pages = stream_repository_pages
+        self.fetch_stats = FetchStats()
+        self.concurrency = ConcurrencyController()
+        self.metrics = metrics or CrawlMetrics()
+        self.tracer = RequestTracer(trace_path) if trace_path else None
+        self._repository_tasks: dict[str, asyncio.Task] | None = None
+        self._repository_seen: SeenSet | None = None
+        self._repository_results: RepositoryStore | None = None
+        self._frontier: PriorityFrontier | None = None
+        self.proxy_validator = ProxyValidator(base_url) if validate_proxies else None
+        self.reprobe_interval = reprobe_interval
+        self._proxy_validation: asyncio.Task | None = None
+        self._reprobe_task: asyncio.Task | None = None
+        self._dead_proxies: list[ProxyConfig] = []
+
+        if isinstance(parse_executor, Executor):
+            self.parse_executor, self.parse_executor_type = parse_executor, None
+        else:
+            self.parse_executor, self.parse_executor_type = None, parse_executor
+        self.parse_workers = parse_workers
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        self.checkpoint_dir = Path(checkpoint_dir) if checkpoint_dir else self.output_dir / ".checkpoints"
 
         if proxies:
             proxy_configs = []
@@ -54,236 +165,729 @@ class GitHubCrawler:
         else:
             self.proxy_manager = None
 
+    async def __aenter__(self) -> "GitHubCrawler":
+        await self._acquire_session()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._release_session()
+        if self._session_users == 0:
+            self.shutdown_parse_executor()
+
     async def _create_session(self) -> aiohttp.ClientSession:
         """Create aiohttp session"""
-        connector = aiohttp.TCPConnector(limit=20, limit_per_host=10)
-        return aiohttp.ClientSession(headers=GITHUB_HEADERS, connector=connector)
+        connector = aiohttp.TCPConnector(
+            limit=CONNECTION_LIMIT,
+            limit_per_host=CONNECTION_LIMIT_PER_HOST,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=DNS_CACHE_TTL,
+        )
+        trace_configs = [self.tracer.trace_config()] if self.tracer else None
+        return aiohttp.ClientSession(headers=GITHUB_HEADERS, connector=connector, trace_configs=trace_configs)
+
+    async def _acquire_session(self):
+        """Create session on first use, next users share it"""
+        if self.session is None:
+            self.session = await self._create_session()
+        self._session_users += 1
+        if self.proxy_validator:
+            await self._validate_proxies_once()
+
+    async def _release_session(self):
+        """Close session when the last user releases it"""
+        self._session_users -= 1
+        if self._session_users <= 0 and self.session is not None:
+            self._session_users = 0
+            if self._reprobe_task:
+                self._reprobe_task.cancel()
+                await asyncio.gather(self._reprobe_task, return_exceptions=True)
+                self._reprobe_task = None
+            await self.session.close()
+            self.session = None
+            if self.tracer:
+                self.tracer.close()
+
+    async def _validate_proxies_once(self):
+        """Validate proxy list once, then keep re-probing dead proxies while the session is open"""
+        if self.proxy_manager and self._proxy_validation is None:
+            self._proxy_validation = asyncio.create_task(self._validate_proxies())
+        if self._proxy_validation is None:
+            return
+        await asyncio.shield(self._proxy_validation)
+        if self.reprobe_interval and self._reprobe_task is None:
+            self._reprobe_task = asyncio.create_task(self._reprobe_loop(self.reprobe_interval))
+
+    async def _validate_proxies(self):
+        """Probe all proxies concurrently, keep only live ones seeded with their probe latency"""
+        live, self._dead_proxies = await self.proxy_validator.validate(self.session, self.proxy_manager.proxies)
+        if not live:
+            logger.warning("No live proxies, requests go direct until a proxy recovers")
+            self.proxy_manager = None
+            return
+        self.proxy_manager = ProxyManager([])
+        for proxy, latency in live:
+            self.proxy_manager.add_proxy(proxy, latency)
 
-    async def _fetch_with_proxy(self, url: str, proxy: ProxyConfig) -> tuple[str | None, bool]:
+    async def _reprobe_proxies(self):
+        """Probe dead proxies and proxies with open circuit, let recovered ones back into rotation"""
+        manager = self.proxy_manager
+        suspects = [proxy for proxy in manager.proxies if proxy.url in manager.failed_proxies] if manager else []
+        live, dead = await self.proxy_validator.validate(self.session, suspects + self._dead_proxies)
+        if live and self.proxy_manager is None:
+            self.proxy_manager = ProxyManager([])
+        for proxy, latency in live:
+            self.proxy_manager.add_proxy(proxy, latency)
+        self._dead_proxies = [proxy for proxy in dead if manager is None or proxy.url not in manager.health]
+
+    async def _reprobe_loop(self, interval: float):
+        while True:
+            await asyncio.sleep(interval)
+            await self._reprobe_proxies()
+
+    async def _read_response(
+        self, url: str, response: aiohttp.ClientResponse, reader: ResponseReader | None = None
+    ) -> Any | None:
+        """Read response body, store it in cache or serve 304 from cache. Custom reader bypasses cache"""
+        if reader is not None:
+            return await reader(response) if response.status == HTTPStatus.OK else None
+        if response.status == HTTPStatus.OK:
+            content = await response.text()
+            if self.cache:
+                self.cache.store(url, content, response.headers)
+            return content
+        if response.status == HTTPStatus.NOT_MODIFIED and self.cache:
+            return self.cache.revalidate(url, response.headers)
+        return None
+
+    def _request_headers(self, url: str) -> dict[str, str] | None:
+        """Conditional request headers for cached URL"""
+        if self.cache:
+            return self.cache.conditional_headers(url) or None
+        return None
+
+    @asynccontextmanager
+    async def _acquire(self, semaphore: asyncio.Semaphore, name: str) -> AsyncIterator[None]:
+        """Acquire semaphore and record how long it took"""
+        started = time.monotonic()
+        async with semaphore:
+            self.metrics.semaphore_wait.observe(time.monotonic() - started, semaphore=name)
+            yield
+
+    def _page_type(self, url: str) -> str:
+        return "search" if url.startswith(f"{self.base_url}search?") else "repository"
+
+    @asynccontextmanager
+    async def _measure_request(
+        self, url: str, proxy: ProxyConfig | None, feedback: RequestFeedback | None = None
+    ) -> AsyncIterator[tuple[RequestFeedback, RequestTrace | None]]:
+        """
+        Take a concurrency slot and record request metrics, route is "proxy" or "direct".
+        Yields trace to pass as trace_request_ctx when tracing is on,
+        request latency without the slot wait is left in feedback.latency
+        """
+        route = "proxy" if proxy else "direct"
+        proxy_label = f"{proxy.host}:{proxy.port}" if proxy else ""
+        wait_started = time.monotonic()
+        async with self.concurrency.slot(proxy.url if proxy else None, feedback) as feedback:
+            started = time.monotonic()
+            self.metrics.semaphore_wait.observe(started - wait_started, semaphore="concurrency")
+            trace = self.tracer.start(url, self._page_type(url), proxy_label or None) if self.tracer else None
+            try:
+                yield feedback, trace
+            except BaseException as exc:
+                if trace and trace.error is None:
+                    trace.error = repr(exc)
+                raise
+            finally:
+                if trace:
+                    self.tracer.finish(trace)
+                feedback.latency = time.monotonic() - started
+                self.metrics.requests.inc(route=route, status=str(feedback.status or "error"))
+                self.metrics.request_duration.observe(feedback.latency, route=route, proxy=proxy_label)
+                if feedback.bytes_read:
+                    self.metrics.response_bytes.inc(feedback.bytes_read, route=route)
+                    self.metrics.response_size.observe(feedback.bytes_read, page=self._page_type(url))
+
+    async def _fetch_with_proxy(
+        self,
+        url: str,
+        proxy: ProxyConfig,
+        reader: ResponseReader | None = None,
+        feedback: RequestFeedback | None = None,
+    ) -> tuple[str | None, bool]:
         """Fetch page using proxy"""
         try:
             timeout = aiohttp.ClientTimeout(total=PROXY_TIMEOUT)
-            async with self.session.get(url, proxy=proxy.url, timeout=timeout, ssl=False) as response:
-                if response.status == HTTPStatus.OK:
-                    return await response.text(), True
-                return None, False
+            headers = self._request_headers(url) if reader is None else None
+            async with self._measure_request(url, proxy, feedback) as (feedback, trace):
+                async with self.session.get(
+                    url, proxy=proxy.url, timeout=timeout, ssl=False, headers=headers, trace_request_ctx=trace
+                ) as response:
+                    feedback.record(response.status, response.headers)
+                    try:
+                        content = await self._read_response(url, response, reader)
+                    finally:
+                        feedback.record_bytes(response)
+                    return content, content is not None
         except Exception:
             return None, False
 
-    async def _fetch_direct(self, url: str) -> str | None:
+    async def _fetch_direct(self, url: str, reader: ResponseReader | None = None) -> str | None:
         """Fetch page without proxy"""
         try:
             timeout = aiohttp.ClientTimeout(total=DIRECT_TIMEOUT)
-            async with self.session.get(url, timeout=timeout) as response:
-                if response.status == HTTPStatus.OK:
-                    return await response.text()
+            headers = self._request_headers(url) if reader is None else None
+            async with self._measure_request(url, None) as (feedback, trace):
+                async with self.session.get(url, timeout=timeout, headers=headers, trace_request_ctx=trace) as response:
+                    feedback.record(response.status, response.headers)
+                    try:
+                        return await self._read_response(url, response, reader)
+                    finally:
+                        feedback.record_bytes(response)
         except Exception:
             pass
         return None
 
-    async def _fetch_page(self, url: str) -> str | None:
-        """Fetch page with proxy rotation"""
-        if self.proxy_manager:
-            proxies_to_try = []
-            for _ in range(min(MAX_CONCURRENT, len(self.proxy_manager.proxies))):
-                proxy = self.proxy_manager.get_working_proxy()
-                if proxy and proxy not in proxies_to_try:
-                    proxies_to_try.append(proxy)
+    async def _try_proxy(
+        self,
+        url: str,
+        proxy: ProxyConfig,
+        reader: ResponseReader | None = None,
+        feedback: RequestFeedback | None = None,
+    ) -> str | None:
+        """Fetch page using proxy and update its health, latency excludes waiting for a concurrency slot"""
+        if feedback is None:
+            feedback = RequestFeedback()
+        content, success = await self._fetch_with_proxy(url, proxy, reader, feedback=feedback)
+        if success:
+            self.proxy_manager.mark_proxy_success(proxy, feedback.latency)
+        else:
+            self.proxy_manager.mark_proxy_failed(proxy)
+        return content if success else None
 
-            if proxies_to_try:
+    def _next_proxy(self, used: list[ProxyConfig]) -> ProxyConfig | None:
+        """Get best available proxy that was not tried for this URL yet"""
+        for _ in range(len(self.proxy_manager.proxies)):
+            proxy = self.proxy_manager.get_working_proxy()
+            if proxy is None:
+                return None
+            if proxy not in used:
+                return proxy
+        return None
 
-                async def try_proxy(proxy):
-                    content, success = await self._fetch_with_proxy(url, proxy)
-                    if not success:
-                        self.proxy_manager.mark_proxy_failed(proxy)
-                    return content if success else None
+    def _hedge_delay(self, proxy: ProxyConfig) -> float:
+        """How long to wait for proxy before starting a backup request"""
+        delay = self.proxy_manager.latency_percentile(proxy, HEDGE_PERCENTILE)
+        if delay is None:
+            delay = HEDGE_DEFAULT_DELAY
+        return min(max(delay, HEDGE_MIN_DELAY), PROXY_TIMEOUT)
 
-                tasks = [asyncio.create_task(try_proxy(proxy)) for proxy in proxies_to_try]
+    @staticmethod
+    async def _cancel_tasks(tasks):
+        """Cancel unfinished tasks and wait until they are cleaned up"""
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
 
-                for coro in asyncio.as_completed(tasks):
-                    result = await coro
-                    if result:
-                        for task in tasks:
-                            if not task.done():
-                                task.cancel()
-                        return result
+    async def _fetch_hedged(self, url: str, reader: ResponseReader | None = None) -> tuple[str | None, int]:
+        """
+        Send request to the best proxy first, start a backup request through the next proxy
+        only when the previous one fails or is slower than its usual latency percentile
+        """
+        used = []
+        tasks = set()
+        exhausted = False
+        try:
+            while True:
+                delay = None
+                if not exhausted and len(used) < MAX_CONCURRENT:
+                    proxy = self._next_proxy(used)
+                    if proxy:
+                        used.append(proxy)
+                        feedback = RequestFeedback()
+                        tasks.add(asyncio.create_task(self._try_proxy(url, proxy, reader, feedback)))
+                        delay = self._hedge_delay(proxy)
+                    else:
+                        exhausted = True
+                else:
+                    exhausted = True
 
-        return await self._fetch_direct(url)
+                if not tasks:
+                    return None, len(used)
 
-    async def _extract_repository_info(self, repo_url: str) -> RepositoryInfo | None:
-        """Extract repository owner and language stats"""
+                if delay is not None:
+                    # hedge delay counts from the moment the request holds its concurrency slot
+                    started = asyncio.create_task(feedback.started.wait())
+                    await asyncio.wait(tasks | {started}, return_when=asyncio.FIRST_COMPLETED)
+                    await self._cancel_tasks([started])
+
+                done, tasks = await asyncio.wait(tasks, timeout=delay, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if (content := task.result()) is not None:
+                        return content, len(used)
+        finally:
+            await self._cancel_tasks(tasks)
+
+    async def _fetch_racing(self, url: str, reader: ResponseReader | None = None) -> tuple[str | None, int]:
+        """Send request through several proxies at once and take the first success"""
+        proxies_to_try = []
+        for _ in range(min(MAX_CONCURRENT, len(self.proxy_manager.proxies))):
+            proxy = self.proxy_manager.get_working_proxy()
+            if proxy and proxy not in proxies_to_try:
+                proxies_to_try.append(proxy)
+
+        tasks = [asyncio.create_task(self._try_proxy(url, proxy, reader)) for proxy in proxies_to_try]
         try:
-            html_content = await self._fetch_page(repo_url)
-            if not html_content:
-                return None
+            for coro in asyncio.as_completed(tasks):
+                if (result := await coro) is not None:
+                    return result, len(tasks)
+        finally:
+            await self._cancel_tasks(tasks)
+        return None, len(tasks)
 
-            tree = html.fromstring(html_content)
+    async def _fetch_page(self, url: str, reader: ResponseReader | None = None) -> Any | None:
+        """
+        Fetch page with proxy rotation.
+        Returns page text, or whatever custom reader returns for successful response
+        """
+        if reader is None and self.cache and (content := self.cache.get(url)) is not None:
+            return content
 
-            owner = repo_url.replace(GITHUB_BASE_URL, "").split("/")[0]
+        attempts = 0
+        try:
+            if self.proxy_manager:
+                if self.hedge_requests:
+                    content, attempts = await self._fetch_hedged(url, reader)
+                else:
+                    content, attempts = await self._fetch_racing(url, reader)
+                if content is not None:
+                    return content
 
-            language_stats = {}
+            attempts += 1
+            return await self._fetch_direct(url, reader)
+        finally:
+            self.fetch_stats.record(attempts)
 
-            lang_elements = tree.xpath('//span[@class="color-fg-default text-bold mr-1"]/text()')
-            percent_elements = tree.xpath('//span[contains(text(), "%")]/text()')
+    async def _read_language_stats(self, response: aiohttp.ClientResponse) -> dict[str, float]:
+        """Feed repository page into incremental parser, stop reading as soon as language stats are parsed"""
+        parser = LanguageStatsParser()
+        parse_time = 0.0
+        async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+            started = time.perf_counter()
+            done = parser.feed(chunk)
+            parse_time += time.perf_counter() - started
+            if done:
+                response.close()
+                break
 
-            for lang, percent in zip(lang_elements, percent_elements):
-                try:
-                    percent_val = float(percent.replace("%", "").strip())
-                    language_stats[lang.strip()] = percent_val
-                except (ValueError, AttributeError):
-                    continue
+        started = time.perf_counter()
+        language_stats = parser.close()
+        self.metrics.parse_duration.observe(parse_time + time.perf_counter() - started, page="repository")
+        return language_stats
 
-            return RepositoryInfo(owner=owner, language_stats=language_stats)
+    async def _get_repository_info(self, repo_url: str) -> RepositoryRecord | RepositoryInfo | None:
+        """
+        Extract repository info, inside crawl_many every repository is fetched once for all queries:
+        in-flight fetches are shared and URLs in the seen-URL set are read back from the results of this run
+        """
+        if self._repository_tasks is None:
+            return await self._extract_repository_info(repo_url)
 
-        except Exception as exc:
-            logger.debug(f"Error extracting repository info: {exc!r}")
-            return None
+        task = self._repository_tasks.get(repo_url)
+        if task is None:
+            if repo_url in self._repository_seen:
+                repo_info = self._repository_results.get(repo_url)
+                if repo_info is not None:
+                    return repo_info
+            tasks = self._repository_tasks
+            tasks[repo_url] = task = asyncio.create_task(self._extract_shared_repository_info(repo_url))
+            task.add_done_callback(lambda _: tasks.pop(repo_url, None))
+        return await asyncio.shield(task)
 
-    def _extract_urls_from_json(self, json_data: dict, search_type: str) -> list[str]:
-        """Extract URLs from GitHub search JSON data"""
-        urls = []
-        results = json_data.get("payload", {}).get("results", [])
+    async def _extract_shared_repository_info(self, repo_url: str) -> RepositoryRecord | None:
+        repo_info = await self._extract_repository_info(repo_url)
+        if repo_info is not None:
+            self._repository_results.put(repo_url, repo_info)
+            self._repository_seen.add(repo_url)
+        return repo_info
 
-        for result in results:
-            repo = result.get("repo", {}).get("repository", {})
-            owner = repo.get("owner_login")
-            repo_name = repo.get("name")
+    async def _extract_repository_info(self, repo_url: str) -> RepositoryRecord | None:
+        """Extract repository owner and language stats"""
+        try:
+            if self.stream_repository_pages:
+                language_stats = await self._fetch_page(repo_url, reader=self._read_language_stats)
+                if language_stats is None:
+                    return None
+            else:
+                html_content = await self._fetch_page(repo_url)
+                if not html_content:
+                    return None
+                started = time.perf_counter()
+                language_stats = await self._run_parser(parse_language_stats, html_content)
+                self.metrics.parse_duration.observe(time.perf_counter() - started, page="repository")
 
-            if not owner or not repo_name:
-                continue
+            owner = repo_url.replace(self.base_url, "").split("/")[0]
 
-            try:
-                match search_type:
-                    case "repositories":
-                        url = f"{GITHUB_BASE_URL}{owner}/{repo_name}"
-                    case "issues":
-                        if number := result.get("number"):
-                            url = f"{GITHUB_BASE_URL}{owner}/{repo_name}/issues/{number}"
-                        else:
-                            continue
-                    case "wikis":
-                        if path := result.get("path") or result.get("title"):
-                            path = quote(path, safe="")
-                            url = f"{GITHUB_BASE_URL}{owner}/{repo_name}/wiki/{path}"
-                        else:
-                            continue
-                    case _:
-                        continue
-
-                urls.append(url)
-            except Exception:
-                continue
+            return RepositoryRecord.from_stats(owner, language_stats)
 
-        return urls
+        except Exception as exc:
+            logger.debug(f"Error extracting repository info: {exc!r}")
+            return None
+
+    def _extract_urls_from_json(self, json_data: dict, search_type: str, seen: SeenSet | None = None) -> list[str]:
+        """Extract URLs from GitHub search JSON data, skipping URLs already in `seen`"""
+        return extract_urls_from_json(json_data, search_type, self.base_url, seen)
 
     def _parse_search_results(self, html_content: str, search_type: str) -> list[str]:
         """Parse GitHub search results HTML and extract URLs"""
-        try:
-            tree = html.fromstring(html_content)
+        return parse_search_results(html_content, search_type, self.base_url)
 
-            for selector in JSON_SELECTORS:
-                script_elements = tree.xpath(selector)
-                if script_elements:
-                    json_data = json.loads(script_elements[0])
-                    urls = self._extract_urls_from_json(json_data, search_type)
-                    logger.info(f"Extracted {len(urls)} URLS")
-                    return urls
+    def _get_parse_executor(self) -> Executor | None:
+        """Create parse executor on first use"""
+        if self.parse_executor is None and self.parse_executor_type:
+            match self.parse_executor_type:
+                case "thread":
+                    self.parse_executor = ThreadPoolExecutor(self.parse_workers, thread_name_prefix="parser")
+                case "process":
+                    self.parse_executor = ProcessPoolExecutor(self.parse_workers)
+                case _:
+                    raise ValueError(f"Unsupported parse executor: {self.parse_executor_type}")
+        return self.parse_executor
 
-            logger.warning("No JSON data found")
-            return []
+    async def _run_parser(self, parser: Callable[..., T], *args) -> T:
+        """Run parser in the parse executor, or on the event loop if there is none"""
+        executor = self._get_parse_executor()
+        if executor is None:
+            return parser(*args)
+        return await asyncio.get_running_loop().run_in_executor(executor, parser, *args)
 
-        except Exception as exc:
-            logger.error(f"Parsing error: {exc!r}")
-            return []
+    async def _parse_search_page(
+        self, html_content: str, search_type: str, metadata: dict[str, dict] | None = None
+    ) -> list[str]:
+        """
+        Parse search page off the event loop when parse executor is configured.
+        Search results of found repositories are collected into `metadata` by URL when it is given
+        """
+        started = time.perf_counter()
+        if metadata is not None:
+            urls, page_metadata = await self._run_parser(parse_search_page, html_content, search_type, self.base_url)
+            metadata.update(page_metadata)
+        elif self._get_parse_executor() is None:
+            urls = self._parse_search_results(html_content, search_type)
+        else:
+            urls = await self._run_parser(parse_search_results, html_content, search_type, self.base_url)
+        self.metrics.parse_duration.observe(time.perf_counter() - started, page="search")
+        return urls
+
+    def shutdown_parse_executor(self):
+        """Stop parse workers, next parse creates a new executor"""
+        if self.parse_executor is not None and self.parse_executor_type:
+            self.parse_executor.shutdown(wait=False, cancel_futures=True)
+            self.parse_executor = None
 
-    def _build_search_url(self, keywords: list[str], search_type: str) -> str:
+    def _build_search_url(self, keywords: list[str], search_type: str, page: int = 1) -> str:
         """Build GitHub search URL"""
         query = "+".join(quote(keyword, safe="") for keyword in keywords)
-        return f"{GITHUB_BASE_URL_SEARCH}?q={query}&type={search_type}"
+        url = f"{self.base_url}search?q={query}&type={search_type}"
+        if page > 1:
+            url += f"&p={page}"
+        return url
 
-    def _save_to_csv(self, results: list[SearchResult], search_type: str, keywords: list[str]):
-        """Save search results to CSV file"""
+    async def _collect_search_urls(
+        self,
+        keywords: list[str],
+        search_type: str,
+        max_pages: int,
+        semaphore: asyncio.Semaphore,
+        checkpoint: CheckpointJournal | None = None,
+        metadata: dict[str, dict] | None = None,
+    ) -> list[str]:
+        """
+        Fetch search pages concurrently and extract URLs, stopping at the first empty page.
+        Pages go through the crawl_many frontier ahead of repositories, or through a frontier of this search.
+        URLs are deduplicated within this search only, every query keeps all of its results
+        """
+        max_pages = max(1, min(max_pages, GITHUB_SEARCH_PAGE_LIMIT))
+        last_page = max_pages
+
+        async def fetch_search_page(page: int) -> tuple[int, list[str]]:
+            nonlocal last_page
+            # pages checkpointed without search metadata are fetched again when it is needed
+            if checkpoint and page in checkpoint.pages and (metadata is None or page in checkpoint.metadata):
+                urls = checkpoint.pages[page]
+                if metadata is not None:
+                    metadata.update(checkpoint.metadata[page])
+                if not urls:
+                    last_page = min(last_page, page - 1)
+                return page, urls
+
+            async with self._acquire(semaphore, "search_page"):
+                if page > last_page:
+                    return page, []
+                html_content = await self._fetch_page(self._build_search_url(keywords, search_type, page))
+
+            if not html_content:
+                return page, []
+
+            page_metadata = {} if metadata is not None else None
+            urls = await self._parse_search_page(html_content, search_type, page_metadata)
+            if metadata is not None:
+                metadata.update(page_metadata)
+            if checkpoint:
+                checkpoint.record_page(page, urls, page_metadata)
+            if not urls:
+                last_page = min(last_page, page - 1)
+            return page, urls
+
+        # pages after the first empty one are not queued at all
+        queued = itertools.takewhile(lambda page: page <= last_page, range(1, max_pages + 1))
+        frontier = self._frontier or PriorityFrontier(workers=min(max_pages, CONCURRENCY_MAX_IN_FLIGHT))
+        pages = dict(
+            [result async for _, result in frontier.run(((-math.inf, page) for page in queued), fetch_search_page)]
+        )
+
+        urls = []
+        seen = ExactSeenSet()
+        for page in sorted(pages):
+            if page > last_page:
+                break
+            urls.extend(url for url in pages[page] if seen.add(url))
+
+        if max_pages > 1:
+            logger.info(f"Collected {len(urls)} URLS from {min(last_page, max_pages)} search pages")
+        return urls
+
+    def _build_output_path(self, search_type: str, keywords: list[str], extension: str = "csv") -> Path:
+        """Build timestamped output file path, numbered if the name is already taken"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         keywords_str = "_".join(keywords[:3])
-        filename = f"{search_type}_{keywords_str}_{timestamp}.csv"
-        filepath = self.output_dir / filename
-
-        with open(filepath, "w", newline="", encoding="utf-8") as csvfile:
-            if search_type == "repositories" and results and results[0].extra:
-                fieldnames = ["url", "owner", "language_stats"]
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-
-                for result in results:
-                    row = {"url": result.url}
-                    if result.extra:
-                        row.update(
-                            {
-                                "owner": result.extra.get("owner", ""),
-                                "language_stats": json.dumps(result.extra.get("language_stats", {})),
-                            }
-                        )
-                    writer.writerow(row)
-            else:
-                fieldnames = ["url"]
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
+        filepath = self.output_dir / f"{search_type}_{keywords_str}_{timestamp}.{extension}"
+        number = 1
+        while filepath.exists():
+            filepath = self.output_dir / f"{search_type}_{keywords_str}_{timestamp}_{number}.{extension}"
+            number += 1
+        return filepath
+
+    def _save_results(
+        self,
+        results: list[SearchResult | ResultRecord],
+        search_type: str,
+        keywords: list[str],
+        output_format: str = OUTPUT_FORMAT,
+        extra_fields: tuple[str, ...] = RepositoryRecord.fields,
+    ):
+        """Save search results to file in given output format"""
+        writer_class = get_result_writer(output_format)
+        filepath = self._build_output_path(search_type, keywords, writer_class.extension)
+        with_extra = bool(results and results[0].extra)
 
-                for result in results:
-                    writer.writerow({"url": result.url})
+        with writer_class(
+            filepath, search_type, with_extra=with_extra, append=False, extra_fields=extra_fields
+        ) as writer:
+            for result in results:
+                writer.write(result)
 
         logger.info(f"Saved {len(results)} results to {filepath}")
 
-    async def search(self, keywords: list[str], search_type: str, extract_extra: bool = True) -> list[SearchResult]:
-        """Perform GitHub search and extracting URLs"""
-        if search_type.lower() not in self.SUPPORTED_TYPES:
+    def _extra_fields(self, enrichment: str) -> tuple[str, ...]:
+        """Repository columns written for given enrichment level"""
+        return RepositorySummary.fields if enrichment == "payload" else RepositoryRecord.fields
+
+    def _save_to_csv(self, results: list[SearchResult | ResultRecord], search_type: str, keywords: list[str]):
+        """Save search results to CSV file"""
+        self._save_results(results, search_type, keywords, "csv")
+
+    def _known_repositories(self, urls: list[str], fingerprints: dict[str, str] | None) -> dict[str, RepositoryInfo]:
+        """
+        Stored repositories that need no fetch: in incremental mode the ones whose search metadata fingerprint
+        did not change since they were stored, fresh ones for repositories without fingerprint
+        """
+        if self.repository_store is None:
+            return {}
+        if fingerprints is None:
+            return self.repository_store.get_many(urls)
+
+        known = self.repository_store.get_many([url for url in urls if url not in fingerprints])
+        known.update(
+            self.repository_store.get_unchanged({url: fingerprints[url] for url in urls if url in fingerprints})
+        )
+        return known
+
+    def _prioritize(
+        self, urls: list[str], known: dict[str, Any], metadata: dict[str, dict] | None
+    ) -> list[tuple[float, tuple[int, str]]]:
+        """
+        (priority, (position, url)) of repositories to fetch, lowest priority first:
+        most starred first by search payload, otherwise in search result order
+        """
+        pending = [(position, (position, url)) for position, url in enumerate(urls) if url not in known]
+        if self.enrichment_priority == "stars" and metadata is not None:
+            pending = [
+                (-(repository_summary(metadata[url])["stars"] or 0) if url in metadata else 0, (position, url))
+                for _, (position, url) in pending
+            ]
+            pending.sort(key=lambda entry: entry[0])
+        return pending
+
+    async def _search_stream(
+        self,
+        keywords: list[str],
+        search_type: str,
+        enrichment: str,
+        max_pages: int,
+        checkpoint: CheckpointJournal | None = None,
+    ) -> AsyncIterator[tuple[int, ResultRecord]]:
+        """Yield (position, result) pairs in completion order"""
+        search_type = search_type.lower()
+        if search_type not in self.SUPPORTED_TYPES:
             raise ValueError(f"Unsupported search type: {search_type}")
+        if enrichment not in self.ENRICHMENT_LEVELS:
+            raise ValueError(f"Unsupported enrichment level: {enrichment}")
+        if search_type != "repositories":
+            enrichment = "none"
 
-        search_url = self._build_search_url(keywords, search_type.lower())
+        search_url = self._build_search_url(keywords, search_type)
         logger.info(f"Searching: {search_url}")
 
-        self.session = await self._create_session()
+        await self._acquire_session()
         try:
-            html_content = await self._fetch_page(search_url)
-            if not html_content:
-                return []
+            semaphore = asyncio.Semaphore(CONCURRENCY_MAX_IN_FLIGHT)
+            wants_metadata = self.incremental or self.enrichment_priority == "stars"
+            metadata = {} if enrichment == "payload" or (enrichment == "full" and wants_metadata) else None
+            urls = await self._collect_search_urls(keywords, search_type, max_pages, semaphore, checkpoint, metadata)
+            if not urls:
+                return
 
-            urls = self._parse_search_results(html_content, search_type.lower())
-            results = []
+            if enrichment == "none":
+                for position, url in enumerate(urls):
+                    self.metrics.results.inc(search_type=search_type)
+                    yield position, ResultRecord(url)
+                return
 
-            if search_type.lower() == "repositories" and extract_extra and urls:
-                logger.info(f"Extracting repository info for {len(urls)} repositories...")
+            if enrichment == "payload":
+                for position, url in enumerate(urls):
+                    result = metadata.get(url)
+                    self.metrics.results.inc(search_type=search_type)
+                    yield (
+                        position,
+                        ResultRecord(url, RepositorySummary(**repository_summary(result)) if result else None),
+                    )
+                return
 
-                semaphore = asyncio.Semaphore(MAX_CONCURRENT)
+            fingerprints = None
+            if self.incremental:
+                fingerprints = {
+                    url: fingerprint
+                    for url, result in metadata.items()
+                    if (fingerprint := repository_fingerprint(result))
+                }
 
-                async def process_repo(url):
-                    async with semaphore:
-                        repo_info = await self._extract_repository_info(url)
-                        result = SearchResult(url=url)
-                        if repo_info:
-                            result.extra = repo_info.model_dump()
-                        return result
+            known = self._known_repositories(urls, fingerprints)
+            if checkpoint:
+                known.update((url, checkpoint.repositories[url]) for url in urls if url in checkpoint.repositories)
+            for position, url in enumerate(urls):
+                if url in known:
+                    self.metrics.results.inc(search_type=search_type)
+                    yield position, ResultRecord(url, RepositoryRecord.from_info(known[url]))
 
-                tasks = [process_repo(url) for url in urls]
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                results = [r for r in results if not isinstance(r, Exception)]
-            else:
-                results = [SearchResult(url=url) for url in urls]
+            pending = self._prioritize(urls, known, metadata)
+            logger.info(f"Extracting repository info for {len(pending)} repositories ({len(known)} already known)...")
+            enriched = {}
 
-            return results
+            async def process_repo(item: tuple[int, str]) -> ResultRecord:
+                _, url = item
+                async with self._acquire(semaphore, "repository"):
+                    repo_info = await self._get_repository_info(url)
+                    result = ResultRecord(url)
+                    if repo_info:
+                        result.repository = repo_info = RepositoryRecord.from_info(repo_info)
+                        enriched[url] = repo_info
+                        if self.seen_urls is not None:
+                            self.seen_urls.add(url)
+                        if checkpoint:
+                            checkpoint.record_repository(url, repo_info)
+                    return result
+
+            frontier = self._frontier or PriorityFrontier()
+            try:
+                async for (position, _), result in frontier.run(pending, process_repo):
+                    self.metrics.results.inc(search_type=search_type)
+                    yield position, result
+
+                    if self.repository_store is not None and len(enriched) >= REPOSITORY_STORE_BATCH_SIZE:
+                        self.repository_store.put_many(enriched, fingerprints=fingerprints)
+                        enriched.clear()
+            finally:
+                if self.repository_store is not None:
+                    self.repository_store.put_many(enriched, fingerprints=fingerprints)
 
         finally:
-            await self.session.close()
+            await self._release_session()
 
-    async def crawl(self, config: dict[str, Any]) -> list[SearchResult]:
-        """Perform crawling according to configs"""
+    async def search_iter(
+        self,
+        keywords: list[str],
+        search_type: str,
+        extract_extra: bool = True,
+        max_pages: int = SEARCH_MAX_PAGES,
+        checkpoint: CheckpointJournal | None = None,
+        records: bool = False,
+        enrichment: str = ENRICHMENT,
+    ) -> AsyncIterator[SearchResult | ResultRecord]:
+        """
+        Perform GitHub search and yield every result as soon as it is ready.
+        With `records` compact ResultRecord objects are yielded instead of pydantic models
+        """
+        enrichment = enrichment if extract_extra else "none"
+        async for _, result in self._search_stream(keywords, search_type, enrichment, max_pages, checkpoint):
+            yield result if records else result.to_model()
+
+    async def search(
+        self,
+        keywords: list[str],
+        search_type: str,
+        extract_extra: bool = True,
+        max_pages: int = SEARCH_MAX_PAGES,
+        checkpoint: CheckpointJournal | None = None,
+        records: bool = False,
+        enrichment: str = ENRICHMENT,
+    ) -> list[SearchResult | ResultRecord]:
+        """
+        Perform GitHub search and extracting URLs, with `records` compact ResultRecord objects are returned.
+        Repositories are enriched from their pages ("full"), from the search payload only ("payload") or not at all
+        """
+        enrichment = enrichment if extract_extra else "none"
+        results = [item async for item in self._search_stream(keywords, search_type, enrichment, max_pages, checkpoint)]
+        results.sort(key=lambda item: item[0])
+        if records:
+            return [result for _, result in results]
+        return [result.to_model() for _, result in results]
+
+    def _parse_config(self, config: dict[str, Any]) -> CrawlQuery:
+        """Validate crawl config"""
         keywords = config.get("keywords", [])
-        proxies = config.get("proxies", [])
-        search_type = config.get("type", "repositories")
+        output_format = config.get("format", OUTPUT_FORMAT)
 
         if not keywords:
             raise ValueError("Keywords list cannot be empty")
+        get_result_writer(output_format).check_dependencies()
+        enrichment = config.get("enrichment", ENRICHMENT)
+        if enrichment not in self.ENRICHMENT_LEVELS:
+            raise ValueError(f"Unsupported enrichment level: {enrichment}")
+
+        return CrawlQuery(
+            keywords=keywords,
+            search_type=config.get("type", "repositories"),
+            max_pages=config.get("max_pages", SEARCH_MAX_PAGES),
+            output_format=output_format,
+            resume=config.get("resume", False),
+            proxies=config.get("proxies", []),
+            enrichment=enrichment,
+        )
 
+    def _set_proxies(self, proxies: list[str]):
+        """Replace proxy manager with given proxies"""
         if proxies:
             proxy_configs = []
             for proxy_str in proxies:
@@ -292,9 +896,135 @@ class GitHubCrawler:
                 except ValueError as exc:
                     logger.error(f"Invalid proxy: {proxy_str} error: {exc!r}")
             self.proxy_manager = ProxyManager(proxy_configs) if proxy_configs else None
+            self._proxy_validation = None
+            self._dead_proxies = []
 
-        results = await self.search(keywords, search_type, extract_extra=True)
+    def _apply_config(self, config: dict[str, Any]) -> CrawlQuery:
+        """Validate crawl config and set up proxies"""
+        query = self._parse_config(config)
+        self._set_proxies(query.proxies)
+        return query
 
-        self._save_to_csv(results, search_type, keywords)
+    def _open_checkpoint(self, query: CrawlQuery) -> CheckpointJournal:
+        """Open checkpoint journal of the query, previous progress is loaded only when resuming"""
+        journal = CheckpointJournal(self.checkpoint_dir / f"{query.checkpoint_key}.jsonl")
+        if query.resume:
+            return journal.load()
+        journal.path.unlink(missing_ok=True)
+        return journal
+
+    async def crawl(self, config: dict[str, Any], records: bool = False) -> list[SearchResult | ResultRecord]:
+        """Perform crawling according to configs, with `records` compact ResultRecord objects are returned"""
+        query = self._apply_config(config)
+
+        checkpoint = self._open_checkpoint(query)
+        try:
+            results = await self.search(
+                query.keywords,
+                query.search_type,
+                extract_extra=True,
+                max_pages=query.max_pages,
+                checkpoint=checkpoint,
+                records=records,
+                enrichment=query.enrichment,
+            )
+        finally:
+            checkpoint.close()
+
+        self._save_results(
+            results, query.search_type, query.keywords, query.output_format, self._extra_fields(query.enrichment)
+        )
+        checkpoint.remove()
 
         return results
+
+    async def crawl_iter(
+        self, config: dict[str, Any], records: bool = False
+    ) -> AsyncIterator[SearchResult | ResultRecord]:
+        """Perform crawling according to configs, writing every result as soon as it is ready"""
+        query = self._apply_config(config)
+        writer_class = get_result_writer(query.output_format)
+        filepath = self._build_output_path(query.search_type, query.keywords, writer_class.extension)
+
+        checkpoint = self._open_checkpoint(query)
+        try:
+            with writer_class(
+                filepath, query.search_type.lower(), extra_fields=self._extra_fields(query.enrichment)
+            ) as writer:
+                async for result in self.search_iter(
+                    query.keywords,
+                    query.search_type,
+                    extract_extra=True,
+                    max_pages=query.max_pages,
+                    checkpoint=checkpoint,
+                    records=records,
+                    enrichment=query.enrichment,
+                ):
+                    writer.write(result)
+                    yield result
+        finally:
+            checkpoint.close()
+
+        checkpoint.remove()
+        logger.info(f"Saved {writer.count} results to {filepath}")
+
+    async def crawl_many(
+        self, configs: list[dict[str, Any]], records: bool = False
+    ) -> list[list[SearchResult | ResultRecord]]:
+        """
+        Perform crawling for many configs through one session and concurrency budget.
+        Repository pages found by several queries are fetched once, every query is saved to its own file
+        """
+        queries = [self._parse_config(config) for config in configs]
+        if not queries:
+            return []
+        if len({query.checkpoint_key for query in queries}) < len(queries):
+            raise ValueError("Duplicate crawl configs, every query must differ in keywords, type or output options")
+
+        proxies = list(dict.fromkeys(proxy for query in queries for proxy in query.proxies))
+        self._set_proxies(proxies)
+
+        async def crawl_query(query: CrawlQuery) -> list[SearchResult | ResultRecord]:
+            checkpoint = self._open_checkpoint(query)
+            try:
+                results = await self.search(
+                    query.keywords,
+                    query.search_type,
+                    extract_extra=True,
+                    max_pages=query.max_pages,
+                    checkpoint=checkpoint,
+                    records=records,
+                    enrichment=query.enrichment,
+                )
+            finally:
+                checkpoint.close()
+
+            self._save_results(
+                results, query.search_type, query.keywords, query.output_format, self._extra_fields(query.enrichment)
+            )
+            checkpoint.remove()
+            return results
+
+        # finished repositories are kept on disk for the other queries, only in-flight fetches stay in memory
+        with tempfile.TemporaryDirectory(prefix="gitcrawler-") as directory:
+            self._repository_tasks = {}
+            self._repository_seen = self.seen_urls if self.seen_urls is not None else ExactSeenSet()
+            self._repository_results = RepositoryStore(Path(directory) / "repositories.sqlite3")
+            # one worker pool for search pages and repositories of every query, pages first
+            self._frontier = PriorityFrontier()
+            async with self, self._frontier:
+                try:
+                    results = await asyncio.gather(*(crawl_query(query) for query in queries), return_exceptions=True)
+                    logger.info(
+                        f"Crawled {len(queries)} queries, enriched {len(self._repository_results)} unique repositories"
+                    )
+                finally:
+                    await self._cancel_tasks(list(self._repository_tasks.values()))
+                    self._repository_results.close()
+                    self._repository_tasks = self._repository_seen = self._repository_results = None
+                    self._frontier = None
+
+        for query, result in zip(queries, results, strict=True):
+            if isinstance(result, Exception):
+                logger.error(f"Query {query.search_type} {query.keywords} failed: {result!r}")
+        return [[] if isinstance(result, Exception) else result for result in results]
@@ -0,0 +1,259 @@
+import json
+import logging
+import sqlite3
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from src.gitcrawler.models import CrawlJob, CrawlQuery, SearchResult
+from src.settings import FRONTIER_LEASE_TIMEOUT, FRONTIER_MAX_ATTEMPTS, FRONTIER_PATH
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlFrontier:
+    """
+    Durable SQLite job queue shared by crawl worker processes.
+    Jobs are leased for a limited time, a lease that is not completed in time goes back to the queue.
+    Finished jobs keep their results, so the database is also the shared result sink
+    """
+
+    def __init__(
+        self,
+        path: str | Path = FRONTIER_PATH,
+        max_attempts: int = FRONTIER_MAX_ATTEMPTS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = Path(path)
+        if str(path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_attempts = max_attempts
+        self.clock = clock
+
+        self._connection = sqlite3.connect(str(path), timeout=30, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS queries (
+                key TEXT PRIMARY KEY,
+                config TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS jobs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                key TEXT NOT NULL UNIQUE,
+                query TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                page INTEGER NOT NULL,
+                position INTEGER NOT NULL DEFAULT 0,
+                payload TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                leased_by TEXT,
+                lease_expires_at REAL,
+                result TEXT
+            );
+            CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, lease_expires_at);
+            CREATE INDEX IF NOT EXISTS jobs_query ON jobs (query, kind, page, position);
+            """
+        )
+
+    def add_query(self, query: CrawlQuery) -> str:
+        """
+        Register query and queue its first search page. A resumed query keeps the jobs of its previous run,
+        otherwise they are dropped and the query is crawled anew
+        """
+        with self._transaction():
+            self._connection.execute(
+                "INSERT OR REPLACE INTO queries (key, config) VALUES (?, ?)", (query.key, query.model_dump_json())
+            )
+            if not query.resume:
+                self._connection.execute("DELETE FROM jobs WHERE query = ?", (query.key,))
+            self._insert_jobs([self._search_job(query.key, 1)])
+        return query.key
+
+    def get_query(self, key: str) -> CrawlQuery | None:
+        row = self._connection.execute("SELECT config FROM queries WHERE key = ?", (key,)).fetchone()
+        return CrawlQuery.model_validate_json(row[0]) if row else None
+
+    def lease(self, worker_id: str, limit: int, lease_timeout: float = FRONTIER_LEASE_TIMEOUT) -> list[CrawlJob]:
+        """
+        Lease up to limit pending jobs. Expired leases are returned to the queue first,
+        jobs that used up their attempts are failed instead
+        """
+        now = self.clock()
+        with self._transaction():
+            expired = self._connection.execute(
+                """
+                UPDATE jobs SET
+                    status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END,
+                    result = CASE WHEN attempts >= ? THEN ? ELSE result END,
+                    leased_by = NULL,
+                    lease_expires_at = NULL
+                WHERE status = 'leased' AND lease_expires_at <= ?
+                RETURNING kind, payload, status
+                """,
+                (self.max_attempts, self.max_attempts, json.dumps({"error": "Lease expired"}), now),
+            ).fetchall()
+            rows = self._connection.execute(
+                """
+                UPDATE jobs SET status = 'leased', leased_by = ?, lease_expires_at = ?, attempts = attempts + 1
+                WHERE id IN (SELECT id FROM jobs WHERE status = 'pending' ORDER BY id LIMIT ?)
+                RETURNING id, query, kind, page, position, payload, attempts
+                """,
+                (worker_id, now + lease_timeout, limit),
+            ).fetchall()
+
+        for kind, payload, status in expired:
+            if status == "failed":
+                logger.error(f"Job {kind} {payload} failed after {self.max_attempts} attempts: Lease expired")
+        return [
+            CrawlJob(
+                id=job_id,
+                query=query,
+                kind=kind,
+                page=page,
+                position=position,
+                payload=json.loads(payload),
+                attempts=attempts,
+            )
+            for job_id, query, kind, page, position, payload, attempts in sorted(rows)
+        ]
+
+    def renew(self, jobs: list[CrawlJob], worker_id: str, lease_timeout: float = FRONTIER_LEASE_TIMEOUT) -> int:
+        """Extend leases the worker still holds, returns the number of renewed leases"""
+        if not jobs:
+            return 0
+        with self._transaction():
+            cursor = self._connection.execute(
+                """
+                UPDATE jobs SET lease_expires_at = ?
+                WHERE id IN (SELECT value FROM json_each(?)) AND status = 'leased' AND leased_by = ?
+                """,
+                (self.clock() + lease_timeout, json.dumps([job.id for job in jobs]), worker_id),
+            )
+        return cursor.rowcount
+
+    def complete(self, job: CrawlJob, worker_id: str, result: dict | list | None, new_jobs: list[dict] = ()) -> bool:
+        """Store job result and queue jobs it discovered, returns False when the lease was lost"""
+        with self._transaction():
+            cursor = self._connection.execute(
+                """
+                UPDATE jobs SET status = 'done', result = ?, lease_expires_at = NULL
+                WHERE id = ? AND status = 'leased' AND leased_by = ?
+                """,
+                (json.dumps(result), job.id, worker_id),
+            )
+            if cursor.rowcount == 0:
+                logger.warning(f"Lease of job {job.id} was lost, result dropped")
+                return False
+            self._insert_jobs(new_jobs)
+        return True
+
+    def fail(self, job: CrawlJob, worker_id: str, error: str) -> bool:
+        """Return job to the queue, or give up on it after max attempts"""
+        status = "failed" if job.attempts >= self.max_attempts else "pending"
+        with self._transaction():
+            cursor = self._connection.execute(
+                """
+                UPDATE jobs SET status = ?, result = ?, leased_by = NULL, lease_expires_at = NULL
+                WHERE id = ? AND status = 'leased' AND leased_by = ?
+                """,
+                (status, json.dumps({"error": error}), job.id, worker_id),
+            )
+        if status == "failed":
+            logger.error(f"Job {job.kind} {job.payload} failed after {job.attempts} attempts: {error}")
+        return cursor.rowcount > 0
+
+    def next_page_job(self, job: CrawlJob) -> dict:
+        """Build job for the search page following the given one"""
+        return self._search_job(job.query, job.page + 1)
+
+    def repository_job(self, job: CrawlJob, position: int, url: str) -> dict:
+        """Build enrichment job for repository found on a search page"""
+        return {
+            "key": f"{job.query}:repository:{url}",
+            "query": job.query,
+            "kind": "repository",
+            "page": job.page,
+            "position": position,
+            "payload": {"url": url},
+        }
+
+    def is_idle(self) -> bool:
+        """True when nothing is pending or leased"""
+        row = self._connection.execute("SELECT 1 FROM jobs WHERE status IN ('pending', 'leased') LIMIT 1").fetchone()
+        return row is None
+
+    def counts(self) -> dict[str, int]:
+        return dict(self._connection.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+
+    def results(self, key: str) -> list[SearchResult]:
+        """
+        Collect query results in search order, repositories that could not be enriched have no extra.
+        Payload enrichment is taken from summaries stored with search pages
+        """
+        query = self.get_query(key)
+        if query is None:
+            return []
+
+        if query.search_type.lower() == "repositories" and query.enrichment == "full":
+            rows = self._connection.execute(
+                """
+                SELECT status, payload, result FROM jobs
+                WHERE query = ? AND kind = 'repository' AND status IN ('done', 'failed')
+                ORDER BY page, position
+                """,
+                (key,),
+            ).fetchall()
+            return [
+                SearchResult(url=json.loads(payload)["url"], extra=json.loads(result) if status == "done" else None)
+                for status, payload, result in rows
+            ]
+
+        rows = self._connection.execute(
+            "SELECT result FROM jobs WHERE query = ? AND kind = 'search' AND status = 'done' ORDER BY page", (key,)
+        ).fetchall()
+        extras = {}
+        for (result,) in rows:
+            result = json.loads(result)
+            summaries = result.get("summaries", {})
+            for url in result["urls"]:
+                extras.setdefault(url, summaries.get(url))
+        return [SearchResult(url=url, extra=extra) for url, extra in extras.items()]
+
+    def close(self):
+        self._connection.close()
+
+    def _search_job(self, query: str, page: int) -> dict:
+        return {
+            "key": f"{query}:search:{page}",
+            "query": query,
+            "kind": "search",
+            "page": page,
+            "position": 0,
+            "payload": {"page": page},
+        }
+
+    def _insert_jobs(self, jobs: list[dict]):
+        self._connection.executemany(
+            """
+            INSERT OR IGNORE INTO jobs (key, query, kind, page, position, payload)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (job["key"], job["query"], job["kind"], job["page"], job["position"], json.dumps(job["payload"]))
+                for job in jobs
+            ],
+        )
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """BEGIN IMMEDIATE transaction, so concurrent workers never lease the same job"""
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
@@ -0,0 +1,209 @@
+"""
+Minimal in-process metrics registry with Prometheus text format export
+"""
+
+import bisect
+import logging
+import math
+import os
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+from aiohttp import web
+
+from src.settings import BYTES_BUCKETS, LATENCY_BUCKETS, METRICS_HOST
+
+logger = logging.getLogger(__name__)
+
+LabelValues = tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+class Metric(ABC):
+    """Named metric with a fixed set of label names"""
+
+    type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"Metric {self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _labels(self, key: LabelValues, **extra: str) -> dict[str, str]:
+        return {**dict(zip(self.labelnames, key, strict=True)), **extra}
+
+    @abstractmethod
+    def samples(self) -> list[tuple[str, dict[str, str], float]]: ...
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type}"]
+        lines.extend(f"{name}{_format_labels(labels)} {_format_value(value)}" for name, labels, value in self.samples())
+        return lines
+
+
+class Counter(Metric):
+    """Monotonically increasing value per label set"""
+
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str):
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> list[tuple[str, dict[str, str], float]]:
+        return [(self.name, self._labels(key), value) for key, value in sorted(self._values.items())]
+
+
+class Histogram(Metric):
+    """Observations counted into cumulative buckets per label set"""
+
+    type = "histogram"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = (), buckets: tuple[float, ...] = ()
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets or LATENCY_BUCKETS))
+        self._counts: dict[LabelValues, list[int]] = {}
+        self._sums: dict[LabelValues, float] = {}
+
+    def observe(self, value: float, **labels: str):
+        key = self._key(labels)
+        counts = self._counts.get(key)
+        if counts is None:
+            counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+            self._sums[key] = 0.0
+        counts[bisect.bisect_left(self.buckets, value)] += 1
+        self._sums[key] += value
+
+    def count(self, **labels: str) -> int:
+        return sum(self._counts.get(self._key(labels), ()))
+
+    def sum(self, **labels: str) -> float:
+        return self._sums.get(self._key(labels), 0.0)
+
+    def samples(self) -> list[tuple[str, dict[str, str], float]]:
+        samples = []
+        for key, counts in sorted(self._counts.items()):
+            cumulative = 0
+            for bound, count in zip((*self.buckets, math.inf), counts, strict=True):
+                cumulative += count
+                samples.append((f"{self.name}_bucket", self._labels(key, le=_format_value(bound)), cumulative))
+            samples.append((f"{self.name}_sum", self._labels(key), self._sums[key]))
+            samples.append((f"{self.name}_count", self._labels(key), cumulative))
+        return samples
+
+
+class MetricsRegistry:
+    """Holds metrics by name and exports them in Prometheus text format"""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+        self._runner = None
+
+    def _register(self, metric_class: type[Metric], name: str, *args, **kwargs) -> Metric:
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = metric_class(name, *args, **kwargs)
+        elif not isinstance(metric, metric_class):
+            raise ValueError(f"Metric {name} is already registered as {metric.type}")
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter, name, documentation, labelnames)
+
+    def histogram(
+        self, name: str, documentation: str, labelnames: tuple[str, ...] = (), buckets: tuple[float, ...] = ()
+    ) -> Histogram:
+        return self._register(Histogram, name, documentation, labelnames, buckets)
+
+    def render(self) -> str:
+        """Prometheus text exposition format"""
+        lines = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str | Path):
+        """Atomically write metrics to file, e.g. for node exporter textfile collector"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        tmp_path.write_text(self.render(), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    async def start_http_server(self, port: int, host: str = METRICS_HOST) -> str:
+        """Serve metrics on http://host:port/metrics until stop_http_server"""
+
+        async def metrics(request: web.Request) -> web.Response:
+            return web.Response(text=self.render(), content_type="text/plain", charset="utf-8")
+
+        app = web.Application()
+        app.router.add_get("/metrics", metrics)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        url = f"http://{host}:{site._server.sockets[0].getsockname()[1]}/metrics"
+        logger.info(f"Serving metrics on {url}")
+        return url
+
+    async def stop_http_server(self):
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+
+class CrawlMetrics:
+    """Metrics recorded by GitHubCrawler"""
+
+    def __init__(self, registry: MetricsRegistry | None = None) -> None:
+        self.registry = registry or MetricsRegistry()
+        self.requests = self.registry.counter(
+            "gitcrawler_requests_total", "HTTP requests by route and status", ("route", "status")
+        )
+        self.request_duration = self.registry.histogram(
+            "gitcrawler_request_duration_seconds", "HTTP request duration by route and proxy", ("route", "proxy")
+        )
+        self.response_bytes = self.registry.counter(
+            "gitcrawler_response_bytes_total", "Response body bytes downloaded by route", ("route",)
+        )
+        self.response_size = self.registry.histogram(
+            "gitcrawler_response_size_bytes", "Response body size by page type", ("page",), BYTES_BUCKETS
+        )
+        self.parse_duration = self.registry.histogram(
+            "gitcrawler_parse_duration_seconds", "Page parsing time by page type", ("page",)
+        )
+        self.semaphore_wait = self.registry.histogram(
+            "gitcrawler_semaphore_wait_seconds", "Time spent waiting for a concurrency slot", ("semaphore",)
+        )
+        self.results = self.registry.counter(
+            "gitcrawler_results_total", "Search results emitted by search type", ("search_type",)
+        )
@@ -1,3 +1,5 @@
+import hashlib
+import json
 from typing import Any
 
 from pydantic import BaseModel
@@ -42,6 +44,82 @@ class ProxyConfig(BaseModel):
         return cls(host=host, port=port, username=username, password=password)
 
 
+class ProxyHealth(BaseModel):
+    """Proxy health statistics and circuit breaker state"""
+
+    successes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    latency_ewma: float | None = None
+    latencies: list[float] = []
+    opened_at: float | None = None
+    cooldown: float = 0.0
+    probe_started_at: float | None = None
+
+    @property
+    def success_rate(self) -> float:
+        """Laplace-smoothed success rate, unknown proxy starts at 0.5"""
+        return (self.successes + 1) / (self.successes + self.failures + 2)
+
+    @property
+    def is_open(self) -> bool:
+        return self.opened_at is not None
+
+
+class FetchStats(BaseModel):
+    """Network attempts per fetched URL"""
+
+    urls: int = 0
+    attempts: int = 0
+    attempts_histogram: dict[int, int] = {}
+
+    def record(self, attempts: int):
+        self.urls += 1
+        self.attempts += attempts
+        self.attempts_histogram[attempts] = self.attempts_histogram.get(attempts, 0) + 1
+
+    @property
+    def amplification(self) -> float:
+        """Average number of requests sent per URL"""
+        return self.attempts / self.urls if self.urls else 0.0
+
+
+class CrawlQuery(BaseModel):
+    """Validated crawl config"""
+
+    keywords: list[str]
+    search_type: str
+    max_pages: int
+    output_format: str
+    resume: bool = False
+    proxies: list[str] = []
+    enrichment: str = "full"
+
+    @property
+    def key(self) -> str:
+        """Stable identifier of the query, independent of output options"""
+        key = json.dumps([self.search_type.lower(), self.keywords])
+        return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+    @property
+    def checkpoint_key(self) -> str:
+        """Identifier of the query together with its output options, names its checkpoint journal"""
+        key = json.dumps([self.key, self.output_format.lower(), self.enrichment])
+        return hashlib.sha256(key.encode()).hexdigest()[:16]
+
+
+class CrawlJob(BaseModel):
+    """Job leased from crawl frontier"""
+
+    id: int
+    query: str
+    kind: str
+    page: int
+    position: int = 0
+    payload: dict[str, Any]
+    attempts: int = 0
+
+
 class SearchResult(BaseModel):
     """Data class for search results"""
 
@@ -54,3 +132,14 @@ class RepositoryInfo(BaseModel):
 
     owner: str
     language_stats: dict[str, float]
+
+
+class CacheEntry(BaseModel):
+    """Cached HTTP response metadata"""
+
+    url: str
+    etag: str | None = None
+    last_modified: str | None = None
+    stored_at: float
+    last_access: float
+    size: int
@@ -0,0 +1,271 @@
+"""
+HTML parsers working on plain data only, so they can run in a thread or process pool
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any
+from urllib.parse import quote
+
+from lxml import etree, html
+
+from src.gitcrawler.seen import SeenSet
+from src.settings import GITHUB_BASE_URL, INCREMENTAL_METADATA_FIELDS, JSON_SELECTORS
+
+logger = logging.getLogger(__name__)
+
+EMBEDDED_DATA_MARKERS = (
+    'data-target="react-app.embeddedData"',
+    "data-target='react-app.embeddedData'",
+)
+EMBEDDED_DATA_MARKERS_BYTES = tuple(marker.encode() for marker in EMBEDDED_DATA_MARKERS)
+LANGUAGE_CLASS = "color-fg-default text-bold mr-1"
+
+
+def extract_urls_from_json(
+    json_data: dict, search_type: str, base_url: str = GITHUB_BASE_URL, seen: SeenSet | None = None
+) -> list[str]:
+    """Extract URLs from GitHub search JSON data, URLs already in `seen` are skipped and new ones added to it"""
+    urls = []
+    results = json_data.get("payload", {}).get("results", [])
+
+    for result in results:
+        repo = result.get("repo", {}).get("repository", {})
+        owner = repo.get("owner_login")
+        repo_name = repo.get("name")
+
+        if not owner or not repo_name:
+            continue
+
+        try:
+            match search_type:
+                case "repositories":
+                    url = f"{base_url}{owner}/{repo_name}"
+                case "issues":
+                    if number := result.get("number"):
+                        url = f"{base_url}{owner}/{repo_name}/issues/{number}"
+                    else:
+                        continue
+                case "wikis":
+                    if path := result.get("path") or result.get("title"):
+                        path = quote(path, safe="")
+                        url = f"{base_url}{owner}/{repo_name}/wiki/{path}"
+                    else:
+                        continue
+                case _:
+                    continue
+
+            if seen is not None and not seen.add(url):
+                continue
+            urls.append(url)
+        except Exception:
+            continue
+
+    return urls
+
+
+def repository_fingerprint(result: dict, fields: tuple[str, ...] = INCREMENTAL_METADATA_FIELDS) -> str | None:
+    """Hash of search result metadata fields given as dotted paths, None when none of them is present"""
+    values = []
+    for field in fields:
+        value = result
+        for key in field.split("."):
+            value = value.get(key) if isinstance(value, dict) else None
+        values.append(value)
+
+    if all(value is None for value in values):
+        return None
+    return hashlib.sha1(json.dumps(values, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def repository_summary(result: dict) -> dict[str, Any]:
+    """Owner, primary language, star count and update time of a repository search result"""
+    repo = result.get("repo", {}).get("repository", {})
+    return {
+        "owner": repo.get("owner_login"),
+        "language": result.get("language"),
+        "stars": result.get("followers"),
+        "updated_at": repo.get("updated_at"),
+    }
+
+
+def extract_repository_metadata(json_data: dict, base_url: str = GITHUB_BASE_URL) -> dict[str, dict]:
+    """Repository search results in GitHub search JSON data by repository URL"""
+    metadata = {}
+    for result in json_data.get("payload", {}).get("results", []):
+        repo = result.get("repo", {}).get("repository", {})
+        owner = repo.get("owner_login")
+        repo_name = repo.get("name")
+        if owner and repo_name:
+            metadata[f"{base_url}{owner}/{repo_name}"] = result
+    return metadata
+
+
+def extract_embedded_json(content: str | bytes) -> dict | None:
+    """
+    Slice embedded search JSON straight from the page source, without building a DOM.
+    Works on raw bytes and on decoded text, returns None when markers are not found
+    """
+    if isinstance(content, str):
+        markers, script_tag, tag_end, script_end = EMBEDDED_DATA_MARKERS, "<script", ">", "</script>"
+    else:
+        markers, script_tag, tag_end, script_end = EMBEDDED_DATA_MARKERS_BYTES, b"<script", b">", b"</script>"
+
+    for marker in markers:
+        position = content.find(marker)
+        if position == -1:
+            continue
+
+        tag_start = content.rfind(script_tag[:1], 0, position)
+        if tag_start == -1 or content[tag_start : tag_start + len(script_tag)].lower() != script_tag:
+            continue
+
+        body_start = content.find(tag_end, position)
+        body_end = content.find(script_end, body_start)
+        if body_start == -1 or body_end == -1:
+            continue
+
+        try:
+            return json.loads(content[body_start + 1 : body_end])
+        except ValueError:
+            continue
+
+    return None
+
+
+def extract_embedded_json_xpath(html_content: str | bytes) -> dict | None:
+    """Find embedded search JSON by building the DOM and trying JSON_SELECTORS in turn"""
+    tree = html.fromstring(html_content)
+
+    for selector in JSON_SELECTORS:
+        script_elements = tree.xpath(selector)
+        if script_elements:
+            return json.loads(script_elements[0])
+
+    return None
+
+
+def _extract_search_json(html_content: str | bytes) -> dict | None:
+    json_data = extract_embedded_json(html_content)
+    if json_data is None:
+        json_data = extract_embedded_json_xpath(html_content)
+    if json_data is None:
+        logger.warning("No JSON data found")
+    return json_data
+
+
+def parse_search_results(html_content: str | bytes, search_type: str, base_url: str = GITHUB_BASE_URL) -> list[str]:
+    """Parse GitHub search results HTML and extract URLs"""
+    try:
+        json_data = _extract_search_json(html_content)
+        if json_data is None:
+            return []
+
+        urls = extract_urls_from_json(json_data, search_type, base_url)
+        logger.info(f"Extracted {len(urls)} URLS")
+        return urls
+
+    except Exception as exc:
+        logger.error(f"Parsing error: {exc!r}")
+        return []
+
+
+def parse_search_page(
+    html_content: str | bytes, search_type: str, base_url: str = GITHUB_BASE_URL
+) -> tuple[list[str], dict[str, dict]]:
+    """Parse GitHub search results HTML into URLs and search results of found repositories by URL"""
+    try:
+        json_data = _extract_search_json(html_content)
+        if json_data is None:
+            return [], {}
+
+        urls = extract_urls_from_json(json_data, search_type, base_url)
+        logger.info(f"Extracted {len(urls)} URLS")
+        if search_type != "repositories":
+            return urls, {}
+        return urls, extract_repository_metadata(json_data, base_url)
+
+    except Exception as exc:
+        logger.error(f"Parsing error: {exc!r}")
+        return [], {}
+
+
+def parse_language_stats(html_content: str) -> dict[str, float]:
+    """Parse repository page HTML and extract language percentages"""
+    tree = html.fromstring(html_content)
+
+    language_stats = {}
+
+    lang_elements = tree.xpath(f'//span[@class="{LANGUAGE_CLASS}"]/text()')
+    percent_elements = tree.xpath('//span[contains(text(), "%")]/text()')
+
+    for lang, percent in zip(lang_elements, percent_elements):
+        try:
+            percent_val = float(percent.replace("%", "").strip())
+            language_stats[lang.strip()] = percent_val
+        except (ValueError, AttributeError):
+            continue
+
+    return language_stats
+
+
+class LanguageStatsParser:
+    """
+    Incremental repository page parser.
+    Pairs every language span with the next percent span and is done when the list holding them is closed
+    """
+
+    def __init__(self) -> None:
+        self.language_stats: dict[str, float] = {}
+        self.done = False
+        self.bytes_read = 0
+        self._parser = etree.HTMLPullParser(events=("end",))
+        self._language = None
+
+    def _handle(self, element) -> bool:
+        """Process closed element, returns True when language list is over"""
+        if element.tag == "span":
+            text = element.text or ""
+            if element.get("class") == LANGUAGE_CLASS:
+                self._language = text.strip()
+            elif self._language and "%" in text:
+                try:
+                    self.language_stats[self._language] = float(text.replace("%", "").strip())
+                except ValueError:
+                    pass
+                self._language = None
+        elif element.tag == "ul" and self.language_stats:
+            return True
+
+        # parsed subtrees are not needed anymore
+        element.clear(keep_tail=True)
+        while element.getprevious() is not None:
+            del element.getparent()[0]
+        return False
+
+    def _read_events(self) -> bool:
+        for _, element in self._parser.read_events():
+            if self._handle(element):
+                self.done = True
+                break
+        return self.done
+
+    def feed(self, chunk: bytes) -> bool:
+        """Feed next chunk, returns True once language stats are complete"""
+        if self.done:
+            return True
+        self.bytes_read += len(chunk)
+        self._parser.feed(chunk)
+        return self._read_events()
+
+    def close(self) -> dict[str, float]:
+        """Finish parsing and return language stats"""
+        if not self.done:
+            try:
+                self._parser.close()
+            except etree.LxmlError:
+                pass
+            self._read_events()
+            self.done = True
+        return self.language_stats
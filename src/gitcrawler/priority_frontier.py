@@ -0,0 +1,126 @@
+"""
+In-process priority frontier: bounded priority queue drained by a fixed pool of worker tasks
+"""
+
+import asyncio
+import itertools
+import logging
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from typing import Any, Generic, TypeVar
+
+from src.settings import ENRICHMENT_QUEUE_SIZE, ENRICHMENT_WORKERS
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+Handler = Callable[[Any], Awaitable[Any]]
+
+_DONE = object()
+
+
+class PriorityFrontier(Generic[T, R]):
+    """
+    Items are handled by `workers` tasks, lowest priority value first and ties in insertion order.
+    Producers block while `maxsize` items wait in the queue and every run stops feeding while `maxsize`
+    of its items are unfinished or wait for the consumer, so pending work stays bounded however many items are fed.
+    Inside `async with` the worker pool is shared by every run, each run may bring its own handler
+    """
+
+    def __init__(
+        self,
+        handler: Handler | None = None,
+        workers: int = ENRICHMENT_WORKERS,
+        maxsize: int = ENRICHMENT_QUEUE_SIZE,
+    ) -> None:
+        if workers < 1 or maxsize < 1:
+            raise ValueError("Frontier needs at least one worker and queue slot")
+        self.handler = handler
+        self.workers = workers
+        self.maxsize = maxsize
+        self._queue: asyncio.PriorityQueue | None = None
+        self._tasks: list[asyncio.Task] = []
+        self._sequence = itertools.count()
+
+    async def __aenter__(self) -> "PriorityFrontier[T, R]":
+        self._queue = asyncio.PriorityQueue(self.maxsize)
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        self._queue = None
+
+    async def _submit(self, priority: float, item: T, handler: Handler) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((priority, next(self._sequence), item, handler, future))
+        return future
+
+    async def _work(self):
+        while True:
+            _, _, item, handler, future = await self._queue.get()
+            if future.done():
+                continue
+            try:
+                result = await handler(item)
+            except Exception as exc:
+                if not future.done():
+                    future.set_exception(exc)
+                continue
+            if not future.done():
+                future.set_result(result)
+
+    async def run(self, items: Iterable[tuple[float, T]], handler: Handler | None = None) -> AsyncIterator[tuple[T, R]]:
+        """
+        Feed (priority, item) pairs through the worker pool, yield (item, result) in completion order.
+        Items that failed are skipped, a pool is started for this run when the frontier is not entered
+        """
+        handler = handler or self.handler
+        if handler is None:
+            raise ValueError("Frontier run needs a handler")
+        if self._queue is None:
+            async with self:
+                async for item, result in self.run(items, handler):
+                    yield item, result
+            return
+
+        finished = asyncio.Queue()
+        window = asyncio.Semaphore(self.maxsize)
+        futures = set()
+
+        async def produce():
+            try:
+                for priority, item in items:
+                    await window.acquire()
+                    future = await self._submit(priority, item, handler)
+                    futures.add(future)
+                    future.add_done_callback(lambda future, item=item: finished.put_nowait((item, future)))
+            finally:
+                finished.put_nowait((_DONE, None))
+
+        producer = asyncio.create_task(produce())
+        try:
+            produced = False
+            while not produced or futures:
+                item, future = await finished.get()
+                if item is _DONE:
+                    produced = True
+                    continue
+                futures.discard(future)
+                window.release()
+                if future.cancelled():
+                    continue
+                if future.exception() is not None:
+                    logger.debug(f"Error processing {item!r}: {future.exception()!r}")
+                    continue
+                yield item, future.result()
+            await producer
+        finally:
+            producer.cancel()
+            for future in futures:
+                future.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
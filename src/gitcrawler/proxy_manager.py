@@ -1,34 +1,137 @@
 import logging
+import time
+from collections.abc import Callable
 
-from src.gitcrawler.models import ProxyConfig
+from src.gitcrawler.models import ProxyConfig, ProxyHealth
+from src.settings import (
+    PROXY_COOLDOWN,
+    PROXY_FAILURE_THRESHOLD,
+    PROXY_LATENCY_ALPHA,
+    PROXY_LATENCY_WINDOW,
+    PROXY_MAX_COOLDOWN,
+    PROXY_MIN_LATENCY,
+    PROXY_TIMEOUT,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class ProxyManager:
-    """Manages proxy rotation"""
+    """
+    Manages proxy rotation.
+    Proxies are picked by smooth weighted round-robin, weight is success rate divided by EWMA latency.
+    Failing proxy is taken out by a circuit breaker and let back in after cooldown by a single half-open probe
+    """
 
-    def __init__(self, proxies: list[ProxyConfig]):
+    def __init__(
+        self,
+        proxies: list[ProxyConfig],
+        failure_threshold: int = PROXY_FAILURE_THRESHOLD,
+        cooldown: float = PROXY_COOLDOWN,
+        max_cooldown: float = PROXY_MAX_COOLDOWN,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         self.proxies = proxies
-        self.failed_proxies = set()
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.clock = clock
+        self.health = {proxy.url: ProxyHealth() for proxy in proxies}
         self.proxy_index = 0
+        self._current_weights = {proxy.url: 0.0 for proxy in proxies}
+
+    @property
+    def failed_proxies(self) -> set[str]:
+        """URLs of proxies with open circuit"""
+        return {url for url, health in self.health.items() if health.is_open}
+
+    def _is_available(self, health: ProxyHealth, now: float) -> bool:
+        if not health.is_open:
+            return True
+        if health.probe_started_at is not None and now - health.probe_started_at < PROXY_TIMEOUT:
+            return False
+        return now - health.opened_at >= health.cooldown
+
+    def _default_latency(self) -> float:
+        latencies = [health.latency_ewma for health in self.health.values() if health.latency_ewma is not None]
+        return sum(latencies) / len(latencies) if latencies else 1.0
+
+    def score(self, proxy: ProxyConfig) -> float:
+        """Selection weight of proxy"""
+        health = self.health[proxy.url]
+        latency = health.latency_ewma if health.latency_ewma is not None else self._default_latency()
+        return health.success_rate / max(latency, PROXY_MIN_LATENCY)
+
+    def latency_percentile(self, proxy: ProxyConfig, percentile: float, min_samples: int = 5) -> float | None:
+        """Latency percentile over recent successful requests, None until enough samples"""
+        latencies = sorted(self.health[proxy.url].latencies)
+        if len(latencies) < min_samples:
+            return None
+        index = min(len(latencies) - 1, max(0, round(percentile * len(latencies)) - 1))
+        return latencies[index]
 
     def get_working_proxy(self) -> ProxyConfig | None:
-        """Get a working proxy using roundrobin"""
-        available_proxies = [p for p in self.proxies if p.url not in self.failed_proxies]
+        """Get a working proxy using weighted roundrobin"""
+        now = self.clock()
+        available_proxies = [p for p in self.proxies if self._is_available(self.health[p.url], now)]
 
         if not available_proxies:
-            logger.warning("All proxies failed, resetting...")
-            self.failed_proxies.clear()
-            available_proxies = self.proxies
-
+            logger.warning("All proxies are cooling down")
             return None
 
-        proxy = available_proxies[self.proxy_index % len(available_proxies)]
+        weights = {proxy.url: self.score(proxy) for proxy in available_proxies}
+        total = sum(weights.values())
+        proxy = None
+        for candidate in available_proxies:
+            self._current_weights[candidate.url] += weights[candidate.url]
+            if proxy is None or self._current_weights[candidate.url] > self._current_weights[proxy.url]:
+                proxy = candidate
+        self._current_weights[proxy.url] -= total
+
+        health = self.health[proxy.url]
+        if health.is_open:
+            health.probe_started_at = now
+            logger.debug(f"Probing proxy: {proxy.host}:{proxy.port}")
+
         self.proxy_index += 1
         return proxy
 
+    def add_proxy(self, proxy: ProxyConfig, latency: float | None = None):
+        """Add proxy to rotation or close circuit of a known one, seeding its latency"""
+        if proxy.url not in self.health:
+            self.proxies.append(proxy)
+            self.health[proxy.url] = ProxyHealth()
+            self._current_weights[proxy.url] = 0.0
+        self.mark_proxy_success(proxy, latency)
+
+    def mark_proxy_success(self, proxy: ProxyConfig, latency: float | None = None):
+        """Record successful request and close proxy circuit"""
+        health = self.health[proxy.url]
+        health.successes += 1
+        health.consecutive_failures = 0
+        if latency is not None:
+            if health.latency_ewma is None:
+                health.latency_ewma = latency
+            else:
+                health.latency_ewma += PROXY_LATENCY_ALPHA * (latency - health.latency_ewma)
+            health.latencies.append(latency)
+            del health.latencies[:-PROXY_LATENCY_WINDOW]
+
+        if health.is_open:
+            logger.debug(f"Proxy recovered: {proxy.host}:{proxy.port}")
+        health.opened_at = None
+        health.probe_started_at = None
+        health.cooldown = 0.0
+
     def mark_proxy_failed(self, proxy: ProxyConfig):
-        """Mark proxy as failed"""
-        self.failed_proxies.add(proxy.url)
-        logger.debug(f"Proxy failed: {proxy.host}:{proxy.port}!")
+        """Record failed request, open circuit after too many consecutive failures"""
+        health = self.health[proxy.url]
+        health.failures += 1
+        health.consecutive_failures += 1
+        health.probe_started_at = None
+
+        if health.consecutive_failures >= self.failure_threshold:
+            exponent = health.consecutive_failures - self.failure_threshold
+            health.cooldown = min(self.cooldown * 2**exponent, self.max_cooldown)
+            health.opened_at = self.clock()
+            logger.debug(f"Proxy failed: {proxy.host}:{proxy.port}, cooling down for {health.cooldown:.0f}s!")
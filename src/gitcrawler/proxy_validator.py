@@ -0,0 +1,70 @@
+"""
+Proxy pre-validation: probes proxies concurrently and ranks live ones by latency
+"""
+
+import asyncio
+import logging
+import time
+from http import HTTPStatus
+
+import aiohttp
+
+from src.gitcrawler.models import ProxyConfig
+from src.settings import GITHUB_HEADERS, PROXY_PROBE_CONCURRENCY, PROXY_PROBE_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+DEAD_PROXY_STATUSES = (HTTPStatus.PROXY_AUTHENTICATION_REQUIRED, HTTPStatus.TOO_MANY_REQUESTS)
+
+
+class ProxyValidator:
+    """
+    Sends one request to `probe_url` through every proxy at once, at most `concurrency` in flight.
+    Proxy is live when it answers within `timeout` with a status below 500, except 407 and 429
+    """
+
+    def __init__(
+        self, probe_url: str, timeout: float = PROXY_PROBE_TIMEOUT, concurrency: int = PROXY_PROBE_CONCURRENCY
+    ) -> None:
+        self.probe_url = probe_url
+        self.timeout = timeout
+        self.concurrency = concurrency
+
+    async def probe(self, session: aiohttp.ClientSession, proxy: ProxyConfig) -> float | None:
+        """Latency of probe request through proxy in seconds, None when proxy is dead"""
+        started = time.monotonic()
+        try:
+            async with session.get(
+                self.probe_url,
+                proxy=proxy.url,
+                headers=GITHUB_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                allow_redirects=False,
+            ) as response:
+                await response.read()
+                if response.status >= HTTPStatus.INTERNAL_SERVER_ERROR or response.status in DEAD_PROXY_STATUSES:
+                    logger.debug(f"Proxy probe failed: {proxy.host}:{proxy.port} status {response.status}")
+                    return None
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as exc:
+            logger.debug(f"Proxy probe failed: {proxy.host}:{proxy.port} {exc!r}")
+            return None
+        return time.monotonic() - started
+
+    async def validate(
+        self, session: aiohttp.ClientSession, proxies: list[ProxyConfig]
+    ) -> tuple[list[tuple[ProxyConfig, float]], list[ProxyConfig]]:
+        """Probe all proxies, returns live proxies with latency fastest first and dead proxies"""
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def probe(proxy: ProxyConfig) -> float | None:
+            async with semaphore:
+                return await self.probe(session, proxy)
+
+        latencies = await asyncio.gather(*(probe(proxy) for proxy in proxies))
+        live = sorted(
+            ((proxy, latency) for proxy, latency in zip(proxies, latencies, strict=True) if latency is not None),
+            key=lambda item: item[1],
+        )
+        dead = [proxy for proxy, latency in zip(proxies, latencies, strict=True) if latency is None]
+        logger.info(f"Validated proxies: {len(live)} live, {len(dead)} dead")
+        return live, dead
@@ -0,0 +1,112 @@
+"""
+Compact slotted result records used on the crawl hot path.
+Pydantic models are built from them only at the public API boundary
+"""
+
+import sys
+from array import array
+from collections.abc import Iterable
+from typing import Any
+
+from src.gitcrawler.models import RepositoryInfo, SearchResult
+
+
+class RepositoryRecord:
+    """Repository owner and language stats held as parallel arrays of interned names and percentages"""
+
+    __slots__ = ("owner", "languages", "percentages")
+    fields = ("owner", "language_stats")
+
+    def __init__(self, owner: str, languages: tuple[str, ...] = (), percentages: Iterable[float] = ()) -> None:
+        self.owner = owner
+        self.languages = languages
+        self.percentages = array("d", percentages)
+
+    @classmethod
+    def from_stats(cls, owner: str, language_stats: dict[str, float]) -> "RepositoryRecord":
+        return cls(owner, tuple(sys.intern(language) for language in language_stats), language_stats.values())
+
+    @classmethod
+    def from_info(cls, info: "RepositoryRecord | RepositoryInfo") -> "RepositoryRecord":
+        """Record from a pydantic model, records are returned as is"""
+        if isinstance(info, cls):
+            return info
+        return cls.from_stats(info.owner, info.language_stats)
+
+    @property
+    def language_stats(self) -> dict[str, float]:
+        return dict(zip(self.languages, self.percentages, strict=True))
+
+    def to_dict(self) -> dict[str, Any]:
+        """Same shape as RepositoryInfo.model_dump()"""
+        return {"owner": self.owner, "language_stats": self.language_stats}
+
+    def to_model(self) -> RepositoryInfo:
+        return RepositoryInfo(owner=self.owner, language_stats=self.language_stats)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RepositoryRecord):
+            return NotImplemented
+        return (self.owner, self.languages, self.percentages) == (other.owner, other.languages, other.percentages)
+
+    def __repr__(self) -> str:
+        return f"RepositoryRecord(owner={self.owner!r}, language_stats={self.language_stats!r})"
+
+
+class RepositorySummary:
+    """Repository fields read straight from the search payload, without fetching the repository page"""
+
+    __slots__ = ("owner", "language", "stars", "updated_at")
+    fields = ("owner", "language", "stars", "updated_at")
+
+    def __init__(
+        self, owner: str, language: str | None = None, stars: int | None = None, updated_at: str | None = None
+    ) -> None:
+        self.owner = owner
+        self.language = sys.intern(language) if language else None
+        self.stars = stars
+        self.updated_at = updated_at
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"owner": self.owner, "language": self.language, "stars": self.stars, "updated_at": self.updated_at}
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, RepositorySummary):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"RepositorySummary({', '.join(f'{name}={value!r}' for name, value in self.to_dict().items())})"
+
+
+class ResultRecord:
+    """Search result URL with optional repository record or summary"""
+
+    __slots__ = ("url", "repository")
+
+    def __init__(self, url: str, repository: RepositoryRecord | RepositorySummary | None = None) -> None:
+        self.url = url
+        self.repository = repository
+
+    @classmethod
+    def from_model(cls, result: SearchResult) -> "ResultRecord":
+        extra = result.extra
+        if not extra:
+            return cls(result.url)
+        return cls(result.url, RepositoryRecord.from_stats(extra.get("owner", ""), extra.get("language_stats") or {}))
+
+    @property
+    def extra(self) -> dict[str, Any] | None:
+        """Same shape as SearchResult.extra"""
+        return self.repository.to_dict() if self.repository else None
+
+    def to_model(self) -> SearchResult:
+        return SearchResult(url=self.url, extra=self.extra)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ResultRecord):
+            return NotImplemented
+        return (self.url, self.repository) == (other.url, other.repository)
+
+    def __repr__(self) -> str:
+        return f"ResultRecord(url={self.url!r}, repository={self.repository!r})"
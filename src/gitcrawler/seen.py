@@ -0,0 +1,223 @@
+"""
+Bounded-memory seen-URL sets: exact set of 64-bit URL hashes in an open-addressing array
+and Bloom filter with configurable false-positive rate, both persistable between runs
+"""
+
+import hashlib
+import json
+import logging
+import math
+import os
+from abc import ABC, abstractmethod
+from array import array
+from pathlib import Path
+
+from src.settings import SEEN_URLS_CAPACITY, SEEN_URLS_ERROR_RATE
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"gitcrawler-seen\n"
+
+
+def url_hash(url: str) -> int:
+    """Stable 64-bit hash of URL, unlike hash() it does not change between runs"""
+    return int.from_bytes(hashlib.blake2b(url.encode(), digest_size=8).digest(), "little")
+
+
+class SeenSet(ABC):
+    """Set of seen URLs, `add` tells whether URL is new"""
+
+    kind = ""
+
+    @abstractmethod
+    def add(self, url: str) -> bool: ...
+
+    @abstractmethod
+    def __contains__(self, url: str) -> bool: ...
+
+    @abstractmethod
+    def __len__(self) -> int: ...
+
+    @abstractmethod
+    def _header(self) -> dict: ...
+
+    @abstractmethod
+    def _payload(self) -> bytes: ...
+
+    @classmethod
+    @abstractmethod
+    def _restore(cls, header: dict, payload: bytes) -> "SeenSet": ...
+
+    def save(self, path: str | Path):
+        """Atomically write set to file"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(MAGIC)
+            f.write(json.dumps({"kind": self.kind, **self._header()}).encode() + b"\n")
+            f.write(self._payload())
+        os.replace(tmp_path, path)
+        logger.info(f"Saved {len(self)} seen URLs to {path}")
+
+
+class ExactSeenSet(SeenSet):
+    """
+    Exact set of 64-bit URL hashes in a linear-probing array('Q'), about 12-24 bytes per URL.
+    Hash 0 marks an empty slot, so URL hashing to 0 is stored as 1
+    """
+
+    kind = "exact"
+    MAX_LOAD = 0.66
+
+    def __init__(self, capacity: int = 1024) -> None:
+        size = 1 << max(3, math.ceil(math.log2(max(1, capacity) / self.MAX_LOAD)))
+        self._slots = array("Q", bytes(8 * size))
+        self._count = 0
+
+    def _find(self, key: int) -> int:
+        mask = len(self._slots) - 1
+        index = key & mask
+        while self._slots[index] and self._slots[index] != key:
+            index = (index + 1) & mask
+        return index
+
+    def _grow(self):
+        old_slots = self._slots
+        self._slots = array("Q", bytes(16 * len(old_slots)))
+        for key in old_slots:
+            if key:
+                self._slots[self._find(key)] = key
+
+    def add_hash(self, key: int) -> bool:
+        key = key or 1
+        index = self._find(key)
+        if self._slots[index]:
+            return False
+        self._slots[index] = key
+        self._count += 1
+        if self._count > len(self._slots) * self.MAX_LOAD:
+            self._grow()
+        return True
+
+    def add(self, url: str) -> bool:
+        return self.add_hash(url_hash(url))
+
+    def __contains__(self, url: str) -> bool:
+        return bool(self._slots[self._find(url_hash(url) or 1)])
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _header(self) -> dict:
+        return {"count": self._count}
+
+    def _payload(self) -> bytes:
+        return self._slots.tobytes()
+
+    @classmethod
+    def _restore(cls, header: dict, payload: bytes) -> "ExactSeenSet":
+        seen = cls()
+        seen._slots = array("Q")
+        seen._slots.frombytes(payload)
+        seen._count = header["count"]
+        return seen
+
+
+class BloomSeenSet(SeenSet):
+    """
+    Bloom filter sized for `capacity` URLs at `error_rate` false positives, about 1.8 bytes per URL at 0.1%.
+    A false positive makes a new URL look seen, so it is skipped
+    """
+
+    kind = "bloom"
+
+    def __init__(self, capacity: int = SEEN_URLS_CAPACITY, error_rate: float = SEEN_URLS_ERROR_RATE) -> None:
+        if not 0 < error_rate < 1:
+            raise ValueError(f"Bloom filter error rate must be between 0 and 1, got {error_rate}")
+        self.capacity = max(1, capacity)
+        self.error_rate = error_rate
+        self.bits = max(8, math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.bits / self.capacity * math.log(2)))
+        self._array = bytearray((self.bits + 7) // 8)
+        self._count = 0
+
+    def _positions(self, url: str) -> list[int]:
+        digest = hashlib.blake2b(url.encode(), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+        return [(first + number * second) % self.bits for number in range(self.hashes)]
+
+    def add(self, url: str) -> bool:
+        is_new = False
+        for position in self._positions(url):
+            byte, bit = divmod(position, 8)
+            if not self._array[byte] & (1 << bit):
+                self._array[byte] |= 1 << bit
+                is_new = True
+        if is_new:
+            self._count += 1
+            if self._count == self.capacity + 1:
+                logger.warning(f"Bloom filter is over capacity {self.capacity}, false positive rate grows")
+        return is_new
+
+    def __contains__(self, url: str) -> bool:
+        return all(self._array[position // 8] & (1 << position % 8) for position in self._positions(url))
+
+    def __len__(self) -> int:
+        """Approximate number of added URLs"""
+        return self._count
+
+    def _header(self) -> dict:
+        return {"capacity": self.capacity, "error_rate": self.error_rate, "count": self._count}
+
+    def _payload(self) -> bytes:
+        return bytes(self._array)
+
+    @classmethod
+    def _restore(cls, header: dict, payload: bytes) -> "BloomSeenSet":
+        seen = cls(header["capacity"], header["error_rate"])
+        if len(payload) != len(seen._array):
+            raise ValueError(f"Bloom filter payload has {len(payload)} bytes, expected {len(seen._array)}")
+        seen._array[:] = payload
+        seen._count = header["count"]
+        return seen
+
+
+SEEN_SETS: dict[str, type[SeenSet]] = {
+    ExactSeenSet.kind: ExactSeenSet,
+    BloomSeenSet.kind: BloomSeenSet,
+}
+
+
+def load_seen_set(path: str | Path) -> SeenSet:
+    """Read seen set saved by SeenSet.save"""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Not a seen-URL set file: {path}")
+        header = json.loads(f.readline())
+        payload = f.read()
+    try:
+        seen_class = SEEN_SETS[header["kind"]]
+    except KeyError:
+        raise ValueError(f"Unsupported seen-URL set: {header['kind']}")
+    seen = seen_class._restore(header, payload)
+    logger.info(f"Loaded {len(seen)} seen URLs from {path}")
+    return seen
+
+
+def create_seen_set(
+    kind: str,
+    path: str | Path | None = None,
+    capacity: int = SEEN_URLS_CAPACITY,
+    error_rate: float = SEEN_URLS_ERROR_RATE,
+) -> SeenSet:
+    """Load seen set from `path` if it exists, otherwise create an empty one of given kind"""
+    if path and Path(path).exists():
+        return load_seen_set(path)
+    match kind.lower():
+        case ExactSeenSet.kind:
+            return ExactSeenSet()
+        case BloomSeenSet.kind:
+            return BloomSeenSet(capacity, error_rate)
+        case _:
+            raise ValueError(f"Unsupported seen-URL set: {kind}")
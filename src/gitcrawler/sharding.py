@@ -0,0 +1,188 @@
+"""
+Sharded runner: splits enrichment URLs or crawl configs across child processes,
+each with its own event loop, session and slice of the proxy pool
+"""
+
+import asyncio
+import logging
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from typing import Any, TypeVar
+
+from src.gitcrawler.crawler import GitHubCrawler
+from src.gitcrawler.models import RepositoryInfo, SearchResult
+from src.gitcrawler.records import RepositoryRecord
+from src.gitcrawler.store import RepositoryStore
+from src.settings import CONCURRENCY_MAX_IN_FLIGHT, GITHUB_BASE_URL, SHARD_PROCESSES
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def split_shards(items: list[T], shards: int) -> list[list[T]]:
+    """Deal items round-robin into at most `shards` non-empty shards"""
+    return [shard for shard in (items[number :: max(1, shards)] for number in range(max(1, shards))) if shard]
+
+
+def slice_proxies(proxies: list[str], shards: int) -> list[list[str]]:
+    """Give every shard its own proxies, shards share proxies only when there are fewer proxies than shards"""
+    if not proxies:
+        return [[] for _ in range(shards)]
+    if len(proxies) < shards:
+        return [[proxies[number % len(proxies)]] for number in range(shards)]
+    return [proxies[number::shards] for number in range(shards)]
+
+
+async def _enrich_urls(urls: list[str], proxies: list[str], base_url: str, output_dir: str) -> list[dict | None]:
+    crawler = GitHubCrawler(proxies=proxies, output_dir=output_dir, base_url=base_url)
+    semaphore = asyncio.Semaphore(CONCURRENCY_MAX_IN_FLIGHT)
+
+    async def enrich(url: str) -> dict | None:
+        async with semaphore:
+            repo_info = await crawler._get_repository_info(url)
+            return RepositoryRecord.from_info(repo_info).to_dict() if repo_info else None
+
+    async with crawler:
+        return await asyncio.gather(*(enrich(url) for url in urls))
+
+
+def run_enrichment_shard(urls: list[str], proxies: list[str], base_url: str, output_dir: str) -> list[dict | None]:
+    """Child process entry point, enriches repository URLs in their order"""
+    return asyncio.run(_enrich_urls(urls, proxies, base_url, output_dir))
+
+
+async def _search_configs(configs: list[dict[str, Any]], proxies: list[str], base_url: str, output_dir: str):
+    crawler = GitHubCrawler(proxies=proxies, output_dir=output_dir, base_url=base_url)
+    queries = [crawler._parse_config(config) for config in configs]
+    async with crawler:
+        results = await asyncio.gather(
+            *(
+                crawler.search(
+                    query.keywords,
+                    query.search_type,
+                    max_pages=query.max_pages,
+                    records=True,
+                    enrichment=query.enrichment,
+                )
+                for query in queries
+            ),
+            return_exceptions=True,
+        )
+    rows = []
+    for query, query_results in zip(queries, results, strict=True):
+        if isinstance(query_results, Exception):
+            logger.error(f"Query {query.search_type} {query.keywords} failed: {query_results!r}")
+            query_results = []
+        rows.append([{"url": result.url, "extra": result.extra} for result in query_results])
+    return rows
+
+
+def run_config_shard(
+    configs: list[dict[str, Any]], proxies: list[str], base_url: str, output_dir: str
+) -> list[list[dict]]:
+    """Child process entry point, runs every config and returns their results in config order"""
+    return asyncio.run(_search_configs(configs, proxies, base_url, output_dir))
+
+
+async def _run_shards(function, shards: list[list], proxies: list[str], base_url: str, output_dir: str) -> list:
+    loop = asyncio.get_running_loop()
+    proxy_slices = slice_proxies(proxies, len(shards))
+    with ProcessPoolExecutor(max_workers=len(shards), mp_context=multiprocessing.get_context("spawn")) as executor:
+        return await asyncio.gather(
+            *(
+                loop.run_in_executor(executor, function, shard, proxy_slice, base_url, output_dir)
+                for shard, proxy_slice in zip(shards, proxy_slices, strict=True)
+            )
+        )
+
+
+async def crawl_sharded(
+    config: dict[str, Any],
+    shards: int = SHARD_PROCESSES,
+    output_dir: str = "results",
+    base_url: str = GITHUB_BASE_URL,
+    repository_store: RepositoryStore | None = None,
+) -> list[SearchResult]:
+    """
+    Search in this process, then enrich found repositories in `shards` child processes.
+    Results are merged back in search order and saved to one file
+    """
+    crawler = GitHubCrawler(output_dir=output_dir, base_url=base_url, repository_store=repository_store)
+    query = crawler._apply_config(config)
+    if query.enrichment != "full":
+        # payload enrichment needs no repository page fetches, so there is nothing to shard
+        results = await crawler.search(
+            query.keywords, query.search_type, max_pages=query.max_pages, enrichment=query.enrichment
+        )
+        crawler._save_results(
+            results, query.search_type, query.keywords, query.output_format, crawler._extra_fields(query.enrichment)
+        )
+        return results
+
+    results = await crawler.search(query.keywords, query.search_type, extract_extra=False, max_pages=query.max_pages)
+
+    if query.search_type.lower() == "repositories" and results:
+        urls = [result.url for result in results]
+        known = repository_store.get_many(urls) if repository_store is not None else {}
+        pending = [url for url in urls if url not in known]
+        enriched = {url: info.model_dump() for url, info in known.items()}
+
+        url_shards = split_shards(pending, shards)
+        if url_shards:
+            logger.info(f"Enriching {len(pending)} repositories in {len(url_shards)} processes")
+            shard_results = await _run_shards(run_enrichment_shard, url_shards, query.proxies, base_url, output_dir)
+            fetched = {
+                url: extra
+                for url_shard, extras in zip(url_shards, shard_results, strict=True)
+                for url, extra in zip(url_shard, extras, strict=True)
+                if extra is not None
+            }
+            if repository_store is not None:
+                repository_store.put_many({url: RepositoryInfo(**extra) for url, extra in fetched.items()})
+            enriched.update(fetched)
+
+        results = [SearchResult(url=url, extra=enriched.get(url)) for url in urls]
+
+    crawler._save_results(results, query.search_type, query.keywords, query.output_format)
+    return results
+
+
+async def crawl_many_sharded(
+    configs: list[dict[str, Any]],
+    shards: int = SHARD_PROCESSES,
+    output_dir: str = "results",
+    base_url: str = GITHUB_BASE_URL,
+) -> list[list[SearchResult]]:
+    """
+    Run configs in `shards` child processes, then merge all results in config order into one file
+    named after the first config
+    """
+    crawler = GitHubCrawler(output_dir=output_dir, base_url=base_url)
+    queries = [crawler._parse_config(config) for config in configs]
+    if not queries:
+        return []
+
+    indexes = split_shards(list(range(len(configs))), shards)
+    proxies = list(dict.fromkeys(proxy for query in queries for proxy in query.proxies))
+    logger.info(f"Running {len(configs)} configs in {len(indexes)} processes")
+    shard_results = await _run_shards(
+        run_config_shard, [[configs[index] for index in shard] for shard in indexes], proxies, base_url, output_dir
+    )
+
+    results = [[]] * len(configs)
+    for shard, query_results in zip(indexes, shard_results, strict=True):
+        for index, items in zip(shard, query_results, strict=True):
+            results[index] = [SearchResult(**item) for item in items]
+
+    first = queries[0]
+    keywords = list(dict.fromkeys(chain.from_iterable(query.keywords for query in queries)))
+    crawler._save_results(
+        list(chain.from_iterable(results)),
+        first.search_type,
+        keywords,
+        first.output_format,
+        crawler._extra_fields(first.enrichment),
+    )
+    return results
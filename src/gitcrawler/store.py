@@ -0,0 +1,139 @@
+import json
+import logging
+import sqlite3
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from src.gitcrawler.models import RepositoryInfo
+from src.settings import REPOSITORY_STORE_MAX_AGE, REPOSITORY_STORE_PATH
+
+logger = logging.getLogger(__name__)
+
+
+class RepositoryStore:
+    """
+    Persistent SQLite store of enriched repositories keyed by repository URL.
+    Every entry carries its own expiry, stale entries are treated as missing.
+    Entries may also carry a fingerprint of search metadata for incremental recrawls
+    """
+
+    def __init__(
+        self,
+        path: str | Path = REPOSITORY_STORE_PATH,
+        max_age: float = REPOSITORY_STORE_MAX_AGE,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = Path(path)
+        if str(path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_age = max_age
+        self.clock = clock
+
+        self._connection = sqlite3.connect(str(path))
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS repositories (
+                url TEXT PRIMARY KEY,
+                owner TEXT NOT NULL,
+                language_stats TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                fingerprint TEXT
+            )
+            """
+        )
+        columns = {row[1] for row in self._connection.execute("PRAGMA table_info(repositories)")}
+        if "fingerprint" not in columns:
+            self._connection.execute("ALTER TABLE repositories ADD COLUMN fingerprint TEXT")
+        self._connection.commit()
+
+    def get_many(self, urls: list[str]) -> dict[str, RepositoryInfo]:
+        """Return fresh repositories for given URLs with a single query"""
+        if not urls:
+            return {}
+
+        rows = self._connection.execute(
+            """
+            SELECT url, owner, language_stats FROM repositories
+            WHERE url IN (SELECT value FROM json_each(?)) AND expires_at > ?
+            """,
+            (json.dumps(urls), self.clock()),
+        ).fetchall()
+
+        return {
+            url: RepositoryInfo(owner=owner, language_stats=json.loads(language_stats))
+            for url, owner, language_stats in rows
+        }
+
+    def get_unchanged(self, fingerprints: dict[str, str]) -> dict[str, RepositoryInfo]:
+        """Return repositories stored with the same fingerprint, regardless of their expiry"""
+        if not fingerprints:
+            return {}
+
+        rows = self._connection.execute(
+            """
+            SELECT url, owner, language_stats FROM repositories
+            JOIN json_each(?) AS given ON repositories.url = given.key
+            WHERE repositories.fingerprint = given.value
+            """,
+            (json.dumps(fingerprints),),
+        ).fetchall()
+
+        return {
+            url: RepositoryInfo(owner=owner, language_stats=json.loads(language_stats))
+            for url, owner, language_stats in rows
+        }
+
+    def get(self, url: str) -> RepositoryInfo | None:
+        """Return fresh repository or None"""
+        return self.get_many([url]).get(url)
+
+    def put_many(
+        self,
+        repositories: dict[str, RepositoryInfo],
+        max_age: float | None = None,
+        fingerprints: dict[str, str] | None = None,
+    ):
+        """Insert or refresh repositories in one transaction, repositories without fingerprint lose the stored one"""
+        if not repositories:
+            return
+
+        fingerprints = fingerprints or {}
+        now = self.clock()
+        expires_at = now + (self.max_age if max_age is None else max_age)
+        with self._connection:
+            self._connection.executemany(
+                """
+                INSERT INTO repositories (url, owner, language_stats, fetched_at, expires_at, fingerprint)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(url) DO UPDATE SET
+                    owner = excluded.owner,
+                    language_stats = excluded.language_stats,
+                    fetched_at = excluded.fetched_at,
+                    expires_at = excluded.expires_at,
+                    fingerprint = excluded.fingerprint
+                """,
+                [
+                    (url, info.owner, json.dumps(info.language_stats), now, expires_at, fingerprints.get(url))
+                    for url, info in repositories.items()
+                ],
+            )
+        logger.debug(f"Stored {len(repositories)} repositories")
+
+    def put(self, url: str, info: RepositoryInfo, max_age: float | None = None):
+        """Insert or refresh single repository"""
+        self.put_many({url: info}, max_age=max_age)
+
+    def purge_expired(self) -> int:
+        """Delete stale entries, returns number of deleted rows"""
+        with self._connection:
+            cursor = self._connection.execute("DELETE FROM repositories WHERE expires_at <= ?", (self.clock(),))
+        return cursor.rowcount
+
+    def close(self):
+        self._connection.close()
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM repositories").fetchone()[0]
@@ -0,0 +1,209 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Mapping
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+
+from src.settings import (
+    AIMD_DECREASE,
+    AIMD_INCREASE,
+    CONCURRENCY_MAX_IN_FLIGHT,
+    DIRECT_MAX_IN_FLIGHT,
+    PROXY_MAX_IN_FLIGHT,
+    RETRY_AFTER_MAX,
+)
+
+logger = logging.getLogger(__name__)
+
+THROTTLE_STATUSES = (HTTPStatus.TOO_MANY_REQUESTS, HTTPStatus.FORBIDDEN)
+SUCCESS_STATUSES = (HTTPStatus.OK, HTTPStatus.NOT_MODIFIED)
+
+
+def parse_retry_after(
+    value: str | None, now: Callable[[], datetime] = lambda: datetime.now(timezone.utc)
+) -> float | None:
+    """Parse Retry-After header given in seconds or as HTTP date"""
+    if not isinstance(value, str) or not value.strip():
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return min(float(value), RETRY_AFTER_MAX)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return min(max((retry_at - now()).total_seconds(), 0.0), RETRY_AFTER_MAX)
+
+
+class AdaptiveLimiter:
+    """
+    In-flight request limit adjusted with additive-increase / multiplicative-decrease.
+    Limit is decreased at most once per congestion epoch: only requests started after
+    the previous decrease can trigger the next one
+    """
+
+    def __init__(
+        self,
+        initial: float,
+        maximum: float,
+        minimum: float = 1.0,
+        increase: float = AIMD_INCREASE,
+        decrease: float = AIMD_DECREASE,
+        name: str = "",
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.limit = float(min(max(initial, minimum), maximum))
+        self.maximum = float(maximum)
+        self.minimum = float(minimum)
+        self.increase = increase
+        self.decrease = decrease
+        self.name = name
+        self.clock = clock
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self.epoch = 0
+        self._waiters: deque[asyncio.Future] = deque()
+
+    async def acquire(self) -> int:
+        """Wait for free slot, returns congestion epoch of the request"""
+        while True:
+            pause = self.paused_until - self.clock()
+            if pause > 0:
+                await asyncio.sleep(pause)
+                continue
+
+            if self.in_flight < int(self.limit):
+                self.in_flight += 1
+                return self.epoch
+
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                elif not waiter.cancelled():
+                    self._wake()
+                raise
+
+    def release(self):
+        self.in_flight -= 1
+        self._wake()
+
+    def _wake(self):
+        free = int(self.limit) - self.in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    def on_success(self):
+        """Additive increase: about +increase per limit-worth of successful requests"""
+        self.limit = min(self.maximum, self.limit + self.increase / self.limit)
+        self._wake()
+
+    def on_throttle(self, epoch: int, retry_after: float | None = None):
+        """Multiplicative decrease, optionally pausing new requests for retry_after seconds"""
+        if retry_after:
+            self.paused_until = max(self.paused_until, self.clock() + retry_after)
+        if epoch != self.epoch:
+            return
+        self.epoch += 1
+        self.limit = max(self.minimum, self.limit * self.decrease)
+        logger.info(f"Throttled {self.name or 'requests'}: limit {self.limit:.1f}, retry after {retry_after or 0:.0f}s")
+
+
+class RequestFeedback:
+    """Response signals reported back to the concurrency controller"""
+
+    def __init__(self) -> None:
+        self.status: int | None = None
+        self.retry_after: float | None = None
+        self.bytes_read = 0
+        self.started = asyncio.Event()
+        self.latency: float | None = None
+
+    def record(self, status: int, headers: Mapping[str, str] | None = None):
+        self.status = status
+        if isinstance(headers, Mapping):
+            self.retry_after = parse_retry_after(headers.get("Retry-After"))
+
+    def record_bytes(self, response):
+        """Remember how many body bytes were read from response"""
+        total_bytes = getattr(getattr(response, "content", None), "total_bytes", None)
+        if isinstance(total_bytes, int):
+            self.bytes_read = total_bytes
+
+    @property
+    def throttled(self) -> bool:
+        return self.status in THROTTLE_STATUSES
+
+    @property
+    def succeeded(self) -> bool:
+        return self.status in SUCCESS_STATUSES
+
+
+class ConcurrencyController:
+    """
+    Crawler-wide in-flight request budget.
+    Every request takes a slot from the global limiter and from its lane:
+    one lane for direct traffic and one per proxy
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = CONCURRENCY_MAX_IN_FLIGHT,
+        direct_max_in_flight: int = DIRECT_MAX_IN_FLIGHT,
+        proxy_max_in_flight: int = PROXY_MAX_IN_FLIGHT,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.clock = clock
+        self.proxy_max_in_flight = proxy_max_in_flight
+        self.total = AdaptiveLimiter(max_in_flight / 2, max_in_flight, name="total", clock=clock)
+        self.direct = AdaptiveLimiter(direct_max_in_flight / 2, direct_max_in_flight, name="direct", clock=clock)
+        self.proxies: dict[str, AdaptiveLimiter] = {}
+
+    def lane(self, proxy_url: str | None = None) -> AdaptiveLimiter:
+        if proxy_url is None:
+            return self.direct
+        if proxy_url not in self.proxies:
+            self.proxies[proxy_url] = AdaptiveLimiter(
+                self.proxy_max_in_flight / 2, self.proxy_max_in_flight, name=proxy_url, clock=self.clock
+            )
+        return self.proxies[proxy_url]
+
+    @asynccontextmanager
+    async def slot(
+        self, proxy_url: str | None = None, feedback: RequestFeedback | None = None
+    ) -> AsyncIterator[RequestFeedback]:
+        """
+        Hold one lane and one global slot for the duration of a request.
+        Lane slot is taken first, so a lane paused by Retry-After holds no global slots while it waits
+        """
+        lane = self.lane(proxy_url)
+        if feedback is None:
+            feedback = RequestFeedback()
+        lane_epoch = await lane.acquire()
+        try:
+            total_epoch = await self.total.acquire()
+            try:
+                feedback.started.set()
+                yield feedback
+            finally:
+                if feedback.throttled:
+                    lane.on_throttle(lane_epoch, feedback.retry_after)
+                    self.total.on_throttle(total_epoch)
+                elif feedback.succeeded:
+                    lane.on_success()
+                    self.total.on_success()
+                self.total.release()
+        finally:
+            lane.release()
@@ -0,0 +1,157 @@
+"""
+Per-request timing traces collected with aiohttp TraceConfig hooks and written as JSON Lines
+"""
+
+import json
+import logging
+import time
+from pathlib import Path
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+class RequestTrace:
+    """Timestamps of a single request, monotonic seconds"""
+
+    __slots__ = (
+        "url",
+        "kind",
+        "proxy",
+        "started_at",
+        "started",
+        "queued_start",
+        "queued_end",
+        "dns_start",
+        "dns_end",
+        "dns_cache_hit",
+        "connect_start",
+        "connect_end",
+        "reused",
+        "headers_sent",
+        "response_start",
+        "bytes",
+        "status",
+        "error",
+    )
+
+    def __init__(self, url: str, kind: str, proxy: str | None) -> None:
+        self.url = url
+        self.kind = kind
+        self.proxy = proxy
+        self.started_at = time.time()
+        self.started = time.monotonic()
+        self.queued_start = self.queued_end = None
+        self.dns_start = self.dns_end = None
+        self.dns_cache_hit = None
+        self.connect_start = self.connect_end = None
+        self.reused = False
+        self.headers_sent = None
+        self.response_start = None
+        self.bytes = 0
+        self.status = None
+        self.error = None
+
+    @staticmethod
+    def _span(start: float | None, end: float | None) -> float | None:
+        return round(end - start, 6) if start is not None and end is not None else None
+
+    def to_dict(self, finished: float) -> dict:
+        """
+        Phase durations in seconds, None when the phase did not happen.
+        aiohttp has no separate hooks for proxy CONNECT and TLS, both are part of "connect"
+        """
+        return {
+            "ts": self.started_at,
+            "url": self.url,
+            "kind": self.kind,
+            "proxy": self.proxy,
+            "status": self.status,
+            "error": self.error,
+            "queued": self._span(self.queued_start, self.queued_end),
+            "dns": self._span(self.dns_start, self.dns_end),
+            "dns_cache_hit": self.dns_cache_hit,
+            "connect": self._span(self.connect_start, self.connect_end),
+            "reused": self.reused,
+            "ttfb": self._span(self.headers_sent or self.started, self.response_start),
+            "body": self._span(self.response_start, finished),
+            "total": round(finished - self.started, 6),
+            "bytes": self.bytes,
+        }
+
+
+class RequestTracer:
+    """Builds TraceConfig for crawler session and appends finished request traces to JSONL file"""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.count = 0
+        self._file = None
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_queued_start.append(self._set("queued_start"))
+        trace_config.on_connection_queued_end.append(self._set("queued_end"))
+        trace_config.on_dns_resolvehost_start.append(self._set("dns_start"))
+        trace_config.on_dns_resolvehost_end.append(self._set("dns_end"))
+        trace_config.on_dns_cache_hit.append(self._flag("dns_cache_hit", True))
+        trace_config.on_dns_cache_miss.append(self._flag("dns_cache_hit", False))
+        trace_config.on_connection_create_start.append(self._set("connect_start"))
+        trace_config.on_connection_create_end.append(self._set("connect_end"))
+        trace_config.on_connection_reuseconn.append(self._flag("reused", True))
+        trace_config.on_request_headers_sent.append(self._set("headers_sent"))
+        trace_config.on_request_end.append(self._on_request_end)
+        trace_config.on_response_chunk_received.append(self._on_chunk)
+        trace_config.on_request_exception.append(self._on_exception)
+        return trace_config
+
+    @staticmethod
+    def _trace(trace_config_ctx) -> RequestTrace | None:
+        trace = trace_config_ctx.trace_request_ctx
+        return trace if isinstance(trace, RequestTrace) else None
+
+    def _set(self, attribute: str):
+        async def hook(session, trace_config_ctx, params):
+            if trace := self._trace(trace_config_ctx):
+                setattr(trace, attribute, time.monotonic())
+
+        return hook
+
+    def _flag(self, attribute: str, value: bool):
+        async def hook(session, trace_config_ctx, params):
+            if trace := self._trace(trace_config_ctx):
+                setattr(trace, attribute, value)
+
+        return hook
+
+    async def _on_request_end(self, session, trace_config_ctx, params):
+        if trace := self._trace(trace_config_ctx):
+            trace.response_start = time.monotonic()
+            trace.status = params.response.status
+
+    async def _on_chunk(self, session, trace_config_ctx, params):
+        if trace := self._trace(trace_config_ctx):
+            trace.bytes += len(params.chunk)
+
+    async def _on_exception(self, session, trace_config_ctx, params):
+        if trace := self._trace(trace_config_ctx):
+            trace.error = repr(params.exception)
+
+    def start(self, url: str, kind: str, proxy: str | None = None) -> RequestTrace:
+        """New trace, passed to request as trace_request_ctx"""
+        return RequestTrace(url, kind, proxy)
+
+    def finish(self, trace: RequestTrace):
+        """Write trace once response body is read or request failed"""
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps(trace.to_dict(time.monotonic())) + "\n")
+        self.count += 1
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+            logger.info(f"Wrote {self.count} request traces to {self.path}")
@@ -0,0 +1,198 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import socket
+import time
+from pathlib import Path
+from typing import Any
+
+from src.gitcrawler.crawler import GitHubCrawler
+from src.gitcrawler.frontier import CrawlFrontier
+from src.gitcrawler.models import CrawlJob, SearchResult
+from src.gitcrawler.parsers import repository_summary
+from src.gitcrawler.records import RepositoryRecord, RepositorySummary
+from src.settings import (
+    FRONTIER_LEASE_RENEW_INTERVAL,
+    FRONTIER_LEASE_TIMEOUT,
+    FRONTIER_PATH,
+    FRONTIER_POLL_INTERVAL,
+    GITHUB_SEARCH_PAGE_LIMIT,
+    WORKER_JOBS_IN_FLIGHT,
+    WORKER_PROCESSES,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlWorker:
+    """Pulls search and enrichment jobs from a shared frontier and stores their results back into it"""
+
+    def __init__(
+        self,
+        frontier: CrawlFrontier,
+        crawler: GitHubCrawler,
+        worker_id: str | None = None,
+        jobs_in_flight: int = WORKER_JOBS_IN_FLIGHT,
+        lease_timeout: float = FRONTIER_LEASE_TIMEOUT,
+        poll_interval: float = FRONTIER_POLL_INTERVAL,
+        renew_interval: float = FRONTIER_LEASE_RENEW_INTERVAL,
+    ) -> None:
+        self.frontier = frontier
+        self.crawler = crawler
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.jobs_in_flight = jobs_in_flight
+        self.lease_timeout = lease_timeout
+        self.poll_interval = poll_interval
+        self.renew_interval = renew_interval
+        self.completed = 0
+
+    async def run(self, stop_when_idle: bool = True):
+        """
+        Process jobs until the frontier is drained, or forever when stop_when_idle is False.
+        Leases of in-flight jobs are renewed every renew_interval while they run
+        """
+        tasks = set()
+        leased: dict[asyncio.Task, CrawlJob] = {}
+        renewed_at = time.monotonic()
+        async with self.crawler:
+            try:
+                while True:
+                    if len(tasks) < self.jobs_in_flight:
+                        jobs = self.frontier.lease(self.worker_id, self.jobs_in_flight - len(tasks), self.lease_timeout)
+                        for job in jobs:
+                            task = asyncio.create_task(self._process(job))
+                            leased[task] = job
+                            tasks.add(task)
+
+                    for task in [task for task in leased if task.done()]:
+                        del leased[task]
+                    if leased and time.monotonic() - renewed_at >= self.renew_interval:
+                        self.frontier.renew(list(leased.values()), self.worker_id, self.lease_timeout)
+                        renewed_at = time.monotonic()
+
+                    if not tasks:
+                        if stop_when_idle and self.frontier.is_idle():
+                            break
+                        await asyncio.sleep(self.poll_interval)
+                        continue
+
+                    _, tasks = await asyncio.wait(
+                        tasks, timeout=self.poll_interval, return_when=asyncio.FIRST_COMPLETED
+                    )
+            finally:
+                await self.crawler._cancel_tasks(tasks)
+
+        logger.info(f"Worker {self.worker_id} completed {self.completed} jobs")
+
+    async def _process(self, job: CrawlJob):
+        try:
+            match job.kind:
+                case "search":
+                    done = await self._process_search(job)
+                case "repository":
+                    done = await self._process_repository(job)
+                case _:
+                    raise ValueError(f"Unknown job kind: {job.kind}")
+        except Exception as exc:
+            self.frontier.fail(job, self.worker_id, repr(exc))
+            return
+
+        if done:
+            self.completed += 1
+
+    async def _process_search(self, job: CrawlJob) -> bool:
+        query = self.frontier.get_query(job.query)
+        search_type = query.search_type.lower()
+        html_content = await self.crawler._fetch_page(
+            self.crawler._build_search_url(query.keywords, search_type, job.page)
+        )
+        if not html_content:
+            return self.frontier.fail(job, self.worker_id, "No content")
+
+        enrichment = query.enrichment if search_type == "repositories" else "none"
+        metadata = {} if enrichment == "payload" else None
+        urls = await self.crawler._parse_search_page(html_content, search_type, metadata)
+        result = {"urls": urls}
+        new_jobs = []
+        if urls and job.page < min(query.max_pages, GITHUB_SEARCH_PAGE_LIMIT):
+            new_jobs.append(self.frontier.next_page_job(job))
+        if enrichment == "full":
+            new_jobs.extend(self.frontier.repository_job(job, position, url) for position, url in enumerate(urls))
+        elif enrichment == "payload":
+            # payload enrichment is read from the search page, repository pages are not fetched
+            result["summaries"] = {
+                url: RepositorySummary(**repository_summary(metadata[url])).to_dict() for url in urls if url in metadata
+            }
+
+        return self.frontier.complete(job, self.worker_id, result, new_jobs)
+
+    async def _process_repository(self, job: CrawlJob) -> bool:
+        url = job.payload["url"]
+        store = self.crawler.repository_store
+        repo_info = store.get(url) if store is not None else None
+        if repo_info is None:
+            repo_info = await self.crawler._get_repository_info(url)
+            if repo_info is None:
+                return self.frontier.fail(job, self.worker_id, "No repository info")
+            if store is not None:
+                store.put(url, repo_info)
+
+        return self.frontier.complete(job, self.worker_id, RepositoryRecord.from_info(repo_info).to_dict())
+
+
+def run_worker(frontier_path: str, worker_id: str, proxies: list[str], output_dir: str):
+    """Worker process entry point, every process has its own event loop, session and database connection"""
+    frontier = CrawlFrontier(frontier_path)
+    try:
+        worker = CrawlWorker(frontier, GitHubCrawler(proxies=proxies, output_dir=output_dir), worker_id)
+        asyncio.run(worker.run())
+    finally:
+        frontier.close()
+
+
+def run_workers(
+    configs: list[dict[str, Any]],
+    workers: int = WORKER_PROCESSES,
+    frontier_path: str | Path = FRONTIER_PATH,
+    output_dir: str = "results",
+) -> list[list[SearchResult]]:
+    """
+    Queue configs into the frontier, crawl them with worker processes and save every query to its own file.
+    Workers on other hosts may join by calling run_worker on the same frontier
+    """
+    crawler = GitHubCrawler(output_dir=output_dir)
+    queries = [crawler._parse_config(config) for config in configs]
+    proxies = list(dict.fromkeys(proxy for query in queries for proxy in query.proxies))
+
+    frontier = CrawlFrontier(frontier_path)
+    try:
+        for query in queries:
+            frontier.add_query(query)
+
+        context = multiprocessing.get_context("spawn")
+        hostname = socket.gethostname()
+        processes = [
+            context.Process(target=run_worker, args=(str(frontier_path), f"{hostname}:{number}", proxies, output_dir))
+            for number in range(max(1, workers))
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        logger.info(f"Workers finished, jobs: {frontier.counts()}")
+
+        results = []
+        for query in queries:
+            query_results = frontier.results(query.key)
+            crawler._save_results(
+                query_results,
+                query.search_type,
+                query.keywords,
+                query.output_format,
+                crawler._extra_fields(query.enrichment),
+            )
+            results.append(query_results)
+        return results
+    finally:
+        frontier.close()
@@ -0,0 +1,229 @@
+import csv
+import json
+import logging
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+from src.gitcrawler.models import SearchResult
+from src.gitcrawler.records import RepositoryRecord, ResultRecord
+from src.settings import PARQUET_ROW_GROUP_SIZE
+
+logger = logging.getLogger(__name__)
+
+
+class ResultWriter(ABC):
+    """Base class for incremental result writers, `extra_fields` are the repository columns after url"""
+
+    extension = ""
+
+    def __init__(
+        self,
+        filepath: Path,
+        search_type: str,
+        with_extra: bool = True,
+        append: bool = True,
+        extra_fields: tuple[str, ...] = RepositoryRecord.fields,
+    ) -> None:
+        self.filepath = Path(filepath)
+        self.search_type = search_type
+        self.with_extra = search_type == "repositories" and with_extra
+        self.extra_fields = extra_fields if self.with_extra else ()
+        self.append = append
+        self.count = 0
+
+    @classmethod
+    def check_dependencies(cls):
+        """Raise ImportError when optional dependencies of the format are missing"""
+        return None
+
+    @abstractmethod
+    def open(self) -> "ResultWriter": ...
+
+    @abstractmethod
+    def write(self, result: SearchResult | ResultRecord): ...
+
+    @abstractmethod
+    def close(self): ...
+
+    def __enter__(self) -> "ResultWriter":
+        return self.open()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class CsvResultWriter(ResultWriter):
+    """Incremental CSV writer, every row is flushed to disk as soon as it is written"""
+
+    extension = "csv"
+
+    def __init__(
+        self,
+        filepath: Path,
+        search_type: str,
+        with_extra: bool = True,
+        append: bool = True,
+        extra_fields: tuple[str, ...] = RepositoryRecord.fields,
+    ) -> None:
+        super().__init__(filepath, search_type, with_extra, append, extra_fields)
+        self.fieldnames = ["url", *self.extra_fields]
+        self._file = None
+        self._writer = None
+
+    def open(self) -> "CsvResultWriter":
+        """Open file for writing, in append mode header is written only for a new file"""
+        is_new = not self.append or not self.filepath.exists() or self.filepath.stat().st_size == 0
+        self._file = open(self.filepath, "a" if self.append else "w", newline="", encoding="utf-8")
+        self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames)
+        if is_new:
+            self._writer.writeheader()
+            self._file.flush()
+        return self
+
+    def write(self, result: SearchResult | ResultRecord):
+        """Append single result row"""
+        row = {"url": result.url}
+        if self.with_extra and result.extra:
+            for field in self.extra_fields:
+                value = result.extra.get(field)
+                row[field] = json.dumps(value) if isinstance(value, dict | list) else value
+        self._writer.writerow(row)
+        self._file.flush()
+        self.count += 1
+
+    def close(self):
+        """Close underlying file"""
+        if self._file:
+            self._file.close()
+            self._file = None
+            self._writer = None
+
+
+class JsonlResultWriter(ResultWriter):
+    """Streaming JSON Lines writer, language stats stay a JSON object"""
+
+    extension = "jsonl"
+
+    def __init__(
+        self,
+        filepath: Path,
+        search_type: str,
+        with_extra: bool = True,
+        append: bool = True,
+        extra_fields: tuple[str, ...] = RepositoryRecord.fields,
+    ) -> None:
+        super().__init__(filepath, search_type, with_extra, append, extra_fields)
+        self._file = None
+
+    def open(self) -> "JsonlResultWriter":
+        self._file = open(self.filepath, "a" if self.append else "w", encoding="utf-8")
+        return self
+
+    def write(self, result: SearchResult | ResultRecord):
+        """Append single result line"""
+        row = {"url": result.url}
+        if self.with_extra:
+            extra = result.extra or {}
+            row.update({field: extra.get(field) for field in self.extra_fields})
+        self._file.write(json.dumps(row, ensure_ascii=False) + "\n")
+        self._file.flush()
+        self.count += 1
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+
+class ParquetResultWriter(ResultWriter):
+    """
+    Columnar Parquet writer, language stats are stored as map<string, double> column.
+    Rows are buffered and written in row groups, parquet files cannot be appended to
+    """
+
+    extension = "parquet"
+
+    def __init__(
+        self,
+        filepath: Path,
+        search_type: str,
+        with_extra: bool = True,
+        append: bool = False,
+        row_group_size: int = PARQUET_ROW_GROUP_SIZE,
+        extra_fields: tuple[str, ...] = RepositoryRecord.fields,
+    ) -> None:
+        if append:
+            raise ValueError("Parquet output does not support appending")
+        super().__init__(filepath, search_type, with_extra, append, extra_fields)
+        self.check_dependencies()
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self._pa = pa
+        self._pq = pq
+        self.row_group_size = row_group_size
+        field_types = {
+            "owner": pa.string(),
+            "language_stats": pa.map_(pa.string(), pa.float64()),
+            "language": pa.string(),
+            "stars": pa.int64(),
+            "updated_at": pa.string(),
+        }
+        fields = [pa.field("url", pa.string(), nullable=False)]
+        fields += [pa.field(field, field_types[field]) for field in self.extra_fields]
+        self.schema = pa.schema(fields)
+        self._columns = {field.name: [] for field in fields}
+        self._writer = None
+
+    @classmethod
+    def check_dependencies(cls):
+        try:
+            import pyarrow  # noqa: F401
+            import pyarrow.parquet  # noqa: F401
+        except ImportError:
+            raise ImportError("Parquet output requires pyarrow: pip install pyarrow")
+
+    def open(self) -> "ParquetResultWriter":
+        self._writer = self._pq.ParquetWriter(self.filepath, self.schema)
+        return self
+
+    def write(self, result: SearchResult | ResultRecord):
+        """Buffer single result, full row group is flushed to disk"""
+        self._columns["url"].append(result.url)
+        extra = result.extra or {}
+        for field in self.extra_fields:
+            value = extra.get(field)
+            self._columns[field].append(list(value.items()) if isinstance(value, dict) else value)
+        self.count += 1
+
+        if len(self._columns["url"]) >= self.row_group_size:
+            self._flush()
+
+    def _flush(self):
+        if not self._columns["url"]:
+            return
+        table = self._pa.Table.from_pydict(self._columns, schema=self.schema)
+        self._writer.write_table(table)
+        for column in self._columns.values():
+            column.clear()
+
+    def close(self):
+        if self._writer:
+            self._flush()
+            self._writer.close()
+            self._writer = None
+
+
+RESULT_WRITERS: dict[str, type[ResultWriter]] = {
+    CsvResultWriter.extension: CsvResultWriter,
+    JsonlResultWriter.extension: JsonlResultWriter,
+    ParquetResultWriter.extension: ParquetResultWriter,
+}
+
+
+def get_result_writer(output_format: str) -> type[ResultWriter]:
+    """Get writer class by output format name"""
+    try:
+        return RESULT_WRITERS[output_format.lower()]
+    except KeyError:
+        raise ValueError(f"Unsupported output format: {output_format}")
@@ -1,7 +1,21 @@
 import logging
 
+from src.gitcrawler.cache import ResponseCache
 from src.gitcrawler.crawler import GitHubCrawler
-from src.settings import PROXY_LIST, SEARCHING_KEYWORDS, SEARCHING_TYPE
+from src.gitcrawler.seen import create_seen_set
+from src.gitcrawler.store import RepositoryStore
+from src.settings import (
+    ENRICHMENT,
+    METRICS_PATH,
+    METRICS_PORT,
+    OUTPUT_FORMAT,
+    PROXY_LIST,
+    SEARCH_MAX_PAGES,
+    SEARCHING_KEYWORDS,
+    SEARCHING_TYPE,
+    SEEN_URLS,
+    SEEN_URLS_PATH,
+)
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(
@@ -17,12 +31,22 @@ async def main():
         "keywords": SEARCHING_KEYWORDS,
         "proxies": PROXY_LIST,
         "type": SEARCHING_TYPE,
+        "max_pages": SEARCH_MAX_PAGES,
+        "format": OUTPUT_FORMAT,
+        "enrichment": ENRICHMENT,
     }
 
-    crawler = GitHubCrawler()
+    cache = ResponseCache()
+    repository_store = RepositoryStore()
+    seen_urls = create_seen_set(SEEN_URLS, SEEN_URLS_PATH) if SEEN_URLS else None
+    crawler = GitHubCrawler(cache=cache, repository_store=repository_store, seen_urls=seen_urls)
+    if METRICS_PORT is not None:
+        await crawler.metrics.registry.start_http_server(METRICS_PORT)
 
     try:
         results = await crawler.crawl(config)
+        if seen_urls is not None and SEEN_URLS_PATH:
+            seen_urls.save(SEEN_URLS_PATH)
         logger.info(f"Found {len(results)} results:")
         for i, result in enumerate(results[:5], 1):
             logger.info(f"{i}. {result.url}")
@@ -34,3 +58,11 @@ async def main():
 
     except Exception as exc:
         logger.error(f"Error: {exc!r}")
+
+    finally:
+        repository_store.close()
+        if METRICS_PATH:
+            crawler.metrics.registry.write(METRICS_PATH)
+        await crawler.metrics.registry.stop_http_server()
+
+    logger.info(f"Response cache: {cache.stats}")
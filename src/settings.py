@@ -1,4 +1,5 @@
 import logging
+import os
 
 GITHUB_BASE_URL = "https://github.com/"
 GITHUB_BASE_URL_SEARCH = GITHUB_BASE_URL + "search"
@@ -9,9 +10,109 @@ GITHUB_HEADERS = {
 }
 
 PROXY_TIMEOUT = 3
+PROXY_FAILURE_THRESHOLD = 1
+PROXY_COOLDOWN = 30
+PROXY_MAX_COOLDOWN = 10 * 60
+PROXY_LATENCY_ALPHA = 0.3
+PROXY_MIN_LATENCY = 0.05
+PROXY_LATENCY_WINDOW = 50
+
+# Proxy pre-validation: probe all proxies concurrently before crawling, keep live ones ranked by latency
+# and re-probe every PROXY_REPROBE_INTERVAL seconds in background, None disables re-probing
+PROXY_VALIDATE = False
+PROXY_PROBE_TIMEOUT = PROXY_TIMEOUT
+PROXY_PROBE_CONCURRENCY = 50
+PROXY_REPROBE_INTERVAL = 60
+
+HEDGE_REQUESTS = True
+HEDGE_PERCENTILE = 0.95
+HEDGE_DEFAULT_DELAY = 1.0
+HEDGE_MIN_DELAY = 0.05
 DIRECT_TIMEOUT = 10
 MAX_CONCURRENT = 3
 
+CONCURRENCY_MAX_IN_FLIGHT = 32
+DIRECT_MAX_IN_FLIGHT = 8
+PROXY_MAX_IN_FLIGHT = 4
+AIMD_INCREASE = 1.0
+AIMD_DECREASE = 0.5
+RETRY_AFTER_MAX = 5 * 60
+
+CONNECTION_LIMIT = 20
+CONNECTION_LIMIT_PER_HOST = 10
+KEEPALIVE_TIMEOUT = 30
+DNS_CACHE_TTL = 300
+
+CACHE_DIR = ".cache/http"
+CACHE_TTL = 60 * 60
+CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+REPOSITORY_STORE_PATH = ".cache/repositories.sqlite3"
+REPOSITORY_STORE_MAX_AGE = 24 * 60 * 60
+REPOSITORY_STORE_BATCH_SIZE = 100
+
+# Repository enrichment: "full" fetches every repository page for the language breakdown,
+# "payload" reads owner, primary language, stars and update time from the search JSON, "none" keeps URLs only
+ENRICHMENT = "full"
+# Full enrichment fetches repository pages with a fixed worker pool fed through a bounded priority queue,
+# crawl_many shares one pool between search pages and repositories of all queries, search pages first.
+# "stars" fetches the most starred repositories of the search payload first, "order" keeps search result order
+ENRICHMENT_PRIORITY = "order"
+ENRICHMENT_WORKERS = CONCURRENCY_MAX_IN_FLIGHT
+ENRICHMENT_QUEUE_SIZE = 256
+
+# Incremental recrawl: repository pages are fetched again only when these search result fields
+# (dotted paths, "followers" is the star count) differ from the previous run, requires repository store
+INCREMENTAL_RECRAWL = False
+INCREMENTAL_METADATA_FIELDS = ("followers", "language", "topics", "repo.repository.updated_at")
+
+# None parses on the event loop, "thread" or "process" runs parsers in a worker pool
+PARSE_EXECUTOR = None
+PARSE_WORKERS = os.cpu_count()
+
+STREAM_REPOSITORY_PAGES = False
+STREAM_CHUNK_SIZE = 16 * 1024
+
+# "csv", "jsonl" or "parquet" (requires pyarrow)
+OUTPUT_FORMAT = "csv"
+PARQUET_ROW_GROUP_SIZE = 64 * 1024
+
+# None keeps checkpoint journals in "<output_dir>/.checkpoints"
+CHECKPOINT_DIR = None
+
+FRONTIER_PATH = ".cache/frontier.sqlite3"
+FRONTIER_LEASE_TIMEOUT = 120
+# Workers extend leases of their in-flight jobs, so a job waiting out Retry-After is not leased twice
+FRONTIER_LEASE_RENEW_INTERVAL = FRONTIER_LEASE_TIMEOUT / 3
+FRONTIER_MAX_ATTEMPTS = 3
+FRONTIER_POLL_INTERVAL = 1.0
+WORKER_PROCESSES = os.cpu_count()
+WORKER_JOBS_IN_FLIGHT = 16
+
+SHARD_PROCESSES = os.cpu_count()
+
+# Seen-URL set of enriched repositories, crawl_many fetches a repository in it once for all queries:
+# "exact" stores 64-bit URL hashes, "bloom" is a Bloom filter sized for SEEN_URLS_CAPACITY
+# at SEEN_URLS_ERROR_RATE false positives, a false positive only costs a fetch. None uses an exact set per run.
+# Search results always keep every URL. With SEEN_URLS_PATH the set is saved after a crawl for later runs
+SEEN_URLS = None
+SEEN_URLS_PATH = None
+SEEN_URLS_CAPACITY = 10_000_000
+SEEN_URLS_ERROR_RATE = 0.001
+
+# Prometheus text export: file written at the end of a crawl and/or local HTTP endpoint, None disables
+METRICS_PATH = None
+METRICS_PORT = None
+METRICS_HOST = "127.0.0.1"
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+BYTES_BUCKETS = tuple(1024 * 4**power for power in range(9))
+
+# JSON Lines file with per-request timings (DNS, connect, TTFB, body), None disables tracing
+TRACE_PATH = None
+
+SEARCH_MAX_PAGES = 1
+GITHUB_SEARCH_PAGE_LIMIT = 100
+
 SEARCHING_TYPE = "repositories"
 SEARCHING_KEYWORDS = ["python", "jwt"]
 
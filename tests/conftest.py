@@ -1,5 +1,9 @@
 pytest_plugins = [
     "tests.fixtures.crawler",
     "tests.fixtures.proxy",
+    "tests.fixtures.cache",
+    "tests.fixtures.store",
+    "tests.fixtures.frontier",
+    "tests.fixtures.server",
     # "tests.fixtures.<your_module>",
 ]
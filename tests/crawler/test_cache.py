@@ -0,0 +1,56 @@
+from src.gitcrawler.cache import ResponseCache
+
+
+def test_response_cache__fresh_hit(response_cache, test_url):
+    response_cache.store(test_url, "content", {"ETag": '"abc"'})
+
+    assert response_cache.get(test_url) == "content"
+    assert response_cache.hits == 1
+    assert response_cache.bytes_saved == len("content")
+
+
+def test_response_cache__stale_miss_with_conditional_headers(response_cache, fake_clock, test_url):
+    response_cache.store(test_url, "content", {"ETag": '"abc"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+    fake_clock.now += 61
+
+    assert response_cache.get(test_url) is None
+    assert response_cache.misses == 1
+    assert response_cache.conditional_headers(test_url) == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+    }
+
+
+def test_response_cache__revalidate_refreshes_entry(response_cache, fake_clock, test_url):
+    response_cache.store(test_url, "content", {"ETag": '"abc"'})
+    fake_clock.now += 61
+
+    assert response_cache.revalidate(test_url, {}) == "content"
+    assert response_cache.revalidations == 1
+    assert response_cache.get(test_url) == "content"
+
+
+def test_response_cache__revalidate_unknown_url(response_cache, test_url):
+    assert response_cache.revalidate(test_url) is None
+
+
+def test_response_cache__lru_eviction(response_cache, fake_clock, test_url):
+    response_cache.store(test_url + "/1", "a" * 400)
+    fake_clock.now += 1
+    response_cache.store(test_url + "/2", "b" * 400)
+    fake_clock.now += 1
+    response_cache.get(test_url + "/1")
+
+    response_cache.store(test_url + "/3", "c" * 400)
+
+    assert response_cache.size <= 1024
+    assert response_cache.get(test_url + "/1") is not None
+    assert response_cache.get(test_url + "/2") is None
+
+
+def test_response_cache__persists_between_instances(response_cache, temp_dir, fake_clock, test_url):
+    response_cache.store(test_url, "content")
+
+    cache = ResponseCache(cache_dir=temp_dir, ttl=60, max_bytes=1024, clock=fake_clock)
+
+    assert cache.get(test_url) == "content"
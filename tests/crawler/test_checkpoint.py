@@ -0,0 +1,71 @@
+from pathlib import Path
+
+from src.gitcrawler.checkpoint import CheckpointJournal
+from src.gitcrawler.records import RepositoryRecord
+
+
+def test_checkpoint_journal__load_recorded_work(temp_dir, test_url_github_repo):
+    path = Path(temp_dir) / "checkpoint.jsonl"
+    info = RepositoryRecord.from_stats("user", {"Python": 100.0})
+
+    journal = CheckpointJournal(path)
+    journal.record_page(1, [test_url_github_repo])
+    journal.record_repository(test_url_github_repo, info)
+    journal.close()
+
+    loaded = CheckpointJournal(path).load()
+
+    assert loaded.pages == {1: [test_url_github_repo]}
+    assert loaded.repositories == {test_url_github_repo: info}
+
+
+def test_checkpoint_journal__page_metadata(temp_dir, test_url_github_repo):
+    path = Path(temp_dir) / "checkpoint.jsonl"
+    metadata = {test_url_github_repo: {"followers": 10, "language": "Python"}}
+
+    journal = CheckpointJournal(path)
+    journal.record_page(1, [test_url_github_repo], metadata)
+    journal.record_page(2, [])
+    journal.close()
+
+    loaded = CheckpointJournal(path).load()
+
+    assert loaded.metadata == {1: metadata}
+
+
+def test_checkpoint_journal__ignores_torn_record(temp_dir, test_url_github_repo):
+    path = Path(temp_dir) / "checkpoint.jsonl"
+    journal = CheckpointJournal(path)
+    journal.record_page(1, [test_url_github_repo])
+    journal.close()
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"kind": "repository", "url": "https://gi')
+
+    loaded = CheckpointJournal(path).load()
+
+    assert loaded.pages == {1: [test_url_github_repo]}
+    assert loaded.repositories == {}
+
+
+def test_checkpoint_journal__record_after_torn_line_survives(temp_dir, test_url_github_repo):
+    path = Path(temp_dir) / "checkpoint.jsonl"
+    info = RepositoryRecord.from_stats("user", {"Python": 100.0})
+    with open(path, "w", encoding="utf-8") as f:
+        f.write('{"kind": "page", "page": 1, "urls": []}\n{"kind": "repository", "url": "https://gi')
+
+    resumed = CheckpointJournal(path).load()
+    resumed.record_repository(test_url_github_repo, info)
+    resumed.close()
+
+    assert CheckpointJournal(path).load().repositories == {test_url_github_repo: info}
+
+
+def test_checkpoint_journal__remove(temp_dir):
+    path = Path(temp_dir) / "checkpoints" / "checkpoint.jsonl"
+    journal = CheckpointJournal(path)
+    journal.record_page(1, [])
+
+    journal.remove()
+
+    assert not path.exists()
+    assert CheckpointJournal(path).load().pages == {}
@@ -1,11 +1,18 @@
+import asyncio
 import csv
+import json
+import sys
 from http import HTTPStatus
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from aiohttp import web
 from src.gitcrawler.crawler import GitHubCrawler
 from src.gitcrawler.models import ProxyConfig, RepositoryInfo, SearchResult
+from src.gitcrawler.priority_frontier import PriorityFrontier
+from src.gitcrawler.records import ResultRecord
+from src.gitcrawler.seen import ExactSeenSet
 
 
 def test_crawler_init__no_proxies(temp_dir):
@@ -186,6 +193,40 @@ async def test_crawler__ok(temp_dir, test_url):
         assert results[0].url == test_url
 
 
+@pytest.mark.asyncio
+async def test_crawl__jsonl_format(temp_dir, test_url):
+    config = {"keywords": ["python"], "type": "issues", "format": "jsonl"}
+
+    crawler = GitHubCrawler(output_dir=temp_dir)
+
+    with patch.object(crawler, "search", return_value=[SearchResult(url=test_url)]):
+        await crawler.crawl(config)
+
+    (filepath,) = Path(temp_dir).glob("issues_python_*.jsonl")
+    assert filepath.read_text(encoding="utf-8").splitlines() == [json.dumps({"url": test_url})]
+
+
+@pytest.mark.asyncio
+async def test_crawl__unsupported_format():
+    config = {"keywords": ["python"], "format": "xml"}
+    crawler = GitHubCrawler()
+
+    with pytest.raises(ValueError, match="Unsupported output format"):
+        await crawler.crawl(config)
+
+
+@pytest.mark.asyncio
+async def test_crawl__missing_parquet_dependency_fails_before_fetching(monkeypatch, temp_dir):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    crawler = GitHubCrawler(output_dir=temp_dir)
+
+    with patch.object(crawler, "_fetch_page") as mock_fetch:
+        with pytest.raises(ImportError, match="requires pyarrow"):
+            await crawler.crawl({"keywords": ["python"], "format": "parquet"})
+
+    mock_fetch.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_crawl__empty_keywords():
     config = {"keywords": [], "type": "repositories"}
@@ -396,3 +437,580 @@ async def test_search__repositories_with_extra_extraction(test_url_github_repo):
         assert results[0].extra is not None
         assert results[0].extra["owner"] == "user"
         assert results[1].extra is None
+
+
+def test_build_search_url__page():
+    crawler = GitHubCrawler()
+
+    assert "&p=" not in crawler._build_search_url(["python"], "repositories", page=1)
+    assert crawler._build_search_url(["python"], "repositories", page=3).endswith("&p=3")
+
+
+@pytest.mark.asyncio
+async def test_search__paginated_stops_on_empty_page(test_url_github_repo):
+    crawler = GitHubCrawler()
+    fetched_urls = []
+
+    async def mock_fetch_page(url):
+        fetched_urls.append(url)
+        return url
+
+    def mock_parse(html_content, search_type):
+        if "&p=" not in html_content:
+            return [test_url_github_repo + "1"]
+        page = int(html_content.rsplit("&p=", 1)[1])
+        return [] if page >= 3 else [f"{test_url_github_repo}{page}", test_url_github_repo + "1"]
+
+    with patch.object(crawler, "_fetch_page", side_effect=mock_fetch_page), patch.object(
+        crawler, "_parse_search_results", side_effect=mock_parse
+    ), patch.object(crawler, "_create_session", return_value=AsyncMock()):
+        results = await crawler.search(["python"], "repositories", extract_extra=False, max_pages=5)
+
+    assert [r.url for r in results] == [test_url_github_repo + "1", test_url_github_repo + "2"]
+    assert len(fetched_urls) <= 5
+
+
+@pytest.mark.asyncio
+async def test_search_iter__yields_results(test_url_github_repo):
+    crawler = GitHubCrawler()
+    mock_urls = [test_url_github_repo + "1", test_url_github_repo + "2"]
+
+    with patch.object(crawler, "_fetch_page", return_value="<html>test</html>"), patch.object(
+        crawler, "_parse_search_results", return_value=mock_urls
+    ), patch.object(crawler, "_create_session", return_value=AsyncMock()), patch.object(
+        crawler, "_extract_repository_info", return_value=RepositoryInfo(owner="user", language_stats={})
+    ):
+        results = [result async for result in crawler.search_iter(["python"], "repositories")]
+
+    assert sorted(r.url for r in results) == mock_urls
+    assert all(r.extra["owner"] == "user" for r in results)
+
+
+@pytest.mark.asyncio
+async def test_crawl_iter__writes_incrementally(temp_dir, test_url):
+    config = {"keywords": ["python"], "type": "issues"}
+    crawler = GitHubCrawler(output_dir=temp_dir)
+
+    async def mock_search_iter(*args, **kwargs):
+        yield SearchResult(url=test_url)
+        csv_files = list(Path(temp_dir).glob("issues_python_*.csv"))
+        with open(csv_files[0], "r", encoding="utf-8") as f:
+            assert f.read().splitlines() == ["url", test_url]
+        yield SearchResult(url=test_url + "/2")
+
+    with patch.object(crawler, "search_iter", side_effect=mock_search_iter):
+        results = [result async for result in crawler.crawl_iter(config)]
+
+    assert len(results) == 2
+
+
+@pytest.mark.asyncio
+async def test_crawler_context_manager__shares_session(test_url_github_repo):
+    crawler = GitHubCrawler()
+    mock_session = AsyncMock()
+
+    with patch.object(crawler, "_fetch_page", return_value="<html>test</html>"), patch.object(
+        crawler, "_parse_search_results", return_value=[test_url_github_repo]
+    ), patch.object(crawler, "_create_session", return_value=mock_session) as mock_create_session:
+        async with crawler:
+            await crawler.search(["python"], "issues")
+            await crawler.search(["jwt"], "issues")
+
+            assert crawler.session is mock_session
+            mock_session.close.assert_not_called()
+
+    mock_create_session.assert_called_once()
+    mock_session.close.assert_called_once()
+    assert crawler.session is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_direct__not_modified_served_from_cache(response_cache, fake_clock, test_url):
+    crawler = GitHubCrawler(cache=response_cache)
+    response_cache.store(test_url, "cached content", {"ETag": '"abc"'})
+    fake_clock.now += 61
+
+    mock_response = MagicMock()
+    mock_response.status = HTTPStatus.NOT_MODIFIED
+    mock_response.headers = {}
+
+    mock_session = MagicMock()
+    mock_session.get.return_value = AsyncMock()
+    mock_session.get.return_value.__aenter__.return_value = mock_response
+    crawler.session = mock_session
+
+    result = await crawler._fetch_page(test_url)
+
+    assert result == "cached content"
+    assert mock_session.get.call_args.kwargs["headers"] == {"If-None-Match": '"abc"'}
+    assert response_cache.revalidations == 1
+
+
+@pytest.mark.asyncio
+async def test_search__skips_known_repositories(repository_store, test_url_github_repo):
+    crawler = GitHubCrawler(repository_store=repository_store)
+    known_url, new_url = test_url_github_repo + "1", test_url_github_repo + "2"
+    repository_store.put(known_url, RepositoryInfo(owner="user", language_stats={"Go": 100.0}))
+    new_info = RepositoryInfo(owner="user", language_stats={"Python": 100.0})
+
+    with patch.object(crawler, "_fetch_page", return_value="<html>test</html>"), patch.object(
+        crawler, "_parse_search_results", return_value=[known_url, new_url]
+    ), patch.object(crawler, "_create_session", return_value=AsyncMock()), patch.object(
+        crawler, "_extract_repository_info", return_value=new_info
+    ) as mock_extract:
+        results = await crawler.search(["python"], "repositories")
+
+    mock_extract.assert_called_once_with(new_url)
+    assert [r.extra["language_stats"] for r in results] == [{"Go": 100.0}, {"Python": 100.0}]
+    assert repository_store.get(new_url) == new_info
+
+
+@pytest.mark.asyncio
+async def test_fetch_page__hedged_single_attempt_for_fast_proxy(proxy_list, test_url):
+    crawler = GitHubCrawler(proxies=proxy_list)
+
+    with patch.object(crawler, "_fetch_with_proxy", return_value=("content", True)) as mock_fetch:
+        result = await crawler._fetch_page(test_url)
+
+    assert result == "content"
+    assert mock_fetch.call_count == 1
+    assert crawler.fetch_stats.amplification == 1.0
+
+
+@pytest.mark.asyncio
+async def test_fetch_page__hedged_backup_after_delay(proxy_list, test_url):
+    crawler = GitHubCrawler(proxies=proxy_list)
+    slow_proxy_cancelled = asyncio.Event()
+
+    async def mock_fetch_with_proxy(url, proxy, reader=None, feedback=None):
+        feedback.started.set()
+        if proxy.url == crawler.proxy_manager.proxies[0].url:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                slow_proxy_cancelled.set()
+                raise
+        return "backup content", True
+
+    with patch.object(crawler, "_fetch_with_proxy", side_effect=mock_fetch_with_proxy), patch.object(
+        crawler, "_hedge_delay", return_value=0.01
+    ):
+        result = await crawler._fetch_page(test_url)
+
+    assert result == "backup content"
+    assert slow_proxy_cancelled.is_set()
+    assert crawler.fetch_stats.attempts_histogram == {2: 1}
+
+
+
+@pytest.mark.asyncio
+async def test_fetch_page__hedge_delay_excludes_slot_wait(proxy_list, test_url):
+    crawler = GitHubCrawler(proxies=proxy_list)
+    slot_taken = asyncio.Event()
+
+    async def mock_fetch_with_proxy(url, proxy, reader=None, feedback=None):
+        await slot_taken.wait()
+        feedback.started.set()
+        await asyncio.sleep(0.01)
+        feedback.latency = 0.01
+        return "content", True
+
+    with patch.object(crawler, "_fetch_with_proxy", side_effect=mock_fetch_with_proxy), patch.object(
+        crawler, "_hedge_delay", return_value=0.05
+    ):
+        fetch = asyncio.create_task(crawler._fetch_page(test_url))
+        await asyncio.sleep(0.1)
+        slot_taken.set()
+        result = await fetch
+
+    proxy = crawler.proxy_manager.proxies[0]
+    assert result == "content"
+    assert crawler.fetch_stats.attempts_histogram == {1: 1}
+    assert crawler.proxy_manager.health[proxy.url].latency_ewma == 0.01
+
+@pytest.mark.asyncio
+async def test_fetch_page__hedged_falls_back_to_direct(proxy_list, test_url):
+    crawler = GitHubCrawler(proxies=proxy_list)
+
+    with patch.object(crawler, "_fetch_with_proxy", return_value=(None, False)), patch.object(
+        crawler, "_fetch_direct", return_value="direct content"
+    ):
+        result = await crawler._fetch_page(test_url)
+
+    assert result == "direct content"
+    assert crawler.fetch_stats.attempts == len(proxy_list) + 1
+    assert len(crawler.proxy_manager.failed_proxies) == len(proxy_list)
+
+
+@pytest.mark.asyncio
+async def test_fetch_page__racing_mode(proxy_list, test_url):
+    crawler = GitHubCrawler(proxies=proxy_list, hedge_requests=False)
+
+    with patch.object(crawler, "_fetch_with_proxy", return_value=("content", True)) as mock_fetch:
+        result = await crawler._fetch_page(test_url)
+
+    assert result == "content"
+    assert mock_fetch.call_count == len(proxy_list)
+
+
+@pytest.mark.asyncio
+async def test_fetch_direct__rate_limited_reduces_concurrency(test_url):
+    crawler = GitHubCrawler()
+    direct_limit = crawler.concurrency.direct.limit
+
+    mock_response = MagicMock()
+    mock_response.status = HTTPStatus.TOO_MANY_REQUESTS
+    mock_response.headers = {"Retry-After": "1"}
+
+    mock_session = MagicMock()
+    mock_session.get.return_value = AsyncMock()
+    mock_session.get.return_value.__aenter__.return_value = mock_response
+    crawler.session = mock_session
+
+    result = await crawler._fetch_direct(test_url)
+
+    assert result is None
+    assert crawler.concurrency.direct.limit < direct_limit
+    assert crawler.concurrency.direct.paused_until > 0
+
+
+@pytest.mark.asyncio
+async def test_crawl_many__dedupes_repositories_across_queries(temp_dir, test_url_github_repo):
+    crawler = GitHubCrawler(output_dir=temp_dir)
+    shared_url = test_url_github_repo + "1"
+    configs = [
+        {"keywords": ["python"], "type": "repositories"},
+        {"keywords": ["jwt"], "type": "repositories"},
+    ]
+
+    def mock_parse(html_content, search_type):
+        return [shared_url, test_url_github_repo + ("2" if "python" in html_content else "3")]
+
+    async def mock_extract_repo_info(url):
+        await asyncio.sleep(0.01)
+        return RepositoryInfo(owner="user", language_stats={})
+
+    with patch.object(crawler, "_fetch_page", side_effect=lambda url: url), patch.object(
+        crawler, "_parse_search_results", side_effect=mock_parse
+    ), patch.object(crawler, "_create_session", return_value=AsyncMock()), patch.object(
+        crawler, "_extract_repository_info", side_effect=mock_extract_repo_info
+    ) as mock_extract:
+        results = await crawler.crawl_many(configs)
+
+    assert [len(query_results) for query_results in results] == [2, 2]
+    assert mock_extract.call_count == 3
+    assert len(list(Path(temp_dir).glob("repositories_*.csv"))) == 2
+    assert crawler.session is None
+
+
+@pytest.mark.asyncio
+async def test_crawl_many__one_frontier_fetches_search_pages_first(mock_github, temp_dir):
+    crawler = GitHubCrawler(output_dir=temp_dir, base_url=mock_github.url)
+    configs = [{"keywords": [keyword], "type": "repositories", "max_pages": 2} for keyword in ("python", "jwt")]
+    fetch_page = crawler._fetch_page
+    fetched = []
+    frontiers = []
+
+    async def record_fetch(url, *args, **kwargs):
+        fetched.append(url)
+        return await fetch_page(url, *args, **kwargs)
+
+    def single_worker_frontier(*args, **kwargs):
+        frontiers.append(PriorityFrontier(*args, **{**kwargs, "workers": 1}))
+        return frontiers[-1]
+
+    with patch.object(crawler, "_fetch_page", side_effect=record_fetch), patch(
+        "src.gitcrawler.crawler.PriorityFrontier", side_effect=single_worker_frontier
+    ):
+        results = await crawler.crawl_many(configs)
+
+    assert [len(query_results) for query_results in results] == [6, 6]
+    assert len(frontiers) == 1
+    assert ["/search?" in url for url in fetched] == [True] * 4 + [False] * 6
+
+
+@pytest.mark.asyncio
+async def test_crawl_many__failed_query_does_not_stop_others(temp_dir, test_url):
+    crawler = GitHubCrawler(output_dir=temp_dir)
+    configs = [{"keywords": ["python"], "type": "issues"}, {"keywords": ["jwt"], "type": "unknown"}]
+
+    with patch.object(crawler, "_fetch_page", return_value="<html></html>"), patch.object(
+        crawler, "_parse_search_results", return_value=[test_url]
+    ), patch.object(crawler, "_create_session", return_value=AsyncMock()):
+        results = await crawler.crawl_many(configs)
+
+    assert [len(query_results) for query_results in results] == [1, 0]
+
+
+@pytest.mark.asyncio
+async def test_crawl__resume_skips_finished_work(temp_dir, test_url_github_repo):
+    crawler = GitHubCrawler(output_dir=temp_dir)
+    done_url, failed_url = test_url_github_repo + "1", test_url_github_repo + "2"
+    config = {"keywords": ["python"], "type": "repositories"}
+
+    async def mock_extract_repo_info(url):
+        if url == failed_url:
+            return None
+        return RepositoryInfo(owner="user", language_stats={"Go": 100.0})
+
+    with patch.object(crawler, "_fetch_page", return_value="<html>test</html>"), patch.object(
+        crawler, "_parse_search_results", return_value=[done_url, failed_url]
+    ), patch.object(crawler, "_create_session", return_value=AsyncMock()), patch.object(
+        crawler, "_extract_repository_info", side_effect=mock_extract_repo_info
+    ), patch.object(crawler, "_save_results", side_effect=RuntimeError("killed")):
+        with pytest.raises(RuntimeError):
+            await crawler.crawl(config)
+
+    assert len(list(crawler.checkpoint_dir.glob("*.jsonl"))) == 1
+
+    new_info = RepositoryInfo(owner="user", language_stats={"Python": 100.0})
+    with patch.object(crawler, "_fetch_page") as mock_fetch, patch.object(
+        crawler, "_create_session", return_value=AsyncMock()
+    ), patch.object(crawler, "_extract_repository_info", return_value=new_info) as mock_extract:
+        results = await crawler.crawl({**config, "resume": True})
+
+    mock_fetch.assert_not_called()
+    mock_extract.assert_called_once_with(failed_url)
+    assert [r.extra["language_stats"] for r in results] == [{"Go": 100.0}, {"Python": 100.0}]
+    assert list(crawler.checkpoint_dir.glob("*.jsonl")) == []
+
+
+@pytest.mark.asyncio
+async def test_crawl__resume_keeps_payload_metadata(mock_github, temp_dir):
+    crawler = GitHubCrawler(output_dir=temp_dir, base_url=mock_github.url)
+    config = {"keywords": ["python"], "type": "repositories", "enrichment": "payload"}
+
+    with patch.object(crawler, "_save_results", side_effect=RuntimeError("killed")):
+        with pytest.raises(RuntimeError):
+            await crawler.crawl(config)
+    mock_github.reset()
+
+    results = await crawler.crawl({**config, "resume": True})
+
+    assert mock_github.requests == 0
+    assert results[1].extra == {"owner": "owner1", "language": "JavaScript", "stars": 10, "updated_at": "2024-01-01"}
+
+
+@pytest.mark.asyncio
+async def test_crawl_many__duplicate_configs(temp_dir):
+    crawler = GitHubCrawler(output_dir=temp_dir)
+    config = {"keywords": ["python"], "type": "repositories"}
+
+    with pytest.raises(ValueError, match="Duplicate crawl configs"):
+        await crawler.crawl_many([config, dict(config)])
+
+    jsonl_query = crawler._parse_config({**config, "format": "jsonl"})
+    assert crawler._parse_config(config).checkpoint_key != jsonl_query.checkpoint_key
+
+
+@pytest.mark.asyncio
+async def test_crawl_many__empty_keywords():
+    crawler = GitHubCrawler()
+
+    with pytest.raises(ValueError, match="Keywords list cannot be empty"):
+        await crawler.crawl_many([{"keywords": ["python"]}, {"keywords": []}])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("parse_executor", ["thread", "process"])
+async def test_extract_repository_info__parse_executor(parse_executor, language_stats, test_url_github_repo):
+    crawler = GitHubCrawler(parse_executor=parse_executor, parse_workers=1)
+    mock_html = (
+        f'<html><span class="color-fg-default text-bold mr-1">Python</span><span>{language_stats}%</span></html>'
+    )
+
+    try:
+        with patch.object(crawler, "_fetch_page", return_value=mock_html):
+            result = await crawler._extract_repository_info(test_url_github_repo)
+    finally:
+        crawler.shutdown_parse_executor()
+
+    assert result.language_stats == {"Python": language_stats}
+    assert crawler.parse_executor is None
+
+
+def test_crawler_init__unsupported_parse_executor():
+    crawler = GitHubCrawler(parse_executor="gpu")
+
+    with pytest.raises(ValueError, match="Unsupported parse executor"):
+        crawler._get_parse_executor()
+
+
+@pytest.mark.asyncio
+async def test_extract_repository_info__streaming(temp_dir, language_stats):
+    page = (
+        '<html><body><ul><li><span class="color-fg-default text-bold mr-1">Python</span>'
+        f"<span>{language_stats}%</span></li></ul>" + "<div>tail</div>" * 100000 + "</body></html>"
+    )
+
+    async def repository(request):
+        return web.Response(text=page, content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/{owner}/{repo}", repository)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    base_url = f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}/"
+
+    try:
+        async with GitHubCrawler(output_dir=temp_dir, base_url=base_url, stream_repository_pages=True) as crawler:
+            with patch.object(crawler, "_read_language_stats", wraps=crawler._read_language_stats) as mock_read:
+                result = await crawler._extract_repository_info(f"{base_url}user/repo")
+    finally:
+        await runner.cleanup()
+
+    assert result.owner == "user"
+    assert result.language_stats == {"Python": language_stats}
+    mock_read.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_crawl__through_proxy_end_to_end(mock_github, mock_proxy, temp_dir):
+    config = {"keywords": ["python"], "proxies": [mock_proxy.address], "type": "repositories"}
+    crawler = GitHubCrawler(output_dir=temp_dir, base_url=mock_github.url)
+
+    results = await crawler.crawl(config)
+
+    assert [result.url for result in results] == [f"{mock_github.url}owner{i}/repo{i}" for i in range(6)]
+    assert all(result.extra["language_stats"] == {"Python": 50.0, "JavaScript": 50.0} for result in results)
+    assert mock_proxy.requests == mock_github.requests == 7
+    assert crawler.fetch_stats.amplification == 1.0
+    assert crawler.metrics.requests.value(route="proxy", status="200") == 7
+    assert crawler.metrics.response_bytes.value(route="proxy") == mock_github.bytes_sent
+    assert crawler.metrics.parse_duration.count(page="repository") == 6
+    assert crawler.metrics.results.value(search_type="repositories") == 6
+    assert 'gitcrawler_request_duration_seconds_count{route="proxy",proxy="' in crawler.metrics.registry.render()
+
+
+@pytest.mark.asyncio
+async def test_crawl__request_traces(mock_github, mock_proxy, temp_dir):
+    config = {"keywords": ["python"], "proxies": [mock_proxy.address], "type": "repositories"}
+    trace_path = Path(temp_dir) / "traces.jsonl"
+    crawler = GitHubCrawler(output_dir=temp_dir, base_url=mock_github.url, trace_path=str(trace_path))
+
+    await crawler.crawl(config)
+
+    traces = [json.loads(line) for line in trace_path.read_text(encoding="utf-8").splitlines()]
+    assert [trace["kind"] for trace in traces].count("search") == 1
+    assert [trace["kind"] for trace in traces].count("repository") == 6
+    assert {trace["proxy"] for trace in traces} == {mock_proxy.address}
+    assert all(trace["status"] == 200 and trace["error"] is None for trace in traces)
+    assert all(trace["ttfb"] is not None and trace["body"] is not None for trace in traces)
+    assert sum(trace["bytes"] for trace in traces) == mock_github.bytes_sent
+    assert traces[0]["connect"] is not None and any(trace["reused"] for trace in traces)
+
+
+@pytest.mark.asyncio
+async def test_crawl__records(mock_github, temp_dir):
+    crawler = GitHubCrawler(output_dir=temp_dir, base_url=mock_github.url)
+
+    records = await crawler.crawl({"keywords": ["python"], "type": "repositories"}, records=True)
+
+    assert all(isinstance(record, ResultRecord) for record in records)
+    assert [record.url for record in records] == [f"{mock_github.url}owner{i}/repo{i}" for i in range(6)]
+    assert records[0].repository.owner == "owner0"
+    assert records[0].repository.language_stats == {"Python": 50.0, "JavaScript": 50.0}
+    assert [record.to_model() for record in records] == await crawler.search(["python"], "repositories")
+
+
+@pytest.mark.asyncio
+async def test_search__seen_urls_keep_store_expiry(mock_github, repository_store, fake_clock, temp_dir):
+    seen = ExactSeenSet()
+    crawler = GitHubCrawler(
+        output_dir=temp_dir, base_url=mock_github.url, repository_store=repository_store, seen_urls=seen
+    )
+
+    first = await crawler.search(["python"], "repositories")
+    mock_github.reset()
+    fake_clock.now += 3600
+    second = await crawler.search(["python"], "repositories")
+
+    assert len(first) == len(seen) == 6
+    assert second == first
+    assert mock_github.requests == 7
+
+
+@pytest.mark.asyncio
+async def test_crawl_many__seen_urls_dedupe_fetches(mock_github, temp_dir):
+    seen = ExactSeenSet()
+    crawler = GitHubCrawler(output_dir=temp_dir, base_url=mock_github.url, seen_urls=seen)
+    configs = [{"keywords": [keyword], "type": "repositories"} for keyword in ("python", "jwt")]
+
+    first, second = await crawler.crawl_many(configs)
+
+    assert mock_github.requests == 2 + 6
+    assert len(seen) == 6
+    assert second == first
+    assert all(result.extra["owner"] for result in first)
+    assert crawler._repository_tasks is None
+
+
+@pytest.mark.asyncio
+async def test_crawl__incremental_fetches_changed_repositories_only(
+    mock_github, repository_store, fake_clock, temp_dir
+):
+    config = {"keywords": ["python"], "type": "repositories"}
+    crawler = GitHubCrawler(
+        output_dir=temp_dir, base_url=mock_github.url, repository_store=repository_store, incremental=True
+    )
+    first = await crawler.crawl(config)
+    mock_github.reset()
+
+    fake_clock.now += 3600
+    mock_github._search_pages[1] = mock_github._search_pages[1].replace(b'"followers": 10}', b'"followers": 11}')
+    second = await crawler.crawl(config)
+
+    assert second == first
+    assert mock_github.requests == 2
+    assert crawler.metrics.requests.value(route="direct", status="200") == 9
+
+
+def test_crawler_init__incremental_requires_store():
+    with pytest.raises(ValueError, match="repository store"):
+        GitHubCrawler(incremental=True)
+
+
+@pytest.mark.asyncio
+async def test_crawl__payload_enrichment_skips_repository_pages(mock_github, temp_dir):
+    config = {"keywords": ["python"], "type": "repositories", "format": "jsonl", "enrichment": "payload"}
+    crawler = GitHubCrawler(output_dir=temp_dir, base_url=mock_github.url)
+
+    results = await crawler.crawl(config)
+
+    assert mock_github.requests == 1
+    assert len(results) == 6
+    assert results[1].extra == {"owner": "owner1", "language": "JavaScript", "stars": 10, "updated_at": "2024-01-01"}
+    with open(next(Path(temp_dir).glob("repositories_python_*.jsonl")), "r", encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f]
+    assert rows[1] == {"url": results[1].url, **results[1].extra}
+
+
+@pytest.mark.asyncio
+async def test_crawl__unsupported_enrichment(temp_dir):
+    crawler = GitHubCrawler(output_dir=temp_dir)
+
+    with pytest.raises(ValueError, match="Unsupported enrichment level"):
+        await crawler.crawl({"keywords": ["python"], "enrichment": "partial"})
+
+
+@pytest.mark.asyncio
+async def test_search__enriches_most_starred_repositories_first(mock_github):
+    crawler = GitHubCrawler(base_url=mock_github.url, enrichment_priority="stars")
+    fetched = []
+
+    async def get_repository_info(url):
+        fetched.append(url)
+        return RepositoryInfo(owner=url.rstrip("/").split("/")[-2], language_stats={})
+
+    with patch.object(crawler, "_get_repository_info", side_effect=get_repository_info):
+        results = await crawler.search(["python"], "repositories")
+
+    assert fetched == [result.url for result in reversed(results)]
+    assert mock_github.requests == 1
+
+
+def test_crawler__unsupported_enrichment_priority():
+    with pytest.raises(ValueError, match="Unsupported enrichment priority"):
+        GitHubCrawler(enrichment_priority="forks")
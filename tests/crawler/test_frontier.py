@@ -0,0 +1,101 @@
+from src.gitcrawler.models import CrawlQuery
+
+QUERY = CrawlQuery(keywords=["python"], search_type="repositories", max_pages=2, output_format="csv")
+
+
+def test_crawl_frontier__lease_is_exclusive(crawl_frontier):
+    crawl_frontier.add_query(QUERY)
+    crawl_frontier.add_query(QUERY)
+
+    jobs = crawl_frontier.lease("worker1", limit=10)
+
+    assert [(job.kind, job.page) for job in jobs] == [("search", 1)]
+    assert crawl_frontier.lease("worker2", limit=10) == []
+    assert not crawl_frontier.is_idle()
+
+
+def test_crawl_frontier__expired_lease_requeued(crawl_frontier, fake_clock):
+    crawl_frontier.add_query(QUERY)
+    (job,) = crawl_frontier.lease("worker1", limit=1, lease_timeout=10)
+    fake_clock.now += 11
+
+    (retried,) = crawl_frontier.lease("worker2", limit=1, lease_timeout=10)
+
+    assert retried.id == job.id
+    assert retried.attempts == 2
+    assert not crawl_frontier.complete(job, "worker1", {"urls": []})
+    assert crawl_frontier.complete(retried, "worker2", {"urls": []})
+    assert crawl_frontier.is_idle()
+
+
+def test_crawl_frontier__renewed_lease_not_requeued(crawl_frontier, fake_clock):
+    crawl_frontier.add_query(QUERY)
+    (job,) = crawl_frontier.lease("worker1", limit=1, lease_timeout=10)
+    fake_clock.now += 8
+
+    assert crawl_frontier.renew([job], "worker2", lease_timeout=10) == 0
+    assert crawl_frontier.renew([job], "worker1", lease_timeout=10) == 1
+    fake_clock.now += 8
+
+    assert crawl_frontier.lease("worker2", limit=1, lease_timeout=10) == []
+    assert crawl_frontier.complete(job, "worker1", {"urls": []})
+
+
+def test_crawl_frontier__new_run_replaces_previous_jobs(crawl_frontier):
+    crawl_frontier.add_query(QUERY)
+    (job,) = crawl_frontier.lease("worker1", limit=1)
+    crawl_frontier.complete(job, "worker1", {"urls": []})
+
+    crawl_frontier.add_query(QUERY.model_copy(update={"max_pages": 5, "resume": True}))
+    assert crawl_frontier.counts() == {"done": 1}
+
+    crawl_frontier.add_query(QUERY.model_copy(update={"max_pages": 5}))
+    assert crawl_frontier.counts() == {"pending": 1}
+    assert crawl_frontier.get_query(QUERY.key).max_pages == 5
+
+
+def test_crawl_frontier__fail_gives_up_after_max_attempts(crawl_frontier):
+    crawl_frontier.add_query(QUERY)
+
+    for _ in range(2):
+        (job,) = crawl_frontier.lease("worker1", limit=1)
+        crawl_frontier.fail(job, "worker1", "No content")
+
+    assert crawl_frontier.counts() == {"failed": 1}
+    assert crawl_frontier.is_idle()
+
+
+def test_crawl_frontier__expired_lease_fails_after_max_attempts(crawl_frontier, fake_clock):
+    crawl_frontier.add_query(QUERY)
+
+    for _ in range(2):
+        assert len(crawl_frontier.lease("worker1", limit=1, lease_timeout=10)) == 1
+        fake_clock.now += 11
+
+    assert crawl_frontier.lease("worker2", limit=1) == []
+    assert crawl_frontier.counts() == {"failed": 1}
+    assert crawl_frontier.is_idle()
+
+
+def test_crawl_frontier__results_in_search_order(crawl_frontier, test_url_github_repo):
+    key = crawl_frontier.add_query(QUERY)
+    urls = [test_url_github_repo + "1", test_url_github_repo + "2"]
+    (search_job,) = crawl_frontier.lease("worker1", limit=1)
+    crawl_frontier.complete(
+        search_job,
+        "worker1",
+        {"urls": urls},
+        [crawl_frontier.repository_job(search_job, position, url) for position, url in enumerate(urls)],
+    )
+
+    first, second = crawl_frontier.lease("worker1", limit=2)
+    crawl_frontier.complete(second, "worker1", {"owner": "user", "language_stats": {}})
+    crawl_frontier.fail(first, "worker1", "No repository info")
+    (first,) = crawl_frontier.lease("worker1", limit=1)
+    crawl_frontier.fail(first, "worker1", "No repository info")
+
+    results = crawl_frontier.results(key)
+
+    assert [result.url for result in results] == urls
+    assert results[0].extra is None
+    assert results[1].extra == {"owner": "user", "language_stats": {}}
@@ -0,0 +1,71 @@
+import aiohttp
+import pytest
+from src.gitcrawler.metrics import MetricsRegistry
+
+
+def test_metrics_registry__render_counter():
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests", ("route", "status"))
+    requests.inc(route="proxy", status="200")
+    requests.inc(2, route="direct", status='5"x')
+
+    assert registry.render().splitlines() == [
+        "# HELP requests_total Requests",
+        "# TYPE requests_total counter",
+        'requests_total{route="direct",status="5\\"x"} 2',
+        'requests_total{route="proxy",status="200"} 1',
+    ]
+
+
+def test_metrics_registry__render_histogram():
+    registry = MetricsRegistry()
+    duration = registry.histogram("duration_seconds", "Duration", ("page",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        duration.observe(value, page="search")
+
+    lines = registry.render().splitlines()
+
+    assert lines[2:] == [
+        'duration_seconds_bucket{page="search",le="0.1"} 2',
+        'duration_seconds_bucket{page="search",le="1"} 3',
+        'duration_seconds_bucket{page="search",le="+Inf"} 4',
+        'duration_seconds_sum{page="search"} 3.65',
+        'duration_seconds_count{page="search"} 4',
+    ]
+    assert duration.count(page="search") == 4
+
+
+def test_metrics_registry__labels_checked():
+    registry = MetricsRegistry()
+    counter = registry.counter("results_total", "Results", ("search_type",))
+
+    assert registry.counter("results_total", "Results", ("search_type",)) is counter
+    with pytest.raises(ValueError):
+        counter.inc(route="direct")
+    with pytest.raises(ValueError):
+        registry.histogram("results_total", "Results")
+
+
+def test_metrics_registry__write(temp_dir):
+    registry = MetricsRegistry()
+    registry.counter("results_total", "Results").inc()
+
+    registry.write(f"{temp_dir}/metrics/crawler.prom")
+
+    with open(f"{temp_dir}/metrics/crawler.prom", encoding="utf-8") as f:
+        assert f.read().endswith("results_total 1\n")
+
+
+@pytest.mark.asyncio
+async def test_metrics_registry__http_endpoint():
+    registry = MetricsRegistry()
+    registry.counter("results_total", "Results").inc()
+
+    url = await registry.start_http_server(0)
+    try:
+        async with aiohttp.ClientSession() as session, session.get(url) as response:
+            body = await response.text()
+    finally:
+        await registry.stop_http_server()
+
+    assert "results_total 1" in body
@@ -0,0 +1,137 @@
+from benchmarks.pages import build_search_page
+from src.gitcrawler.parsers import (
+    LanguageStatsParser,
+    extract_embedded_json,
+    extract_urls_from_json,
+    parse_language_stats,
+    parse_search_page,
+    parse_search_results,
+    repository_fingerprint,
+    repository_summary,
+)
+from src.gitcrawler.seen import ExactSeenSet
+
+
+def test_extract_urls_from_json__base_url(sample_json_data):
+    urls = extract_urls_from_json(sample_json_data, "repositories", base_url="http://localhost/")
+
+    assert urls == ["http://localhost/user/some_repoo", "http://localhost/user128001/repo2"]
+
+
+def test_extract_urls_from_json__skips_seen(sample_json_data):
+    seen = ExactSeenSet()
+    seen.add("http://localhost/user/some_repoo")
+
+    urls = extract_urls_from_json(sample_json_data, "repositories", base_url="http://localhost/", seen=seen)
+
+    assert urls == ["http://localhost/user128001/repo2"]
+    assert "http://localhost/user128001/repo2" in seen
+    assert extract_urls_from_json(sample_json_data, "repositories", base_url="http://localhost/", seen=seen) == []
+
+
+def test_parse_search_results__embedded_json():
+    mock_html = """
+    <html><script data-target="react-app.embeddedData">
+        {"payload": {"results": [{"repo": {"repository": {"owner_login": "user", "name": "repo"}}}]}}
+    </script></html>
+    """
+
+    assert parse_search_results(mock_html, "repositories") == ["https://github.com/user/repo"]
+
+
+def test_parse_language_stats(language_stats):
+    mock_html = f"""
+    <html>
+        <span class="color-fg-default text-bold mr-1">Python</span>
+        <span>{language_stats}%</span>
+        <span class="color-fg-default text-bold mr-1">Go</span>
+        <span>not a number%</span>
+    </html>
+    """
+
+    assert parse_language_stats(mock_html) == {"Python": language_stats}
+
+
+def test_extract_embedded_json__bytes_and_text():
+    page = '<html><script type="application/json" data-target="react-app.embeddedData">{"payload": {}}</script></html>'
+
+    assert extract_embedded_json(page) == {"payload": {}}
+    assert extract_embedded_json(page.encode()) == {"payload": {}}
+
+
+def test_extract_embedded_json__marker_outside_script():
+    page = '<div data-target="react-app.embeddedData">{"payload": {}}</div>'
+
+    assert extract_embedded_json(page) is None
+
+
+def test_extract_embedded_json__invalid_json():
+    page = '<script data-target="react-app.embeddedData">{broken</script>'
+
+    assert extract_embedded_json(page) is None
+
+
+def test_parse_search_results__xpath_fallback():
+    mock_html = """
+    <html><script>
+        {"payload": {"results": [{"repo": {"repository": {"owner_login": "user", "name": "repo"}}}]}}
+    </script></html>
+    """
+
+    assert extract_embedded_json(mock_html) is None
+    assert parse_search_results(mock_html, "repositories") == ["https://github.com/user/repo"]
+
+
+def test_language_stats_parser__stops_after_language_list(language_stats):
+    page = (
+        "<html><body>"
+        + "<div><span>50%</span></div>" * 10
+        + '<ul><li><span class="color-fg-default text-bold mr-1">Python</span>'
+        + f"<span>{language_stats}%</span></li>"
+        + '<li><span class="color-fg-default text-bold mr-1">Go</span><span>10%</span></li></ul>'
+        + "<div>tail</div>" * 10000
+        + "</body></html>"
+    ).encode()
+    parser = LanguageStatsParser()
+
+    for start in range(0, len(page), 256):
+        if parser.feed(page[start : start + 256]):
+            break
+
+    assert parser.done
+    assert parser.bytes_read < len(page) // 10
+    assert parser.close() == {"Python": language_stats, "Go": 10.0}
+
+
+def test_language_stats_parser__no_languages():
+    parser = LanguageStatsParser()
+
+    assert not parser.feed(b"<html><body><ul><li>item</li></ul>")
+    assert parser.close() == {}
+
+
+def test_repository_fingerprint():
+    result = {"followers": 10, "language": "Python", "repo": {"repository": {"updated_at": "2024-01-01"}}}
+
+    fingerprint = repository_fingerprint(result)
+
+    assert fingerprint == repository_fingerprint(dict(result))
+    assert fingerprint != repository_fingerprint({**result, "followers": 11})
+    assert fingerprint != repository_fingerprint({**result, "repo": {"repository": {"updated_at": "2024-01-02"}}})
+    assert repository_fingerprint({"repo": {"repository": {"name": "repo"}}}) is None
+
+
+def test_parse_search_page__metadata():
+    page = build_search_page(results=2)
+
+    urls, metadata = parse_search_page(page, "repositories", base_url="http://localhost/")
+
+    assert urls == ["http://localhost/owner0/repo0", "http://localhost/owner1/repo1"]
+    assert list(metadata) == urls
+    assert repository_summary(metadata[urls[1]]) == {
+        "owner": "owner1",
+        "language": "JavaScript",
+        "stars": 10,
+        "updated_at": "2024-01-01",
+    }
+    assert parse_search_page(page, "issues", base_url="http://localhost/")[1] == {}
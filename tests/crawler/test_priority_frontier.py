@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+from src.gitcrawler.priority_frontier import PriorityFrontier
+
+
+@pytest.mark.asyncio
+async def test_priority_frontier__lowest_priority_first():
+    async def handler(item: str) -> str:
+        return item.upper()
+
+    frontier = PriorityFrontier(handler, workers=1, maxsize=10)
+
+    results = [result async for result in frontier.run([(3, "c"), (1, "a"), (2, "b"), (1, "a2")])]
+
+    assert results == [("a", "A"), ("a2", "A2"), ("b", "B"), ("c", "C")]
+
+
+@pytest.mark.asyncio
+async def test_priority_frontier__producer_blocks_when_full():
+    produced = 0
+    in_flight = []
+
+    def items():
+        nonlocal produced
+        for number in range(100):
+            produced += 1
+            yield number, number
+
+    async def handler(item: int) -> int:
+        in_flight.append(produced - item)
+        await asyncio.sleep(0)
+        return item
+
+    frontier = PriorityFrontier(handler, workers=2, maxsize=3)
+
+    results = [item async for item, _ in frontier.run(items())]
+
+    assert sorted(results) == list(range(100))
+    assert max(in_flight) <= 2 + 3 + 1
+
+
+@pytest.mark.asyncio
+async def test_priority_frontier__failed_items_skipped():
+    async def handler(item: int) -> float:
+        return 1 / item
+
+    frontier = PriorityFrontier(handler, workers=2, maxsize=2)
+
+    assert [item async for item, _ in frontier.run((item, item) for item in (0, 1, 2))] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_priority_frontier__runs_share_worker_pool():
+    running = 0
+    most_running = 0
+
+    def handler(suffix: str):
+        async def handle(item: int) -> str:
+            nonlocal running, most_running
+            running += 1
+            most_running = max(most_running, running)
+            await asyncio.sleep(0)
+            running -= 1
+            return f"{item}{suffix}"
+
+        return handle
+
+    async def collect(frontier: PriorityFrontier, suffix: str) -> list[str]:
+        return sorted(
+            [result async for _, result in frontier.run(((item, item) for item in range(5)), handler(suffix))]
+        )
+
+    async with PriorityFrontier(workers=2, maxsize=2) as frontier:
+        first, second = await asyncio.gather(collect(frontier, "a"), collect(frontier, "b"))
+
+    assert first == [f"{item}a" for item in range(5)]
+    assert second == [f"{item}b" for item in range(5)]
+    assert most_running == 2
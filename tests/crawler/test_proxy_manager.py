@@ -1,3 +1,4 @@
+import pytest
 from src.gitcrawler.proxy_manager import ProxyManager
 
 
@@ -27,3 +28,90 @@ def test_get_working_proxy__skips_failed_proxies(proxy_configs) -> None:
 
     proxy = manager.get_working_proxy()
     assert proxy == proxy_configs[1]
+
+
+def test_get_working_proxy__all_failed_returns_none_without_reset(proxy_configs, fake_clock) -> None:
+    manager = ProxyManager(proxy_configs, clock=fake_clock)
+
+    for proxy in proxy_configs:
+        manager.mark_proxy_failed(proxy)
+
+    assert manager.get_working_proxy() is None
+    assert len(manager.failed_proxies) == len(proxy_configs)
+
+
+def test_get_working_proxy__half_open_probe_after_cooldown(proxy_configs, fake_clock) -> None:
+    manager = ProxyManager(proxy_configs[:1], cooldown=10, clock=fake_clock)
+    proxy = proxy_configs[0]
+    manager.mark_proxy_failed(proxy)
+
+    fake_clock.now += 11
+    assert manager.get_working_proxy() == proxy
+    assert manager.get_working_proxy() is None
+
+    manager.mark_proxy_success(proxy, 0.1)
+    assert manager.failed_proxies == set()
+    assert manager.get_working_proxy() == proxy
+
+
+def test_mark_proxy_failed__cooldown_grows(proxy_configs, fake_clock) -> None:
+    manager = ProxyManager(proxy_configs, cooldown=10, max_cooldown=25, clock=fake_clock)
+    proxy = proxy_configs[0]
+
+    cooldowns = []
+    for _ in range(3):
+        manager.mark_proxy_failed(proxy)
+        cooldowns.append(manager.health[proxy.url].cooldown)
+
+    assert cooldowns == [10, 20, 25]
+
+
+def test_get_working_proxy__prefers_fast_reliable_proxy(proxy_configs) -> None:
+    manager = ProxyManager(proxy_configs)
+    fast, slow, flaky = proxy_configs
+    for _ in range(5):
+        manager.mark_proxy_success(fast, 0.1)
+        manager.mark_proxy_success(slow, 1.0)
+    manager.mark_proxy_success(flaky, 0.1)
+    manager.health[flaky.url].failures = 20
+
+    picks = [manager.get_working_proxy() for _ in range(100)]
+
+    assert picks.count(fast) > picks.count(slow) > 0
+    assert picks.count(fast) > picks.count(flaky)
+
+
+def test_mark_proxy_success__latency_ewma(proxy_configs) -> None:
+    manager = ProxyManager(proxy_configs)
+    proxy = proxy_configs[0]
+
+    manager.mark_proxy_success(proxy, 1.0)
+    manager.mark_proxy_success(proxy, 2.0)
+
+    assert manager.health[proxy.url].latency_ewma == pytest.approx(1.3)
+
+
+def test_latency_percentile(proxy_configs) -> None:
+    manager = ProxyManager(proxy_configs)
+    proxy = proxy_configs[0]
+
+    assert manager.latency_percentile(proxy, 0.95) is None
+
+    for latency in range(1, 21):
+        manager.mark_proxy_success(proxy, latency / 10)
+
+    assert manager.latency_percentile(proxy, 0.95) == pytest.approx(1.9)
+    assert manager.latency_percentile(proxy, 0.5) == pytest.approx(1.0)
+
+
+def test_add_proxy__joins_rotation_and_closes_circuit(proxy_configs) -> None:
+    manager = ProxyManager(proxy_configs[:1])
+    known, new = proxy_configs[0], proxy_configs[1]
+    manager.mark_proxy_failed(known)
+
+    manager.add_proxy(known)
+    manager.add_proxy(new, 0.2)
+
+    assert manager.proxies == [known, new]
+    assert manager.failed_proxies == set()
+    assert manager.health[new.url].latency_ewma == 0.2
@@ -0,0 +1,76 @@
+import socket
+
+import aiohttp
+import pytest
+from benchmarks.mock_github import MockProxy
+from src.gitcrawler.crawler import GitHubCrawler
+from src.gitcrawler.models import ProxyConfig
+from src.gitcrawler.proxy_validator import ProxyValidator
+
+
+def closed_port_address() -> str:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return f"127.0.0.1:{sock.getsockname()[1]}"
+
+
+@pytest.mark.asyncio
+async def test_validate__splits_live_and_dead_proxies(mock_github, mock_proxy):
+    live = ProxyConfig.from_string(mock_proxy.address)
+    unreachable = ProxyConfig.from_string(closed_port_address())
+    async with MockProxy(failure_rate=1.0) as failing_proxy, aiohttp.ClientSession() as session:
+        failing = ProxyConfig.from_string(failing_proxy.address)
+
+        live_proxies, dead = await ProxyValidator(mock_github.url, timeout=1).validate(
+            session, [unreachable, live, failing]
+        )
+
+    assert [proxy for proxy, _ in live_proxies] == [live]
+    assert live_proxies[0][1] > 0
+    assert dead == [unreachable, failing]
+
+
+@pytest.mark.asyncio
+async def test_validate__ranks_by_latency(mock_github, mock_proxy):
+    async with MockProxy(latency=0.1) as slow_proxy, aiohttp.ClientSession() as session:
+        slow = ProxyConfig.from_string(slow_proxy.address)
+        fast = ProxyConfig.from_string(mock_proxy.address)
+
+        live_proxies, dead = await ProxyValidator(mock_github.url).validate(session, [slow, fast])
+
+    assert [proxy for proxy, _ in live_proxies] == [fast, slow]
+    assert live_proxies[1][1] >= 0.1
+    assert dead == []
+
+
+@pytest.mark.asyncio
+async def test_crawl__validated_proxies_only(mock_github, mock_proxy, temp_dir):
+    config = {"keywords": ["python"], "proxies": [closed_port_address(), mock_proxy.address], "type": "repositories"}
+    crawler = GitHubCrawler(output_dir=temp_dir, base_url=mock_github.url, validate_proxies=True)
+
+    results = await crawler.crawl(config)
+
+    assert len(results) == 6
+    assert [proxy.url for proxy in crawler.proxy_manager.proxies] == [f"http://{mock_proxy.address}"]
+    assert crawler.fetch_stats.amplification == 1.0
+    assert mock_github.requests == 7
+    assert mock_proxy.requests == 8
+
+
+@pytest.mark.asyncio
+async def test_reprobe_proxies__recovered_proxy_rejoins(mock_github, temp_dir):
+    async with MockProxy(failure_rate=1.0) as proxy:
+        crawler = GitHubCrawler(
+            proxies=[proxy.address], output_dir=temp_dir, base_url=mock_github.url, validate_proxies=True
+        )
+        async with crawler:
+            assert crawler.proxy_manager is None
+            assert crawler._reprobe_task is not None
+
+            proxy.failure_rate = 0.0
+            await crawler._reprobe_proxies()
+
+            assert [config.url for config in crawler.proxy_manager.proxies] == [f"http://{proxy.address}"]
+            assert crawler._dead_proxies == []
+
+        assert crawler._reprobe_task is None
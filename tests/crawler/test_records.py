@@ -0,0 +1,44 @@
+from src.gitcrawler.models import RepositoryInfo, SearchResult
+from src.gitcrawler.records import RepositoryRecord, RepositorySummary, ResultRecord
+
+
+def test_repository_record__parallel_arrays():
+    record = RepositoryRecord.from_stats("user", {"Python": 75.5, "Shell": 24.5})
+
+    assert record.languages == ("Python", "Shell")
+    assert list(record.percentages) == [75.5, 24.5]
+    assert record.language_stats == {"Python": 75.5, "Shell": 24.5}
+    assert record.to_model() == RepositoryInfo(owner="user", language_stats={"Python": 75.5, "Shell": 24.5})
+
+
+def test_repository_record__language_names_interned():
+    first = RepositoryRecord.from_stats("a", {"".join(["Py", "thon"]): 1.0})
+    second = RepositoryRecord.from_stats("b", {"".join(["Pyt", "hon"]): 2.0})
+
+    assert first.languages[0] is second.languages[0]
+
+
+def test_repository_record__from_info():
+    info = RepositoryInfo(owner="user", language_stats={"Go": 100.0})
+    record = RepositoryRecord.from_info(info)
+
+    assert record == RepositoryRecord("user", ("Go",), [100.0])
+    assert RepositoryRecord.from_info(record) is record
+
+
+def test_result_record__model_round_trip(test_url_github_repo):
+    model = SearchResult(url=test_url_github_repo, extra={"owner": "user", "language_stats": {"Python": 100.0}})
+
+    record = ResultRecord.from_model(model)
+
+    assert record.extra == model.extra
+    assert record.to_model() == model
+    assert ResultRecord(test_url_github_repo).to_model() == SearchResult(url=test_url_github_repo)
+
+
+def test_result_record__repository_summary(test_url_github_repo):
+    record = ResultRecord(test_url_github_repo, RepositorySummary("user", "".join(["Py", "thon"]), 42))
+    other = RepositorySummary("other", "".join(["Pyt", "hon"]))
+
+    assert record.repository.language is other.language
+    assert record.extra == {"owner": "user", "language": "Python", "stars": 42, "updated_at": None}
@@ -0,0 +1,67 @@
+from pathlib import Path
+
+import pytest
+from src.gitcrawler.seen import BloomSeenSet, ExactSeenSet, create_seen_set, load_seen_set
+
+
+def test_exact_seen_set__add_and_grow():
+    seen = ExactSeenSet(capacity=4)
+    urls = [f"https://github.com/owner{i}/repo{i}" for i in range(5000)]
+
+    assert all(seen.add(url) for url in urls)
+    assert not any(seen.add(url) for url in urls)
+    assert len(seen) == 5000
+    assert urls[1234] in seen
+    assert "https://github.com/owner/unknown" not in seen
+
+
+def test_exact_seen_set__save_and_load(temp_dir):
+    path = Path(temp_dir) / "seen.bin"
+    seen = ExactSeenSet()
+    seen.add("https://github.com/user/repo")
+    seen.save(path)
+
+    loaded = load_seen_set(path)
+
+    assert isinstance(loaded, ExactSeenSet)
+    assert len(loaded) == 1
+    assert "https://github.com/user/repo" in loaded
+    assert loaded.add("https://github.com/user/repo2")
+
+
+def test_bloom_seen_set__false_positive_rate():
+    seen = BloomSeenSet(capacity=1000, error_rate=0.01)
+    added = [f"https://github.com/owner{i}/repo" for i in range(1000)]
+    for url in added:
+        seen.add(url)
+
+    false_positives = sum(f"https://github.com/other{i}/repo" in seen for i in range(10000))
+
+    assert all(url in seen for url in added)
+    assert false_positives < 300
+    assert not seen.add(added[0])
+
+
+def test_bloom_seen_set__save_and_load(temp_dir):
+    path = Path(temp_dir) / "seen.bin"
+    seen = BloomSeenSet(capacity=100, error_rate=0.001)
+    seen.add("https://github.com/user/repo")
+    seen.save(path)
+
+    loaded = create_seen_set("exact", path)
+
+    assert isinstance(loaded, BloomSeenSet)
+    assert (loaded.capacity, loaded.error_rate, len(loaded)) == (100, 0.001, 1)
+    assert "https://github.com/user/repo" in loaded
+
+
+def test_create_seen_set__errors(temp_dir):
+    path = Path(temp_dir) / "seen.bin"
+    path.write_bytes(b"garbage")
+
+    with pytest.raises(ValueError, match="Unsupported seen-URL set"):
+        create_seen_set("hyperloglog")
+    with pytest.raises(ValueError, match="error rate"):
+        BloomSeenSet(error_rate=1.5)
+    with pytest.raises(ValueError, match="Not a seen-URL set file"):
+        load_seen_set(path)
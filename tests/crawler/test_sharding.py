@@ -0,0 +1,61 @@
+import csv
+import json
+from pathlib import Path
+
+import pytest
+from src.gitcrawler.sharding import _search_configs, crawl_many_sharded, crawl_sharded, slice_proxies, split_shards
+
+
+def test_split_shards__round_robin():
+    assert split_shards(list(range(5)), 2) == [[0, 2, 4], [1, 3]]
+    assert split_shards([1], 3) == [[1]]
+    assert split_shards([], 3) == []
+
+
+def test_slice_proxies(proxy_list):
+    assert slice_proxies(proxy_list, 2) == [[proxy_list[0], proxy_list[2]], [proxy_list[1]]]
+    assert slice_proxies(proxy_list[:2], 3) == [[proxy_list[0]], [proxy_list[1]], [proxy_list[0]]]
+    assert slice_proxies([], 2) == [[], []]
+
+
+@pytest.mark.asyncio
+async def test_crawl_sharded__merges_in_order(mock_github, temp_dir):
+    config = {"keywords": ["python"], "type": "repositories", "format": "jsonl"}
+
+    results = await crawl_sharded(config, shards=2, output_dir=temp_dir, base_url=mock_github.url)
+
+    assert [result.url for result in results] == [f"{mock_github.url}owner{i}/repo{i}" for i in range(6)]
+    assert all(result.extra["language_stats"] == {"Python": 50.0, "JavaScript": 50.0} for result in results)
+    (filepath,) = Path(temp_dir).glob("repositories_python_*.jsonl")
+    assert [json.loads(line)["url"] for line in filepath.read_text().splitlines()] == [r.url for r in results]
+
+
+@pytest.mark.asyncio
+async def test_crawl_many_sharded__one_file(mock_github, temp_dir):
+    configs = [{"keywords": [keyword], "type": "repositories"} for keyword in ("python", "jwt", "rust")]
+
+    results = await crawl_many_sharded(configs, shards=2, output_dir=temp_dir, base_url=mock_github.url)
+
+    assert [len(query_results) for query_results in results] == [6, 6, 6]
+    (filepath,) = Path(temp_dir).glob("repositories_python_jwt_rust_*.csv")
+    with open(filepath, "r", encoding="utf-8") as f:
+        assert len(list(csv.DictReader(f))) == 18
+
+
+@pytest.mark.asyncio
+async def test_search_configs__failed_query_keeps_others(mock_github, temp_dir):
+    configs = [{"keywords": ["python"], "type": "repositories"}, {"keywords": ["jwt"], "type": "unknown"}]
+
+    results = await _search_configs(configs, [], mock_github.url, temp_dir)
+
+    assert [len(query_results) for query_results in results] == [6, 0]
+
+
+@pytest.mark.asyncio
+async def test_search_configs__payload_enrichment(mock_github, temp_dir):
+    configs = [{"keywords": ["python"], "type": "repositories", "enrichment": "payload"}]
+
+    ((row, *_),) = await _search_configs(configs, [], mock_github.url, temp_dir)
+
+    assert mock_github.requests == 1
+    assert row["extra"] == {"owner": "owner0", "language": "Python", "stars": 0, "updated_at": "2024-01-01"}
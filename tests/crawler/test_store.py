@@ -0,0 +1,65 @@
+import sqlite3
+
+from src.gitcrawler.models import RepositoryInfo
+from src.gitcrawler.store import RepositoryStore
+
+
+def test_repository_store__get_many(repository_store, test_url_github_repo):
+    info = RepositoryInfo(owner="user", language_stats={"Python": 90.0})
+    repository_store.put_many({test_url_github_repo: info})
+
+    found = repository_store.get_many([test_url_github_repo, test_url_github_repo + "2"])
+
+    assert found == {test_url_github_repo: info}
+
+
+def test_repository_store__stale_entries_skipped(repository_store, fake_clock, test_url_github_repo):
+    repository_store.put(test_url_github_repo, RepositoryInfo(owner="user", language_stats={}))
+    repository_store.put(test_url_github_repo + "2", RepositoryInfo(owner="user", language_stats={}), max_age=600)
+    fake_clock.now += 61
+
+    found = repository_store.get_many([test_url_github_repo, test_url_github_repo + "2"])
+
+    assert list(found) == [test_url_github_repo + "2"]
+    assert repository_store.purge_expired() == 1
+    assert len(repository_store) == 1
+
+
+def test_repository_store__put_refreshes_entry(repository_store, test_url_github_repo):
+    repository_store.put(test_url_github_repo, RepositoryInfo(owner="user", language_stats={"Python": 1.0}))
+    repository_store.put(test_url_github_repo, RepositoryInfo(owner="user", language_stats={"Go": 2.0}))
+
+    assert repository_store.get(test_url_github_repo).language_stats == {"Go": 2.0}
+    assert len(repository_store) == 1
+
+
+def test_repository_store__empty_lookup(repository_store):
+    assert repository_store.get_many([]) == {}
+
+
+def test_repository_store__get_unchanged(repository_store, fake_clock, test_url_github_repo):
+    info = RepositoryInfo(owner="user", language_stats={"Python": 90.0})
+    other_url = test_url_github_repo + "2"
+    repository_store.put_many({test_url_github_repo: info, other_url: info}, fingerprints={test_url_github_repo: "a"})
+    fake_clock.now += 3600
+
+    found = repository_store.get_unchanged({test_url_github_repo: "a", other_url: "a"})
+
+    assert found == {test_url_github_repo: info}
+    assert repository_store.get_unchanged({test_url_github_repo: "b"}) == {}
+
+
+def test_repository_store__adds_fingerprint_column(temp_dir):
+    path = f"{temp_dir}/old.sqlite3"
+    connection = sqlite3.connect(path)
+    connection.execute(
+        "CREATE TABLE repositories (url TEXT PRIMARY KEY, owner TEXT NOT NULL, language_stats TEXT NOT NULL, "
+        "fetched_at REAL NOT NULL, expires_at REAL NOT NULL)"
+    )
+    connection.close()
+
+    store = RepositoryStore(path)
+    store.put("https://github.com/user/repo", RepositoryInfo(owner="user", language_stats={}))
+
+    assert len(store) == 1
+    store.close()
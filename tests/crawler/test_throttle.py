@@ -0,0 +1,111 @@
+import asyncio
+from datetime import datetime, timezone
+from http import HTTPStatus
+
+import pytest
+from src.gitcrawler.throttle import AdaptiveLimiter, ConcurrencyController, parse_retry_after
+
+
+def test_parse_retry_after__seconds():
+    assert parse_retry_after("30") == 30.0
+
+
+def test_parse_retry_after__http_date():
+    now = datetime(2024, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+
+    assert parse_retry_after("Mon, 01 Jan 2024 00:01:00 GMT", now=lambda: now) == 60.0
+
+
+@pytest.mark.parametrize("value", [None, "", "soon", 42])
+def test_parse_retry_after__invalid(value):
+    assert parse_retry_after(value) is None
+
+
+def test_adaptive_limiter__decrease_once_per_epoch(fake_clock):
+    limiter = AdaptiveLimiter(initial=8, maximum=16, clock=fake_clock)
+    epoch = limiter.epoch
+
+    limiter.on_throttle(epoch)
+    limiter.on_throttle(epoch)
+
+    assert limiter.limit == 4
+    limiter.on_throttle(limiter.epoch)
+    assert limiter.limit == 2
+
+
+def test_adaptive_limiter__additive_increase(fake_clock):
+    limiter = AdaptiveLimiter(initial=2, maximum=3, clock=fake_clock)
+
+    for _ in range(2):
+        limiter.on_success()
+    assert limiter.limit == pytest.approx(2 + 0.5 + 1 / 2.5)
+
+    for _ in range(10):
+        limiter.on_success()
+    assert limiter.limit == 3
+
+
+def test_adaptive_limiter__retry_after_pauses(fake_clock):
+    limiter = AdaptiveLimiter(initial=4, maximum=4, clock=fake_clock)
+
+    limiter.on_throttle(limiter.epoch, retry_after=30)
+
+    assert limiter.paused_until == fake_clock.now + 30
+
+
+@pytest.mark.asyncio
+async def test_adaptive_limiter__blocks_until_release():
+    limiter = AdaptiveLimiter(initial=1, maximum=1)
+    await limiter.acquire()
+
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    limiter.release()
+    await asyncio.wait_for(waiter, timeout=1)
+    assert limiter.in_flight == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrency_controller__throttle_feedback():
+    controller = ConcurrencyController(max_in_flight=8, direct_max_in_flight=8, proxy_max_in_flight=8)
+
+    async with controller.slot("http://proxy:8080") as feedback:
+        feedback.record(HTTPStatus.TOO_MANY_REQUESTS, {"Retry-After": "5"})
+
+    proxy_lane = controller.lane("http://proxy:8080")
+    assert proxy_lane.limit == 2
+    assert proxy_lane.paused_until > 0
+    assert controller.total.limit == 2
+    assert controller.direct.limit == 4
+    assert controller.direct.paused_until == 0
+    assert controller.total.in_flight == proxy_lane.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrency_controller__paused_lane_holds_no_global_slot():
+    controller = ConcurrencyController(max_in_flight=2, direct_max_in_flight=8, proxy_max_in_flight=8)
+    async with controller.slot("http://proxy:8080") as feedback:
+        feedback.record(HTTPStatus.TOO_MANY_REQUESTS, {"Retry-After": "60"})
+
+    waiter = asyncio.create_task(controller.slot("http://proxy:8080").__aenter__())
+    await asyncio.sleep(0)
+
+    assert not waiter.done()
+    assert controller.total.in_flight == 0
+    async with controller.slot() as feedback:
+        feedback.record(HTTPStatus.OK, {})
+    waiter.cancel()
+    await asyncio.gather(waiter, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_concurrency_controller__success_feedback():
+    controller = ConcurrencyController(max_in_flight=8, direct_max_in_flight=8)
+
+    async with controller.slot() as feedback:
+        feedback.record(HTTPStatus.OK, {})
+
+    assert controller.direct.limit > 4
+    assert controller.total.limit > 4
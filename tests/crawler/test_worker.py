@@ -0,0 +1,87 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from src.gitcrawler.crawler import GitHubCrawler
+from src.gitcrawler.models import CrawlQuery, RepositoryInfo
+from src.gitcrawler.worker import CrawlWorker
+
+
+@pytest.mark.asyncio
+async def test_crawl_worker__drains_frontier(crawl_frontier, temp_dir, test_url_github_repo):
+    query = CrawlQuery(keywords=["python"], search_type="repositories", max_pages=2, output_format="csv")
+    key = crawl_frontier.add_query(query)
+    crawlers = [GitHubCrawler(output_dir=temp_dir) for _ in range(2)]
+
+    def mock_parse(html_content, search_type):
+        page = 2 if html_content.endswith("&p=2") else 1
+        return [f"{test_url_github_repo}{page}{i}" for i in range(3)]
+
+    async def mock_extract_repo_info(url):
+        await asyncio.sleep(0.01)
+        return RepositoryInfo(owner="user", language_stats={})
+
+    with (
+        patch.object(GitHubCrawler, "_fetch_page", side_effect=lambda url: url),
+        patch.object(GitHubCrawler, "_parse_search_results", side_effect=mock_parse),
+        patch.object(GitHubCrawler, "_create_session", return_value=AsyncMock()),
+        patch.object(GitHubCrawler, "_extract_repository_info", side_effect=mock_extract_repo_info) as mock_extract,
+    ):
+        workers = [
+            CrawlWorker(crawl_frontier, crawler, f"worker{number}", jobs_in_flight=2, poll_interval=0.01)
+            for number, crawler in enumerate(crawlers)
+        ]
+        await asyncio.gather(*(worker.run() for worker in workers))
+
+    results = crawl_frontier.results(key)
+    assert [result.url for result in results] == [f"{test_url_github_repo}{page}{i}" for page in "12" for i in range(3)]
+    assert mock_extract.call_count == 6
+    assert [worker.completed > 0 for worker in workers] == [True, True]
+    assert sum(worker.completed for worker in workers) == 8
+    assert crawl_frontier.counts() == {"done": 8}
+
+
+@pytest.mark.asyncio
+async def test_crawl_worker__payload_enrichment_skips_repository_jobs(crawl_frontier, mock_github, temp_dir):
+    query = CrawlQuery(
+        keywords=["python"], search_type="repositories", max_pages=1, output_format="csv", enrichment="payload"
+    )
+    key = crawl_frontier.add_query(query)
+    worker = CrawlWorker(crawl_frontier, GitHubCrawler(output_dir=temp_dir, base_url=mock_github.url), "worker1")
+
+    await worker.run()
+
+    results = crawl_frontier.results(key)
+    assert mock_github.requests == 1
+    assert worker.completed == 1
+    assert [result.url for result in results] == [f"{mock_github.url}owner{i}/repo{i}" for i in range(6)]
+    assert results[1].extra == {"owner": "owner1", "language": "JavaScript", "stars": 10, "updated_at": "2024-01-01"}
+
+
+@pytest.mark.asyncio
+async def test_crawl_worker__renews_leases_of_slow_jobs(crawl_frontier, temp_dir):
+    crawl_frontier.add_query(CrawlQuery(keywords=["python"], search_type="code", max_pages=1, output_format="csv"))
+    worker = CrawlWorker(
+        crawl_frontier,
+        GitHubCrawler(output_dir=temp_dir),
+        "worker1",
+        lease_timeout=10,
+        poll_interval=0.01,
+        renew_interval=0,
+    )
+
+    async def slow_fetch(url):
+        await asyncio.sleep(0.05)
+        return url
+
+    with (
+        patch.object(GitHubCrawler, "_fetch_page", side_effect=slow_fetch),
+        patch.object(GitHubCrawler, "_parse_search_results", return_value=[]),
+        patch.object(GitHubCrawler, "_create_session", return_value=AsyncMock()),
+        patch.object(crawl_frontier, "renew", wraps=crawl_frontier.renew) as mock_renew,
+    ):
+        await worker.run()
+
+    assert mock_renew.call_count > 0
+    assert all(call.args[0][0].kind == "search" and call.args[1] == "worker1" for call in mock_renew.call_args_list)
+    assert worker.completed == 1
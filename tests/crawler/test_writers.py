@@ -0,0 +1,118 @@
+import csv
+import json
+import sys
+from pathlib import Path
+
+import pytest
+from src.gitcrawler.models import SearchResult
+from src.gitcrawler.records import RepositorySummary
+from src.gitcrawler.writers import (
+    CsvResultWriter,
+    JsonlResultWriter,
+    ParquetResultWriter,
+    ResultWriter,
+    get_result_writer,
+)
+
+
+def test_csv_result_writer__repositories(search_results, temp_dir):
+    filepath = Path(temp_dir) / "results.csv"
+
+    with CsvResultWriter(filepath, "repositories") as writer:
+        for result in search_results:
+            writer.write(result)
+
+    assert writer.count == len(search_results)
+    with open(filepath, "r", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert rows[0]["url"] == "https://github.com/user1/repo1"
+    assert rows[0]["owner"] == ""
+    assert rows[1]["owner"] == "user2"
+
+
+def test_csv_result_writer__flushes_each_row(temp_dir, test_url_github_repo):
+    filepath = Path(temp_dir) / "results.csv"
+
+    with CsvResultWriter(filepath, "issues") as writer:
+        writer.write(SearchResult(url=test_url_github_repo))
+
+        with open(filepath, "r", encoding="utf-8") as f:
+            assert f.read().splitlines() == ["url", test_url_github_repo]
+
+
+def test_csv_result_writer__appends_without_header(temp_dir, test_url_github_repo):
+    filepath = Path(temp_dir) / "results.csv"
+
+    for _ in range(2):
+        with CsvResultWriter(filepath, "issues") as writer:
+            writer.write(SearchResult(url=test_url_github_repo))
+
+    with open(filepath, "r", encoding="utf-8") as f:
+        assert f.read().splitlines() == ["url", test_url_github_repo, test_url_github_repo]
+
+
+def test_jsonl_result_writer__keeps_language_stats_typed(temp_dir, test_url_github_repo):
+    filepath = Path(temp_dir) / "results.jsonl"
+    result = SearchResult(url=test_url_github_repo, extra={"owner": "user", "language_stats": {"Python": 98.5}})
+
+    with JsonlResultWriter(filepath, "repositories") as writer:
+        writer.write(result)
+
+    with open(filepath, "r", encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f]
+    assert rows == [{"url": test_url_github_repo, "owner": "user", "language_stats": {"Python": 98.5}}]
+
+
+def test_csv_result_writer__extra_fields(temp_dir, test_url_github_repo):
+    filepath = Path(temp_dir) / "results.csv"
+    extra = {"owner": "user", "language": "Python", "stars": 42, "updated_at": "2024-01-01"}
+
+    with CsvResultWriter(filepath, "repositories", extra_fields=RepositorySummary.fields) as writer:
+        writer.write(SearchResult(url=test_url_github_repo, extra=extra))
+
+    with open(filepath, "r", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    assert rows == [{"url": test_url_github_repo, **{field: str(value) for field, value in extra.items()}}]
+
+
+def test_parquet_result_writer__language_stats_map(temp_dir, search_results):
+    pq = pytest.importorskip("pyarrow.parquet")
+    filepath = Path(temp_dir) / "results.parquet"
+
+    with ParquetResultWriter(filepath, "repositories", row_group_size=1) as writer:
+        for result in search_results:
+            writer.write(result)
+
+    table = pq.read_table(filepath)
+    assert table.column_names == ["url", "owner", "language_stats"]
+    assert table.num_rows == len(search_results)
+    assert pq.ParquetFile(filepath).num_row_groups == len(search_results)
+    assert table.column("language_stats").to_pylist()[1] == list(search_results[1].extra["language_stats"].items())
+
+
+def test_parquet_result_writer__no_append(temp_dir):
+    with pytest.raises(ValueError, match="does not support appending"):
+        ParquetResultWriter(Path(temp_dir) / "results.parquet", "repositories", append=True)
+
+
+def test_parquet_result_writer__missing_pyarrow(monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+
+    with pytest.raises(ImportError, match="requires pyarrow"):
+        get_result_writer("parquet").check_dependencies()
+
+
+def test_result_writer__incomplete_subclass_not_instantiable(temp_dir):
+    class OpenOnlyWriter(ResultWriter):
+        def open(self) -> "OpenOnlyWriter":
+            return self
+
+    with pytest.raises(TypeError, match="abstract"):
+        OpenOnlyWriter(Path(temp_dir) / "results.txt", "repositories")
+
+
+def test_get_result_writer__unsupported_format():
+    assert get_result_writer("JSONL") is JsonlResultWriter
+
+    with pytest.raises(ValueError, match="Unsupported output format"):
+        get_result_writer("xml")
@@ -0,0 +1,20 @@
+from pytest import fixture
+from src.gitcrawler.cache import ResponseCache
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@fixture
+def fake_clock() -> FakeClock:
+    return FakeClock()
+
+
+@fixture
+def response_cache(temp_dir, fake_clock) -> ResponseCache:
+    return ResponseCache(cache_dir=temp_dir, ttl=60, max_bytes=1024, clock=fake_clock)
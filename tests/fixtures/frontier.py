@@ -0,0 +1,9 @@
+from pytest import fixture
+from src.gitcrawler.frontier import CrawlFrontier
+
+
+@fixture
+def crawl_frontier(temp_dir, fake_clock):
+    frontier = CrawlFrontier(path=f"{temp_dir}/frontier.sqlite3", max_attempts=2, clock=fake_clock)
+    yield frontier
+    frontier.close()
@@ -0,0 +1,16 @@
+import pytest_asyncio
+from benchmarks.mock_github import MockGitHub, MockProxy
+
+
+@pytest_asyncio.fixture
+async def mock_github():
+    """Local mock GitHub with 6 repositories on the first search page."""
+    async with MockGitHub(results_per_page=6, languages=2, repository_kb=1) as github:
+        yield github
+
+
+@pytest_asyncio.fixture
+async def mock_proxy():
+    """Local forward proxy in front of mock GitHub."""
+    async with MockProxy() as proxy:
+        yield proxy
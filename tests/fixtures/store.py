@@ -0,0 +1,9 @@
+from pytest import fixture
+from src.gitcrawler.store import RepositoryStore
+
+
+@fixture
+def repository_store(temp_dir, fake_clock):
+    store = RepositoryStore(path=f"{temp_dir}/repositories.sqlite3", max_age=60, clock=fake_clock)
+    yield store
+    store.close()